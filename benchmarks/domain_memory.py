@@ -0,0 +1,147 @@
+"""Memory and construction time of hydrated domain books, slotted vs. not.
+
+Hydrates ``--books`` DomainBook objects with ``--reviews`` DomainReview objects
+each, once with the slotted domain classes and once with dict-based twins of the
+same classes (same fields, same validation), and reports the memory held by the
+objects and the construction time of each run.
+
+Usage:
+    python -m benchmarks.domain_memory --books 100000 --reviews 3
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from src.domain.book.book import DomainBook
+from src.domain.book.value_objects.book_description import BookDescription
+from src.domain.book.value_objects.book_pagecount import BookPageCount
+from src.domain.book.value_objects.book_subtitle import BookSubtitle
+from src.domain.book.value_objects.book_title import BookTitle
+from src.domain.review.review import DomainReview
+from src.domain.review.value_objects.rating_value import RatingVO
+from src.domain.review.value_objects.review_text import ReviewTextVO
+
+# Generated by @dataclass (or by slots=True) and regenerated for the twin.
+GENERATED_ATTRIBUTES = {
+    '__slots__',
+    '__dict__',
+    '__weakref__',
+    '__init__',
+    '__repr__',
+    '__eq__',
+    '__hash__',
+    '__setattr__',
+    '__delattr__',
+    '__getstate__',
+    '__setstate__',
+    '__match_args__',
+    '__dataclass_fields__',
+    '__dataclass_params__',
+}
+
+SLOTTED = SimpleNamespace(
+    book=DomainBook,
+    title=BookTitle,
+    subtitle=BookSubtitle,
+    description=BookDescription,
+    page_count=BookPageCount,
+    review=DomainReview,
+    rating=RatingVO,
+    review_text=ReviewTextVO,
+)
+
+
+def without_slots(cls: type) -> type:
+    """Rebuild a slotted dataclass as a regular dataclass with a __dict__."""
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in GENERATED_ATTRIBUTES and name not in cls.__slots__
+    }
+    namespace.update({f.name: f for f in dataclasses.fields(cls)})
+    params = cls.__dataclass_params__  # type: ignore[attr-defined]
+    return dataclasses.dataclass(frozen=params.frozen, eq=params.eq)(
+        type(cls.__name__, (), namespace)
+    )
+
+
+DICT_BASED = SimpleNamespace(
+    **{name: without_slots(cls) for name, cls in vars(SLOTTED).items()}
+)
+
+
+def hydrate(classes: SimpleNamespace, books: int, reviews: int) -> list:
+    created_at = datetime.now(timezone.utc) - timedelta(days=1)
+    hydrated = []
+    for i in range(books):
+        book_id = uuid.uuid4()
+        hydrated.append(
+            classes.book(
+                id=book_id,
+                title=classes.title(f'Title {i}'),
+                subtitle=classes.subtitle(f'Subtitle {i}'),
+                description=classes.description('A description of the book.'),
+                authors=['First Author', 'Second Author'],
+                publisher='Publisher',
+                published_date=date(2001, 1, 1),
+                page_count=classes.page_count(320),
+                language='en',
+                created_at=created_at,
+                updated_at=created_at,
+                cover_image_url='https://covers.example/cover.jpg',
+                google_book_id=f'vol-{i}',
+                reviews=[
+                    classes.review(
+                        id=uuid.uuid4(),
+                        rating=classes.rating(4),
+                        review_text=classes.review_text('Worth reading.'),
+                        book_id=book_id,
+                        user_id=uuid.uuid4(),
+                        created_at=created_at,
+                        updated_at=created_at,
+                    )
+                    for _ in range(reviews)
+                ],
+            )
+        )
+    return hydrated
+
+
+def measure(label: str, classes: SimpleNamespace, books: int, reviews: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    hydrated = hydrate(classes, books, reviews)
+    elapsed = time.perf_counter() - started
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # tracemalloc slows allocation down; time a second, untraced run.
+    del hydrated
+    gc.collect()
+    started = time.perf_counter()
+    hydrated = hydrate(classes, books, reviews)
+    untraced = time.perf_counter() - started
+    del hydrated
+
+    print(
+        f'{label:<10} memory {held / 2**20:8.1f} MiB '
+        f'({held / books:6.0f} B/book)  '
+        f'construction {untraced:6.2f}s (traced {elapsed:.2f}s)'
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--books', type=int, default=100_000)
+    parser.add_argument('--reviews', type=int, default=3)
+    args = parser.parse_args()
+
+    measure('dict', DICT_BASED, args.books, args.reviews)
+    measure('slots', SLOTTED, args.books, args.reviews)
@@ -0,0 +1,68 @@
+"""Throughput and tail latency of GoogleBooksHttpAdapter against the fake server.
+
+Start benchmarks/fake_google_books_server.py first, then:
+
+    python -m benchmarks.external_client_load --requests 2000 --concurrency 64
+    python -m benchmarks.external_client_load --hedge-after 0.2
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.application.ports.out.external_book_service_port import (
+    ExternalBookServiceError,
+)
+from src.infrastructure.external.google_books_adapter import GoogleBooksHttpAdapter
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    adapter = GoogleBooksHttpAdapter(
+        base_url=args.base_url,
+        max_concurrency=args.concurrency,
+        hedge_after=args.hedge_after,
+    )
+    latencies: list[float] = []
+    errors = 0
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(i)
+
+    async def worker() -> None:
+        nonlocal errors
+        while not queue.empty():
+            i = queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                await adapter.get_book_details_by_external_id(f'vol-{i}')
+            except ExternalBookServiceError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    await adapter.aclose()
+
+    print(f'requests:    {args.requests} in {elapsed:.2f}s')
+    print(f'throughput:  {args.requests / elapsed:.1f} req/s')
+    print(f'errors:      {errors}')
+    print(f'mean:        {statistics.mean(latencies) * 1000:.1f} ms')
+    for pct in (0.5, 0.95, 0.99):
+        print(f'p{int(pct * 100):<10} {percentile(latencies, pct) * 1000:.1f} ms')
+    print(f'circuit:     {adapter.circuit_breaker.state.value}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--base-url', default='http://127.0.0.1:8099')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--hedge-after', type=float, default=None)
+    asyncio.run(run(parser.parse_args()))
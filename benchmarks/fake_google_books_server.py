@@ -0,0 +1,74 @@
+"""Local stand-in for the Google Books volumes API.
+
+Latency and failures are configured through environment variables:
+
+    FAKE_LATENCY_MS         base latency of every response (default 50)
+    FAKE_LATENCY_JITTER_MS  uniform random latency added on top (default 0)
+    FAKE_SLOW_RATE          fraction of requests that take 10x the base latency
+    FAKE_ERROR_RATE         fraction of requests answered with a 503 (default 0)
+
+Usage:
+    FAKE_LATENCY_MS=80 FAKE_ERROR_RATE=0.05 \\
+        uvicorn benchmarks.fake_google_books_server:app --port 8099
+"""
+
+import asyncio
+import os
+import random
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+
+LATENCY_MS = float(os.getenv('FAKE_LATENCY_MS', '50'))
+LATENCY_JITTER_MS = float(os.getenv('FAKE_LATENCY_JITTER_MS', '0'))
+SLOW_RATE = float(os.getenv('FAKE_SLOW_RATE', '0'))
+ERROR_RATE = float(os.getenv('FAKE_ERROR_RATE', '0'))
+
+app = FastAPI()
+
+
+def _volume(volume_id: str) -> dict:
+    return {
+        'id': volume_id,
+        'volumeInfo': {
+            'title': f'Book {volume_id}',
+            'authors': ['Fake Author'],
+            'publisher': 'Fake Press',
+            'publishedDate': '2001-05-17',
+            'description': 'A book served by the fake Google Books server.',
+            'industryIdentifiers': [
+                {'type': 'ISBN_13', 'identifier': '9780306406157'},
+                {'type': 'ISBN_10', 'identifier': '0306406152'},
+            ],
+            'pageCount': 320,
+            'language': 'en',
+            'imageLinks': {'thumbnail': f'http://books.example/{volume_id}.jpg'},
+        },
+    }
+
+
+async def _simulate() -> Response | None:
+    latency = LATENCY_MS + random.uniform(0, LATENCY_JITTER_MS)
+    if random.random() < SLOW_RATE:
+        latency *= 10
+    await asyncio.sleep(latency / 1000)
+    if random.random() < ERROR_RATE:
+        return JSONResponse({'error': 'backend error'}, status_code=503)
+    return None
+
+
+@app.get('/volumes')
+async def search_volumes(q: str, startIndex: int = 0, maxResults: int = 10):
+    if error := await _simulate():
+        return error
+    items = [_volume(f'{q}-{i}') for i in range(startIndex, startIndex + maxResults)]
+    return {'kind': 'books#volumes', 'totalItems': 1000, 'items': items}
+
+
+@app.get('/volumes/{volume_id}')
+async def get_volume(volume_id: str):
+    if error := await _simulate():
+        return error
+    if volume_id.startswith('missing'):
+        return JSONResponse({'error': 'not found'}, status_code=404)
+    return _volume(volume_id)
@@ -0,0 +1,116 @@
+"""Time the mapping of external search items to domain books.
+
+Compares the hand-rolled, memoized date parser with ``strptime`` (the previous
+parser), and the batch mapper with mapping one item at a time (one clock read
+per item).
+
+Usage:
+    python -m benchmarks.map_external_books --items 10000
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime
+from typing import Optional
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    ExternalImageLinksDTO,
+    ExternalVolumeInfoDTO,
+)
+from src.application.services.external_book_mapper import (
+    map_external_book,
+    map_external_books,
+    parse_google_published_date,
+)
+
+PUBLISHERS = ['Penguin', 'HarperCollins', 'Vintage', 'Tor', 'Orbit', None]
+LANGUAGES = ['en', 'es', 'fr', 'de']
+
+
+def make_items(count: int) -> list[ExternalBookItemDTO]:
+    rng = random.Random(42)
+    items = []
+    for i in range(count):
+        year = rng.randint(1950, 2024)
+        published_date = rng.choice(
+            [f'{year}', f'{year}-{rng.randint(1, 12):02d}', f'{year}-06-15']
+        )
+        items.append(
+            ExternalBookItemDTO(
+                id=f'vol-{i}',
+                volumeInfo=ExternalVolumeInfoDTO(
+                    title=f'Title {i}',
+                    authors=['Author'],
+                    publisher=rng.choice(PUBLISHERS),
+                    publishedDate=published_date,
+                    pageCount=rng.randint(50, 900),
+                    language=rng.choice(LANGUAGES),
+                    imageLinks=ExternalImageLinksDTO(
+                        thumbnail=f'https://covers.example/{i}.jpg'
+                    ),
+                ),
+            )
+        )
+    return items
+
+
+def strptime_published_date(published_date_str: Optional[str]) -> Optional[date]:
+    if not published_date_str:
+        return None
+    try:
+        if len(published_date_str) == 10:
+            return datetime.strptime(published_date_str, '%Y-%m-%d').date()
+        if len(published_date_str) == 7:
+            return datetime.strptime(published_date_str, '%Y-%m').date()
+        if len(published_date_str) == 4:
+            return datetime.strptime(published_date_str, '%Y').date()
+        return None
+    except ValueError:
+        return None
+
+
+def timed(label: str, func, repeat: int) -> None:
+    best = min(_elapsed(func) for _ in range(repeat))
+    print(f'{label:<28} {best * 1000:8.1f} ms')
+
+
+def _elapsed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    dates = [item.volumeInfo.publishedDate for item in items]
+
+    def parse_cold() -> None:
+        parse_google_published_date.cache_clear()
+        for value in dates:
+            parse_google_published_date(value)
+
+    timed(
+        'dates: strptime',
+        lambda: [strptime_published_date(d) for d in dates],
+        args.repeat,
+    )
+    timed('dates: hand-rolled, cold', parse_cold, args.repeat)
+    timed(
+        'dates: hand-rolled, warm',
+        lambda: [parse_google_published_date(d) for d in dates],
+        args.repeat,
+    )
+    timed(
+        'books: per item',
+        lambda: [map_external_book(item) for item in items],
+        args.repeat,
+    )
+    timed('books: batch', lambda: map_external_books(items), args.repeat)
+    print(f'items: {args.items}, distinct dates: {len(set(dates))}')
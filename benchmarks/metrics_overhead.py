@@ -0,0 +1,63 @@
+"""Per-request cost of the metrics recorded by the HTTP middleware.
+
+Times what the middleware adds to every request (in-flight gauge, route
+label, latency histogram) and checks it against a fixed budget. Exits with
+status 1 when the budget is exceeded.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 200000
+"""
+
+import argparse
+import sys
+import time
+
+from starlette.routing import Route
+
+from src.monitoring.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT, route_label
+
+BUDGET_MICROSECONDS = 10.0
+ROUTES = ['/api/0.2.1/books/', '/api/0.2.1/books/{book_uid}', '/api/0.2.1/tags/']
+STATUSES = ['200', '200', '200', '304', '404']
+
+
+class FakeRequest:
+    def __init__(self, path: str):
+        self.method = 'GET'
+        self.scope = {'route': Route(path, endpoint=lambda request: None)}
+
+
+def record(request: FakeRequest, status: str) -> None:
+    start = time.perf_counter()
+    REQUESTS_IN_FLIGHT.inc()
+    REQUESTS_IN_FLIGHT.dec()
+    REQUEST_LATENCY.labels(request.method, route_label(request), status).observe(
+        time.perf_counter() - start
+    )
+
+
+def baseline(request: FakeRequest, status: str) -> None:
+    start = time.perf_counter()
+    time.perf_counter() - start
+
+
+def per_request(func, requests: list, count: int) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        func(requests[i % len(requests)], STATUSES[i % len(STATUSES)])
+    return (time.perf_counter() - started) / count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200_000)
+    args = parser.parse_args()
+
+    requests = [FakeRequest(path) for path in ROUTES]
+    base = min(per_request(baseline, requests, args.requests) for _ in range(3))
+    metrics = min(per_request(record, requests, args.requests) for _ in range(3))
+    overhead = (metrics - base) * 1_000_000
+    print(
+        f'metrics overhead: {overhead:.2f} us/request (budget {BUDGET_MICROSECONDS} us)'
+    )
+    sys.exit(0 if overhead <= BUDGET_MICROSECONDS else 1)
@@ -0,0 +1,111 @@
+"""Replay a search query log against the external search cache.
+
+Each line of the log is a query, optionally followed by tab separated
+``page_index`` and ``page_size`` columns. The replay runs every line through
+``BookApplicationService.search_book_via_external_service`` backed by an
+in-memory cache and a fake external service, and compares the number of
+external calls with what the previous raw-query cache key would have made.
+
+Usage:
+    python -m benchmarks.replay_search_cache path/to/queries.tsv
+"""
+
+import asyncio
+import sys
+from typing import Any, Optional
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    ExternalBookSearchResponseDTO,
+    ExternalVolumeInfoDTO,
+)
+from src.application.ports.out.cache_port import CachePort
+from src.application.ports.out.external_book_service_port import ExternalBookServicePort
+from src.application.services.book_service import BookApplicationService
+
+
+class InMemoryCache(CachePort):
+    def __init__(self):
+        self._data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._data.get(key)
+
+    async def set(
+        self, key: str, value: Any, expire_seconds: Optional[int] = None
+    ) -> None:
+        self._data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        return self._data.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        return key in self._data
+
+
+class CountingExternalService(ExternalBookServicePort):
+    def __init__(self):
+        self.calls = 0
+
+    async def search_books(
+        self,
+        query: str,
+        filters: Optional[dict[str, Any]] = None,
+        page_index: int = 0,
+        page_size: int = 10,
+    ) -> ExternalBookSearchResponseDTO:
+        self.calls += 1
+        start = page_index * page_size
+        return ExternalBookSearchResponseDTO(
+            totalItems=1000,
+            items=[
+                ExternalBookItemDTO(
+                    id=f'{query}-{i}', volumeInfo=ExternalVolumeInfoDTO(title=query)
+                )
+                for i in range(start, start + page_size)
+            ],
+        )
+
+    async def get_book_details_by_external_id(
+        self, external_id: str
+    ) -> Optional[ExternalBookItemDTO]:
+        return None
+
+
+def read_query_log(path: str) -> list[tuple[str, int, int]]:
+    entries = []
+    with open(path, encoding='utf-8') as log_file:
+        for line in log_file:
+            columns = line.rstrip('\n').split('\t')
+            if not columns[0].strip():
+                continue
+            page_index = int(columns[1]) if len(columns) > 1 else 0
+            page_size = int(columns[2]) if len(columns) > 2 else 10
+            entries.append((columns[0], page_index, page_size))
+    return entries
+
+
+async def replay(entries: list[tuple[str, int, int]]) -> None:
+    external_service = CountingExternalService()
+    service = BookApplicationService(
+        book_repository=None,  # type: ignore[arg-type]
+        external_book_service=external_service,
+        favorite_repository=None,  # type: ignore[arg-type]
+        review_repository=None,  # type: ignore[arg-type]
+        cache=InMemoryCache(),
+    )
+
+    for query, page_index, page_size in entries:
+        await service.search_book_via_external_service(query, page_index, page_size)
+
+    raw_key_calls = len(set(entries))
+    print(f'requests:              {len(entries)}')
+    print(f'external calls (raw):  {raw_key_calls}')
+    print(f'external calls (now):  {external_service.calls}')
+    print(f'cache stats:           {service.search_cache_stats.as_dict()}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    asyncio.run(replay(read_query_log(sys.argv[1])))
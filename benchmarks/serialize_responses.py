@@ -0,0 +1,122 @@
+"""Serialization throughput of the list and detail endpoints.
+
+For each endpoint schema, encodes the same ORM rows three ways:
+
+- fastapi:   validate against the response model, dump to python, json.dumps
+             (what a ``response_model`` route with JSONResponse does)
+- validated: the precompiled TypeAdapter of ResponseSerializer
+- trusted:   ResponseSerializer fast path, orjson without validation
+
+Usage:
+    python -m benchmarks.serialize_responses --rows 5000
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import date, datetime
+
+from pydantic import TypeAdapter
+
+from src.books.schemas import Book as BookSchema
+from src.books.schemas import BookDetailModel
+from src.db.models import Book, Review, Tag
+from src.reviews.schemas import ReviewModel
+from src.tags.schemas import TagModel
+from src.utils.serialization import ResponseSerializer
+
+
+def make_reviews(book_uid: uuid.UUID, count: int) -> list[Review]:
+    now = datetime.now()
+    return [
+        Review(
+            uid=uuid.uuid4(),
+            rating=4,
+            review_text='A very good read, would recommend.',
+            user_uid=uuid.uuid4(),
+            book_uid=book_uid,
+            created_at=now,
+            updated_at=now,
+        )
+        for _ in range(count)
+    ]
+
+
+def make_tags(count: int) -> list[Tag]:
+    now = datetime.now()
+    return [
+        Tag(uid=uuid.uuid4(), name=f'tag-{i}', created_at=now) for i in range(count)
+    ]
+
+
+def make_books(count: int, with_relations: bool) -> list[Book]:
+    now = datetime.now()
+    tags = make_tags(3)
+    books = []
+    for i in range(count):
+        book = Book(
+            uid=uuid.uuid4(),
+            title=f'Title {i}',
+            author='Some Author',
+            publisher='Publisher',
+            published_date=date(2001, 1, 1),
+            page_count=320,
+            language='en',
+            created_at=now,
+            updated_at=now,
+        )
+        if with_relations:
+            # Set on the instance dict so no session is needed to read them.
+            book.__dict__['reviews'] = make_reviews(book.uid, 3)
+            book.__dict__['tags'] = tags
+        books.append(book)
+    return books
+
+
+def fastapi_like(schema, rows) -> bytes:
+    adapter = TypeAdapter(list[schema])
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return json.dumps(adapter.dump_python(validated, mode='json')).encode()
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench(label: str, schema, rows, repeat: int) -> None:
+    serializer = ResponseSerializer(schema)
+    trusted = json.loads(serializer.dump_many(rows))
+    validated = json.loads(serializer.dump_many(rows, trusted=False))
+    assert trusted == validated, f'{label}: trusted output differs'
+
+    print(f'{label} ({len(rows)} rows)')
+    for name, func in (
+        ('fastapi', lambda: fastapi_like(schema, rows)),
+        ('validated', lambda: serializer.dump_many(rows, trusted=False)),
+        ('trusted', lambda: serializer.dump_many(rows)),
+    ):
+        elapsed = best_of(func, repeat)
+        print(
+            f'  {name:<10} {elapsed * 1000:8.1f} ms  {len(rows) / elapsed:10.0f} rows/s'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    books = make_books(args.rows, with_relations=True)
+    bench('GET /books/', BookSchema, books, args.repeat)
+    bench('GET /books/{uid}', BookDetailModel, books, args.repeat)
+    bench(
+        'GET /reviews/', ReviewModel, make_reviews(uuid.uuid4(), args.rows), args.repeat
+    )
+    bench('GET /tags/', TagModel, make_tags(args.rows), args.repeat)
@@ -11,6 +11,9 @@ from src.config import Config
 from src.db.models import (
     Book,  # noqa: F401
     BookTag,  # noqa: F401
+    ExternalBookMirror,  # noqa: F401
+    Favorite,  # noqa: F401
+    OutboxMessage,  # noqa: F401
     Review,  # noqa: F401
     Tag,  # noqa: F401
     User,  # noqa: F401
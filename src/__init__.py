@@ -1,28 +1,49 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from src.auth.routes import auth_router
 from src.books.routes import book_router
-from src.db.main import init_db
+from src.db.redis import cache_client
+from src.monitoring.routes import metrics_router
 from src.reviews.routes import review_router
+from src.tags.registry import tag_registry
 from src.tags.routes import tags_router
 
 from .errors import register_all_errors
-from .middleware import register_middleware
+from .middleware import access_log_listener, register_middleware
 
 
 @asynccontextmanager
 async def life_span(app: FastAPI):
     print('starting app')
-    await init_db()
+    access_log_listener.start()
+    # The schema is owned by the Alembic migrations, it is not created here.
+    await tag_registry.load()
+    tag_invalidation = asyncio.create_task(tag_registry.listen(cache_client))
+    # Not wired yet: BookApplicationService (and so CacheWarmupService and
+    # RedisPopularityTracker) is not composed by this app, no route uses it and
+    # there is no CachePort adapter to build it with. Whoever composes it should
+    # set app.state.cache_warmup to a CacheWarmupService to replay the hottest
+    # search and detail keys before the worker starts serving requests.
+    cache_warmup = getattr(app.state, 'cache_warmup', None)
+    if cache_warmup is not None:
+        print(f'cache warm-up: {await cache_warmup.warm_up()}')
     yield
+    tag_invalidation.cancel()
+    with suppress(asyncio.CancelledError):
+        await tag_invalidation
     print('stopping app')
+    access_log_listener.stop()
 
 
 version = '0.2.1'
 
-app = FastAPI(version=version)
+app = FastAPI(
+    version=version, lifespan=life_span, default_response_class=ORJSONResponse
+)
 
 register_all_errors(app)
 register_middleware(app)
@@ -31,3 +52,4 @@ app.include_router(book_router, prefix=f'/api/{version}/books', tags=['books'])
 app.include_router(auth_router, prefix=f'/api/{version}/auth', tags=['auth'])
 app.include_router(review_router, prefix=f'/api/{version}/reviews', tags=['reviews'])
 app.include_router(tags_router, prefix=f'/api/{version}/tags', tags=['tags'])
+app.include_router(metrics_router, prefix=f'/api/{version}/metrics', tags=['metrics'])
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, HttpUrl
@@ -41,3 +42,8 @@ class ExternalBookItemDTO(BaseModel):
 class ExternalBookSearchResponseDTO(BaseModel):
     totalItems: int
     items: list[ExternalBookItemDTO] = Field(default_factory=list)
+
+
+class MirroredExternalBookDTO(BaseModel):
+    item: ExternalBookItemDTO
+    fetched_at: datetime
@@ -27,16 +27,45 @@ class BookRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_books_by_google_ids(
+        self, google_book_ids: list[str]
+    ) -> list[DomainBook]:
+        """
+        Retrieve every book whose Google ID is in the given list, in one query.
+
+        :param google_book_ids: The Google IDs of the books to retrieve.
+        :return: The DomainBook instances found, in no particular order.
+        """
+        pass
+
     @abstractmethod
     async def save_book(self, book: DomainBook) -> DomainBook:
         """
         Save a book to the repository.
 
+        A new book whose Google ID or ISBN is already registered is not
+        inserted; the stored instance is returned instead.
+
         :param book: An instance of DomainBook to save.
         :return: The saved instance of DomainBook.
         """
         pass
 
+    @abstractmethod
+    async def save_books(self, books: list[DomainBook]) -> dict[str, DomainBook]:
+        """
+        Insert several new books in a single statement.
+
+        Books whose Google ID or ISBN is already registered are not inserted
+        again; the stored instance is returned in their place.
+
+        :param books: The DomainBook instances to insert.
+        :return: The saved DomainBook instances, keyed by the Google ID of the
+            given book (a stored book may hold another Google ID).
+        """
+        pass
+
     # TODO: Evaluate that there is no review associated with the book
     @abstractmethod
     async def delete_book(self, book_id: uuid.UUID) -> None:
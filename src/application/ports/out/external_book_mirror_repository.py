@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    MirroredExternalBookDTO,
+)
+
+
+class ExternalBookMirrorRepository(ABC):
+    """
+    Port for the local copy of external book payloads (Google Books volumes).
+    """
+
+    @abstractmethod
+    async def get_mirrored_book(
+        self, google_book_id: str
+    ) -> Optional[MirroredExternalBookDTO]:
+        """
+        Retrieve the mirrored payload of a book.
+
+        :param google_book_id: The Google ID of the book.
+        :return: The payload with its fetch time, or None if it is not mirrored.
+        """
+        pass
+
+    @abstractmethod
+    async def save_mirrored_books(
+        self, items: list[ExternalBookItemDTO], fetched_at: datetime
+    ) -> None:
+        """
+        Insert or replace the mirrored payload of several books in one statement.
+
+        :param items: The external payloads to store.
+        :param fetched_at: When the payloads were fetched from the external service.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_mirrored_books(self, google_book_ids: list[str]) -> None:
+        """
+        Remove books from the mirror, e.g. when the external service dropped them.
+
+        :param google_book_ids: The Google IDs of the books to remove.
+        """
+        pass
+
+    @abstractmethod
+    async def list_stale_google_ids(
+        self, fetched_before: datetime, limit: int = 100
+    ) -> list[str]:
+        """
+        List mirrored books fetched before the given time, oldest first.
+
+        :param fetched_before: Entries fetched before this time are stale.
+        :param limit: The maximum number of IDs to return.
+        :return: The Google IDs of the stale entries.
+        """
+        pass
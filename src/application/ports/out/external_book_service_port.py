@@ -7,6 +7,18 @@ from src.application.dtos.external_book_dtos import (
 )
 
 
+class ExternalBookServiceError(Exception):
+    """Base class for errors raised by external book service adapters."""
+
+    pass
+
+
+class ExternalBookServiceUnavailable(ExternalBookServiceError):
+    """External book service is failing or its circuit breaker is open"""
+
+    pass
+
+
 class ExternalBookServicePort(ABC):
     """Interface for external book service communication."""
 
@@ -26,6 +38,7 @@ class ExternalBookServicePort(ABC):
         :param page_index: The index of the page to retrieve (for pagination).
         :param page_size: The number of items per page.
         :return: A response object containing the search results.
+        :raises ExternalBookServiceUnavailable: If the service cannot be reached.
         """
         pass
 
@@ -37,6 +50,8 @@ class ExternalBookServicePort(ABC):
         Retrieve book details by external ID.
 
         :param external_id: The external ID of the book.
-        :return: A response object containing the book details.
+        :return: A response object containing the book details, or None if
+            the external service does not know the ID.
+        :raises ExternalBookServiceUnavailable: If the service cannot be reached.
         """
         pass
@@ -11,8 +11,8 @@ class FavoriteRepository(ABC):
     """
 
     @abstractmethod
-    async def add_favorite(self, user_id: uuid.UUID, book_id: uuid.UUID) -> None:
-        """Marks a book as a favorite for a user."""
+    async def add_favorite(self, user_id: uuid.UUID, book_id: uuid.UUID) -> bool:
+        """Marks a book as a favorite for a user. Returns True if it was not yet."""
         pass
 
     @abstractmethod
@@ -27,6 +27,16 @@ class FavoriteRepository(ABC):
         """Checks if a specific book is favorited by a specific user."""
         pass
 
+    @abstractmethod
+    async def get_favorited_book_ids(
+        self, user_id: uuid.UUID, book_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """
+        Checks many books at once. Returns the subset of book_ids that the user
+        has favorited.
+        """
+        pass
+
     @abstractmethod
     async def list_favorite_books_by_user(
         self, user_id: uuid.UUID, limit: int = 10, offset: int = 0
@@ -36,8 +46,7 @@ class FavoriteRepository(ABC):
         """
         pass
 
-    # TODO: check for this method later
-    # @abstractmethod
-    # async def count_favorites_for_book(self, book_id: uuid.UUID) -> int:
-    #    """Counts how many users have favorited a specific book."""
-    #    pass
+    @abstractmethod
+    async def count_favorites_for_book(self, book_id: uuid.UUID) -> int:
+        """Counts how many users have favorited a specific book."""
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+
+class PopularityTracker(ABC):
+    """
+    Port counting how often search pages and book details are requested, so the
+    hottest ones can be replayed into the caches after a deploy.
+    """
+
+    @abstractmethod
+    async def record_search(
+        self, canonical_query: str, page_index: int, page_size: int
+    ) -> None:
+        """Count one request for a search page."""
+        pass
+
+    @abstractmethod
+    async def record_book_detail(self, google_book_id: str) -> None:
+        """Count one request for the details of a book."""
+        pass
+
+    @abstractmethod
+    async def top_searches(self, limit: int) -> list[tuple[str, int, int]]:
+        """
+        Return the most requested search pages, most requested first.
+
+        :return: (canonical_query, page_index, page_size) tuples.
+        """
+        pass
+
+    @abstractmethod
+    async def top_book_details(self, limit: int) -> list[str]:
+        """Return the Google IDs of the most requested books, most requested first."""
+        pass
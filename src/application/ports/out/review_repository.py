@@ -83,3 +83,16 @@ class ReviewRepository(ABC):
         :return: An instance of DomainReview if found, otherwise None.
         """
         pass
+
+    @abstractmethod
+    async def get_reviewed_book_ids(
+        self, user_id: uuid.UUID, book_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """
+        Check many books at once for a review by a specific user.
+
+        :param user_id: The ID of the user.
+        :param book_ids: The IDs of the books to check.
+        :return: The subset of book_ids the user has reviewed.
+        """
+        pass
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.application.dtos.external_book_dtos import ExternalBookItemDTO
+from src.application.ports.out.external_book_mirror_repository import (
+    ExternalBookMirrorRepository,
+)
+from src.application.ports.out.external_book_service_port import (
+    ExternalBookServiceError,
+    ExternalBookServicePort,
+)
+
+MIRROR_MAX_AGE = timedelta(days=7)
+MIRROR_REFRESH_BATCH_SIZE = 100
+MIRROR_REFRESH_REQUESTS_PER_SECOND = 5.0
+MIRROR_REFRESH_CONCURRENCY = 4
+
+logger = logging.getLogger(__name__)
+
+
+class _RateLimiter:
+    """Spaces out call starts so that at most ``rate`` calls start per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class BookMirrorRefreshService:
+    def __init__(
+        self,
+        mirror_repository: ExternalBookMirrorRepository,
+        external_book_service: ExternalBookServicePort,
+    ):
+        self._mirror_repository = mirror_repository
+        self._external_book_service = external_book_service
+
+    async def refresh_stale_books(
+        self,
+        max_age: timedelta = MIRROR_MAX_AGE,
+        batch_size: int = MIRROR_REFRESH_BATCH_SIZE,
+        requests_per_second: float = MIRROR_REFRESH_REQUESTS_PER_SECOND,
+        max_concurrency: int = MIRROR_REFRESH_CONCURRENCY,
+    ) -> dict:
+        """
+        Re-fetch one batch of mirrored books older than ``max_age``.
+
+        External calls are rate limited and bounded in concurrency. Refreshed
+        payloads are saved in one statement; books the external service no longer
+        knows are removed from the mirror; books that failed to refresh stay stale
+        and are retried by the next run.
+
+        :return: Counts of refreshed, removed and failed books.
+        """
+        stale_ids = await self._mirror_repository.list_stale_google_ids(
+            fetched_before=datetime.now(timezone.utc) - max_age, limit=batch_size
+        )
+
+        limiter = _RateLimiter(requests_per_second)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        refreshed: list[ExternalBookItemDTO] = []
+        removed: list[str] = []
+        failed = 0
+
+        async def refresh(google_book_id: str) -> None:
+            nonlocal failed
+            async with semaphore:
+                await limiter.wait()
+                try:
+                    item = await self._external_book_service.get_book_details_by_external_id(
+                        google_book_id
+                    )
+                except ExternalBookServiceError:
+                    failed += 1
+                    return
+                except Exception:
+                    # E.g. a payload that no longer validates: only costs its row.
+                    logger.exception(
+                        'Could not refresh mirrored book %s', google_book_id
+                    )
+                    failed += 1
+                    return
+            if item is None:
+                removed.append(google_book_id)
+            else:
+                refreshed.append(item)
+
+        await asyncio.gather(*(refresh(google_book_id) for google_book_id in stale_ids))
+
+        await self._mirror_repository.save_mirrored_books(
+            refreshed, fetched_at=datetime.now(timezone.utc)
+        )
+        await self._mirror_repository.delete_mirrored_books(removed)
+
+        return {'refreshed': len(refreshed), 'removed': len(removed), 'failed': failed}
@@ -1,6 +1,9 @@
+import asyncio
+import logging
 import uuid
-from datetime import date, datetime, timezone
-from typing import Optional
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
 
 from src.application.dtos.external_book_dtos import (
     ExternalBookItemDTO,
@@ -8,14 +11,54 @@ from src.application.dtos.external_book_dtos import (
 )
 from src.application.ports.out.book_repository import BookRepository
 from src.application.ports.out.cache_port import CachePort
+from src.application.ports.out.external_book_mirror_repository import (
+    ExternalBookMirrorRepository,
+)
 from src.application.ports.out.external_book_service_port import ExternalBookServicePort
 from src.application.ports.out.favorite_repository import FavoriteRepository
+from src.application.ports.out.popularity_tracker import PopularityTracker
 from src.application.ports.out.review_repository import ReviewRepository
+from src.application.services.cache_stats import CacheStats
+from src.application.services.external_book_mapper import (
+    map_external_book,
+    map_external_books,
+)
+from src.application.services.search_query import (
+    build_search_cache_key,
+    canonicalize_search_query,
+)
 from src.domain.book.book import DomainBook
-from src.domain.book.value_objects.book_description import BookDescription
-from src.domain.book.value_objects.book_pagecount import BookPageCount
-from src.domain.book.value_objects.book_subtitle import BookSubtitle
-from src.domain.book.value_objects.book_title import BookTitle
+from src.domain.book.value_objects.book_isbn import IsbnVO
+from src.domain.review.review import DomainReview
+from src.utils.ttl_cache import TTLCache
+
+SEARCH_CACHE_TTL_SECONDS = 3600
+# Page sizes a smaller search page can be sliced out of, largest first.
+# 40 is the maximum page size accepted by Google Books.
+SERVEABLE_SEARCH_PAGE_SIZES = (40, 20)
+BOOK_DETAIL_DEADLINE_SECONDS = 5.0
+BULK_REGISTRATION_CONCURRENCY = 8
+NEGATIVE_CACHE_TTL_SECONDS = 300
+NEGATIVE_CACHE_MAX_ENTRIES = 10_000
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def _task_group() -> AsyncIterator[asyncio.TaskGroup]:
+    """
+    TaskGroup that re-raises the first failure instead of an ExceptionGroup.
+
+    The other failures are logged, they would be lost otherwise.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            yield tg
+    except ExceptionGroup as eg:
+        first, *others = eg.exceptions
+        for other in others:
+            logger.error('Concurrent task failed along with %r', first, exc_info=other)
+        raise first
 
 
 class BookApplicationService:
@@ -26,86 +69,36 @@ class BookApplicationService:
         favorite_repository: FavoriteRepository,
         review_repository: ReviewRepository,
         cache: CachePort,
+        mirror_repository: Optional[ExternalBookMirrorRepository] = None,
+        popularity_tracker: Optional[PopularityTracker] = None,
+        detail_deadline_seconds: float = BOOK_DETAIL_DEADLINE_SECONDS,
     ):
         self._book_repository = book_repository
         self._external_book_service = external_book_service
         self._favorite_repository = favorite_repository
         self._review_repository = review_repository
         self._cache = cache
-
-    async def _parse_google_published_date(
-        self, published_date_str: Optional[str]
-    ) -> Optional[date]:
-        """
-        Parse the Google Books API published date string into a date object.
-
-        :param published_date_str: The published date string from the Google Books API.
-        :return: A date object representing the published date, or None if parsing fails.
-        """
-        if not published_date_str:
-            return None
-
-        try:
-            if len(published_date_str) == 10:
-                return datetime.strptime(published_date_str, '%Y-%m-%d').date()
-            if len(published_date_str) == 7:
-                dt = datetime.strptime(published_date_str, '%Y-%m').date()
-                return date(dt.year, dt.month, 1)
-            if len(published_date_str) == 4:
-                dt = datetime.strptime(published_date_str, '%Y').date()
-                return date(dt.year, 1, 1)
-            return None
-        except ValueError:
-            return None
-
-    async def _map_external_to_domain_book_for_registration(
-        self, external_data: ExternalBookItemDTO
-    ) -> DomainBook:
-        """
-        Map external book data to a domain book object for registration.
-
-        :param external_data: The external book data.
-        :return: A DomainBook object.
-        """
-        parsed_published_date = await self._parse_google_published_date(
-            external_data.volumeInfo.publishedDate
-        )
-
-        db_published_date = (
-            parsed_published_date if parsed_published_date else date(1, 1, 1)
-        )
-
-        current_time = datetime.now(timezone.utc)
-
-        # TODO: implement ISBN parsing logic
-        return DomainBook(
-            id=uuid.uuid4(),
-            title=BookTitle(external_data.volumeInfo.title),
-            subtitle=BookSubtitle(external_data.volumeInfo.subtitle or '-'),
-            description=BookDescription(external_data.volumeInfo.description or '-'),
-            authors=external_data.volumeInfo.authors,
-            publisher=external_data.volumeInfo.publisher or 'N/A',
-            published_date=db_published_date,
-            page_count=BookPageCount(external_data.volumeInfo.pageCount or 0),
-            language=external_data.volumeInfo.language or 'N/A',
-            created_at=current_time,
-            updated_at=current_time,
-            cover_image_url=(
-                str(external_data.volumeInfo.imageLinks.thumbnail)
-                if external_data.volumeInfo.imageLinks
-                and external_data.volumeInfo.imageLinks.thumbnail
-                else 'default_cover_image_url'
-            ),
-            google_book_id=external_data.id,
+        self._mirror_repository = mirror_repository
+        self._popularity_tracker = popularity_tracker
+        self._detail_deadline_seconds = detail_deadline_seconds
+        self._search_cache_stats = CacheStats('external_search')
+        # Unknown IDs and zero-result queries, kept apart from the positive cache.
+        self._negative_cache: TTLCache[tuple[str, str], bool] = TTLCache(
+            NEGATIVE_CACHE_MAX_ENTRIES, NEGATIVE_CACHE_TTL_SECONDS
         )
+        self._negative_cache_stats = CacheStats('external_negative')
 
     async def register_book_from_google_if_not_exists(
-        self, google_book_id: str
+        self,
+        google_book_id: str,
+        external_data: Optional[ExternalBookItemDTO] = None,
     ) -> DomainBook:
         """
         Register a book from Google Books API if it doesn't already exist in the database.
 
         :param google_book_id: The Google Books ID of the book to register.
+        :param external_data: The external details of the book, if the caller has
+            already fetched them. Avoids a second call to the external service.
         :return: The registered DomainBook object.
         """
         existing_book = await self._book_repository.get_book_by_google_id(
@@ -114,75 +107,366 @@ class BookApplicationService:
         if existing_book:
             return existing_book
 
-        external_data = (
-            await self._external_book_service.get_book_details_by_external_id(
-                google_book_id
-            )
-        )
+        if external_data is None:
+            external_data = await self._fetch_external_details(google_book_id)
         if not external_data:
             raise ValueError(
                 f'Book with Google ID {google_book_id} not found in external service.'
             )
 
-        domain_book_to_register = (
-            await self._map_external_to_domain_book_for_registration(external_data)
+        return await self._book_repository.save_book(map_external_book(external_data))
+
+    async def _register_external_items(
+        self,
+        external_items: list[ExternalBookItemDTO],
+        existing_books: dict[str, DomainBook],
+    ) -> dict[str, DomainBook]:
+        """
+        Map the external items that are not registered yet and insert them in one
+        statement. Items that do not satisfy the domain invariants are skipped.
+
+        :return: The registered books keyed by Google ID, existing ones included.
+        """
+        new_items: dict[str, ExternalBookItemDTO] = {}
+        for external_item in external_items:
+            if external_item.id not in existing_books:
+                new_items.setdefault(external_item.id, external_item)
+        books_to_register = map_external_books(new_items.values())
+
+        registered_books = dict(existing_books)
+        if books_to_register:
+            registered_books.update(
+                await self._book_repository.save_books(books_to_register)
+            )
+        return registered_books
+
+    async def register_books_from_google_if_not_exist(
+        self,
+        google_book_ids: list[str],
+        max_concurrency: int = BULK_REGISTRATION_CONCURRENCY,
+    ) -> list[DomainBook]:
+        """
+        Register many books from Google Books API in one round of I/O.
+
+        Already registered books are found with a single query, only the missing
+        ones are fetched from the external service (at most ``max_concurrency`` at
+        a time) and they are all inserted in a single statement.
+
+        :param google_book_ids: The Google Books IDs of the books to register.
+        :param max_concurrency: Maximum number of concurrent external fetches.
+        :return: The registered books, in the order of the given IDs. IDs unknown
+            to the external service are left out.
+        """
+        unique_ids = list(dict.fromkeys(google_book_ids))
+        existing_books = {
+            book.google_book_id: book
+            for book in await self._book_repository.get_books_by_google_ids(unique_ids)
+        }
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        fetched_items: list[ExternalBookItemDTO] = []
+
+        async def fetch(google_book_id: str) -> Optional[ExternalBookItemDTO]:
+            async with semaphore:
+                return await self._fetch_external_details(google_book_id, fetched_items)
+
+        async with _task_group() as tg:
+            fetch_tasks = [
+                tg.create_task(fetch(google_book_id))
+                for google_book_id in unique_ids
+                if google_book_id not in existing_books
+            ]
+
+        external_items = [task.result() for task in fetch_tasks]
+        if fetched_items and self._mirror_repository is not None:
+            await self._mirror_repository.save_mirrored_books(
+                fetched_items, fetched_at=datetime.now(timezone.utc)
+            )
+        registered_books = await self._register_external_items(
+            [item for item in external_items if item is not None], existing_books
+        )
+        return [
+            registered_books[google_book_id]
+            for google_book_id in unique_ids
+            if google_book_id in registered_books
+        ]
+
+    async def register_search_results(
+        self, search_response: ExternalBookSearchResponseDTO
+    ) -> list[DomainBook]:
+        """
+        Register every book of an external search page into the local catalogue.
+
+        The search items already carry the volume information, so no detail fetch
+        is needed: one lookup query and one insert statement.
+
+        :param search_response: A page returned by the external search.
+        :return: The registered books, in the order of the page.
+        """
+        google_book_ids = [item.id for item in search_response.items]
+        existing_books = {
+            book.google_book_id: book
+            for book in await self._book_repository.get_books_by_google_ids(
+                google_book_ids
+            )
+        }
+        registered_books = await self._register_external_items(
+            search_response.items, existing_books
         )
+        return [
+            registered_books[google_book_id]
+            for google_book_id in dict.fromkeys(google_book_ids)
+            if google_book_id in registered_books
+        ]
+
+    async def get_book_by_isbn(self, isbn: str) -> Optional[DomainBook]:
+        """
+        Resolve an ISBN, e.g. from a barcode scan, to a registered book.
 
-        return await self._book_repository.save_book(domain_book_to_register)
+        The local catalogue is checked first with one index lookup. Only unknown
+        ISBNs go to the external search, whose matching result is registered.
+
+        :param isbn: An ISBN-10 or ISBN-13, hyphens and spaces allowed.
+        :return: The registered book, or None if no book has this ISBN.
+        :raises BookDomainException: If the value is not a valid ISBN.
+        """
+        isbn13 = IsbnVO(isbn).to_isbn13()
+        local_book = await self._book_repository.get_book_by_isbn(isbn13)
+        if local_book is not None:
+            return local_book
+
+        search_response = await self.search_book_via_external_service(
+            f'isbn:{isbn13.value}', record_popularity=False
+        )
+        for book in await self.register_search_results(search_response):
+            if book.isbn13 == isbn13:
+                return book
+        return None
+
+    async def _get_cached_search_page(
+        self, canonical_query: str, page_index: int, page_size: int
+    ) -> Optional[ExternalBookSearchResponseDTO]:
+        """
+        Look up a search page in the cache, either stored under its own key or
+        sliced out of a cached larger page that fully contains it.
+
+        :return: The cached page, or None on a miss.
+        """
+        cached_response = await self._cache.get(
+            build_search_cache_key(canonical_query, page_index, page_size)
+        )
+        if cached_response:
+            self._search_cache_stats.record_hit()
+            return ExternalBookSearchResponseDTO.model_validate(cached_response)
+
+        start = page_index * page_size
+        end = start + page_size
+        for larger_size in SERVEABLE_SEARCH_PAGE_SIZES:
+            if larger_size <= page_size:
+                continue
+            larger_index = start // larger_size
+            larger_start = larger_index * larger_size
+            if end > larger_start + larger_size:
+                continue
+
+            cached_response = await self._cache.get(
+                build_search_cache_key(canonical_query, larger_index, larger_size)
+            )
+            if not cached_response:
+                continue
+
+            larger_page = ExternalBookSearchResponseDTO.model_validate(cached_response)
+            self._search_cache_stats.record_derived_hit()
+            return ExternalBookSearchResponseDTO(
+                totalItems=larger_page.totalItems,
+                items=larger_page.items[start - larger_start : end - larger_start],
+            )
+
+        self._search_cache_stats.record_miss()
+        return None
 
     async def search_book_via_external_service(
-        self, query: str, page_index: int = 0, page_size: int = 10
+        self,
+        query: str,
+        page_index: int = 0,
+        page_size: int = 10,
+        *,
+        record_popularity: bool = True,
     ) -> ExternalBookSearchResponseDTO:
-        """Busca libros usando el servicio externo, aplicando caché."""
-        cache_key = f'external_search:q={query}:idx={page_index}:size={page_size}'
-        cached_response = await self._cache.get(cache_key)
-        if cached_response:
-            # We assume that we saved the complete DTO in cache and Pydantic can reconstruct it
-            # Si guardaste un dict, necesitas: ExternalBookSearchResponseDTO.model_validate(cached_response)
-            if isinstance(
-                cached_response, ExternalBookSearchResponseDTO
-            ):  # O dict y validas
-                return cached_response
-            elif isinstance(cached_response, dict):
-                return ExternalBookSearchResponseDTO.model_validate(cached_response)
+        """
+        Search books through the external service, using the cache.
+
+        :param record_popularity: Count the request for cache warm-up. Disabled
+            when the warm-up itself replays the search.
+        """
+        canonical_query = canonicalize_search_query(query)
+        if record_popularity and self._popularity_tracker is not None:
+            try:
+                await self._popularity_tracker.record_search(
+                    canonical_query, page_index, page_size
+                )
+            except Exception:
+                logger.exception('Could not record search popularity')
+
+        cached_page = await self._get_cached_search_page(
+            canonical_query, page_index, page_size
+        )
+        if cached_page is not None:
+            return cached_page
+
+        if self._negative_cache.get(('search', canonical_query)):
+            self._negative_cache_stats.record_hit()
+            return ExternalBookSearchResponseDTO(totalItems=0, items=[])
+        self._negative_cache_stats.record_miss()
 
         response = await self._external_book_service.search_books(
-            query=query, page_index=page_index, page_size=page_size
+            query=canonical_query, page_index=page_index, page_size=page_size
         )
+        if response.totalItems == 0:
+            # No results means every page of the query is empty.
+            self._negative_cache.set(('search', canonical_query), True)
+            return response
 
-        await self._cache.set(cache_key, response.model_dump(), expire_seconds=3600)
+        await self._cache.set(
+            build_search_cache_key(canonical_query, page_index, page_size),
+            response.model_dump(),
+            expire_seconds=SEARCH_CACHE_TTL_SECONDS,
+        )
         return response
 
-    async def get_book_details_for_display(
+    @property
+    def search_cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the external search cache."""
+        return self._search_cache_stats
+
+    @property
+    def negative_cache_stats(self) -> CacheStats:
+        """
+        Counters of the not-found cache. Every hit is an external call avoided.
+        """
+        return self._negative_cache_stats
+
+    async def _fetch_external_details(
         self,
         google_book_id: str,
-        request_user_id: Optional[uuid.UUID] = None,
-    ) -> dict:
-        external_data_dto = (
+        fetched_items: Optional[list[ExternalBookItemDTO]] = None,
+    ) -> Optional[ExternalBookItemDTO]:
+        """
+        Fetch book details, from the local mirror when available, otherwise from
+        the external service. IDs the external service does not know are
+        remembered for a short time so repeated probes do not reach it again.
+
+        :param fetched_items: If given, payloads fetched from the external service
+            are appended to it instead of being saved to the mirror one by one,
+            so batch callers can save them all at once.
+        """
+        if self._negative_cache.get(('detail', google_book_id)):
+            self._negative_cache_stats.record_hit()
+            return None
+
+        if self._mirror_repository is not None:
+            mirrored_book = await self._mirror_repository.get_mirrored_book(
+                google_book_id
+            )
+            if mirrored_book is not None:
+                return mirrored_book.item
+
+        self._negative_cache_stats.record_miss()
+        external_data = (
             await self._external_book_service.get_book_details_by_external_id(
                 google_book_id
             )
         )
-        if not external_data_dto:
-            raise ValueError(
-                f'Book with Google ID {google_book_id} not found in external service.'
+        if external_data is None:
+            self._negative_cache.set(('detail', google_book_id), True)
+        elif fetched_items is not None:
+            fetched_items.append(external_data)
+        elif self._mirror_repository is not None:
+            await self._mirror_repository.save_mirrored_books(
+                [external_data], fetched_at=datetime.now(timezone.utc)
             )
+        return external_data
 
-        internal_book_domain = await self.register_book_from_google_if_not_exists(
-            google_book_id
-        )
+    async def prefetch_book_details(self, google_book_id: str) -> bool:
+        """
+        Load the details of a book into the mirror and detail caches.
+
+        :return: True if the external service knows the book.
+        """
+        return await self._fetch_external_details(google_book_id) is not None
 
-        local_reviews_domain = await self._review_repository.get_reviews_by_book_id(
-            internal_book_domain.id
+    async def _record_book_detail(self, google_book_id: str) -> None:
+        # Popularity only feeds the cache warm-up, it must not fail the request.
+        if self._popularity_tracker is None:
+            return
+        try:
+            await self._popularity_tracker.record_book_detail(google_book_id)
+        except Exception:
+            logger.exception('Could not record book detail popularity')
+
+    async def _is_favorited(
+        self, request_user_id: Optional[uuid.UUID], book_id: uuid.UUID
+    ) -> bool:
+        if not request_user_id:
+            return False
+        return await self._favorite_repository.is_book_favorited_by_user(
+            user_id=request_user_id, book_id=book_id
         )
 
-        is_favorite_by_user = False
-        if request_user_id:
-            is_favorite_by_user = (
-                await self._favorite_repository.is_book_favorited_by_user(
-                    user_id=request_user_id, book_id=internal_book_domain.id
+    async def get_book_details_for_display(
+        self,
+        google_book_id: str,
+        request_user_id: Optional[uuid.UUID] = None,
+    ) -> dict:
+        """
+        Assemble the detail view of a book.
+
+        Independent port calls run concurrently, so the latency is that of the
+        slowest dependency rather than their sum, and the whole assembly is bounded
+        by the service's detail deadline. Repository adapters must therefore not
+        share a database session between concurrent calls.
+
+        :raises TimeoutError: If the detail deadline is exceeded.
+        """
+        async with asyncio.timeout(self._detail_deadline_seconds):
+            async with _task_group() as tg:
+                external_task = tg.create_task(
+                    self._fetch_external_details(google_book_id)
                 )
-            )
+                existing_book_task = tg.create_task(
+                    self._book_repository.get_book_by_google_id(google_book_id)
+                )
+                tg.create_task(self._record_book_detail(google_book_id))
+
+            external_data_dto = external_task.result()
+            if not external_data_dto:
+                raise ValueError(
+                    f'Book with Google ID {google_book_id} not found in external service.'
+                )
+
+            internal_book_domain = existing_book_task.result()
+            new_book_id = None
+            if internal_book_domain is None:
+                new_book = map_external_book(external_data_dto)
+                new_book_id = new_book.id
+                # Another volume of the same edition may already be registered.
+                internal_book_domain = await self._book_repository.save_book(new_book)
+            if internal_book_domain.id == new_book_id:
+                # A book registered just now has no reviews or favorites yet.
+                local_reviews_domain: list[DomainReview] = []
+                is_favorite_by_user = False
+            else:
+                async with _task_group() as tg:
+                    reviews_task = tg.create_task(
+                        self._review_repository.get_reviews_by_book_id(
+                            internal_book_domain.id
+                        )
+                    )
+                    favorite_task = tg.create_task(
+                        self._is_favorited(request_user_id, internal_book_domain.id)
+                    )
+                local_reviews_domain = reviews_task.result()
+                is_favorite_by_user = favorite_task.result()
 
         reviews_for_response = [
             {
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    """
+    In-process hit/miss counters for one cache use case.
+
+    ``derived_hits`` counts lookups answered from a different entry than the
+    requested one (e.g. a smaller page sliced out of a larger cached page).
+    """
+
+    name: str
+    hits: int = 0
+    derived_hits: int = 0
+    misses: int = 0
+
+    def record_hit(self) -> None:
+        self.hits += 1
+
+    def record_derived_hit(self) -> None:
+        self.derived_hits += 1
+
+    def record_miss(self) -> None:
+        self.misses += 1
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.derived_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache, 0.0 when there were none."""
+        if not self.lookups:
+            return 0.0
+        return (self.hits + self.derived_hits) / self.lookups
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.derived_hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'hits': self.hits,
+            'derived_hits': self.derived_hits,
+            'misses': self.misses,
+            'lookups': self.lookups,
+            'hit_ratio': self.hit_ratio,
+        }
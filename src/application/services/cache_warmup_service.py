@@ -0,0 +1,86 @@
+import asyncio
+import time
+from functools import partial
+from typing import Awaitable, Callable
+
+from src.application.ports.out.popularity_tracker import PopularityTracker
+from src.application.services.book_service import BookApplicationService
+
+WARMUP_TIME_BUDGET_SECONDS = 20.0
+WARMUP_CONCURRENCY = 8
+WARMUP_TOP_BOOK_DETAILS = 200
+WARMUP_TOP_SEARCHES = 100
+
+
+class CacheWarmupService:
+    def __init__(
+        self,
+        book_service: BookApplicationService,
+        popularity_tracker: PopularityTracker,
+    ):
+        self._book_service = book_service
+        self._popularity_tracker = popularity_tracker
+
+    async def warm_up(
+        self,
+        time_budget_seconds: float = WARMUP_TIME_BUDGET_SECONDS,
+        max_concurrency: int = WARMUP_CONCURRENCY,
+        top_book_details: int = WARMUP_TOP_BOOK_DETAILS,
+        top_searches: int = WARMUP_TOP_SEARCHES,
+    ) -> dict:
+        """
+        Replay the most requested book details and search pages into the caches.
+
+        Hottest keys go first. Warm-up is best effort: a failing key is counted
+        and skipped, and whatever is still running when the time budget runs out
+        is cancelled so the worker can start serving.
+
+        :return: Counts of warmed and failed keys, whether the budget ran out and
+            the elapsed time.
+        """
+        started_at = time.monotonic()
+        report = {'book_details': 0, 'searches': 0, 'failed': 0, 'timed_out': False}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def warm(kind: str, load: Callable[[], Awaitable[object]]) -> None:
+            async with semaphore:
+                try:
+                    await load()
+                except Exception:
+                    report['failed'] += 1
+                else:
+                    report[kind] += 1
+
+        try:
+            async with asyncio.timeout(time_budget_seconds):
+                book_ids, searches = await asyncio.gather(
+                    self._popularity_tracker.top_book_details(top_book_details),
+                    self._popularity_tracker.top_searches(top_searches),
+                )
+                await asyncio.gather(
+                    *(
+                        warm(
+                            'book_details',
+                            partial(
+                                self._book_service.prefetch_book_details, google_book_id
+                            ),
+                        )
+                        for google_book_id in book_ids
+                    ),
+                    *(
+                        warm(
+                            'searches',
+                            partial(
+                                self._book_service.search_book_via_external_service,
+                                *search,
+                                record_popularity=False,
+                            ),
+                        )
+                        for search in searches
+                    ),
+                )
+        except TimeoutError:
+            report['timed_out'] = True
+
+        report['elapsed_seconds'] = round(time.monotonic() - started_at, 3)
+        return report
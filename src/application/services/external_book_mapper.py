@@ -0,0 +1,148 @@
+import functools
+import sys
+import uuid
+from datetime import date, datetime, timezone
+from typing import Iterable, Optional
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    ExternalIndustryIdentifierDTO,
+)
+from src.domain.book.book import DomainBook
+from src.domain.book.value_objects.book_description import BookDescription
+from src.domain.book.value_objects.book_isbn import IsbnVO
+from src.domain.book.value_objects.book_pagecount import BookPageCount
+from src.domain.book.value_objects.book_subtitle import BookSubtitle
+from src.domain.book.value_objects.book_title import BookTitle
+from src.domain.exceptions.book_exceptions import BookDomainException
+
+UNKNOWN_PUBLISHED_DATE = date(1, 1, 1)
+DEFAULT_COVER_IMAGE_URL = 'default_cover_image_url'
+PUBLISHED_DATE_CACHE_SIZE = 4096
+
+
+def _is_ascii_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+@functools.lru_cache(maxsize=PUBLISHED_DATE_CACHE_SIZE)
+def parse_google_published_date(published_date_str: Optional[str]) -> Optional[date]:
+    """
+    Parse the Google Books API published date string into a date object.
+
+    Accepts ``YYYY-MM-DD``, ``YYYY-MM`` (first of the month) and ``YYYY`` (first
+    of January). Results are memoized, search pages repeat the same dates a lot.
+
+    :param published_date_str: The published date string from the Google Books API.
+    :return: A date object representing the published date, or None if parsing fails.
+    """
+    if not published_date_str:
+        return None
+
+    value = published_date_str
+    try:
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            if _is_ascii_digits(value[:4] + value[5:7] + value[8:]):
+                return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+        elif len(value) == 7 and value[4] == '-':
+            if _is_ascii_digits(value[:4] + value[5:]):
+                return date(int(value[:4]), int(value[5:]), 1)
+        elif len(value) == 4 and _is_ascii_digits(value):
+            return date(int(value), 1, 1)
+    except ValueError:
+        pass
+    return None
+
+
+def parse_industry_identifiers(
+    identifiers: list[ExternalIndustryIdentifierDTO],
+) -> tuple[Optional[IsbnVO], Optional[IsbnVO]]:
+    """
+    Extract the ISBN-10 and ISBN-13 of a volume. Invalid ISBNs are ignored and a
+    missing form is derived from the other one when possible.
+
+    :param identifiers: The ``industryIdentifiers`` of the volume.
+    :return: The ISBN-10 and the ISBN-13, each possibly None.
+    """
+    isbns: dict[int, IsbnVO] = {}
+    for identifier in identifiers:
+        if identifier.type not in ('ISBN_10', 'ISBN_13'):
+            continue
+        try:
+            isbn = IsbnVO(identifier.identifier)
+        except BookDomainException:
+            continue
+        isbns.setdefault(len(isbn.value), isbn)
+
+    isbn10, isbn13 = isbns.get(10), isbns.get(13)
+    if isbn13 is None and isbn10 is not None:
+        isbn13 = isbn10.to_isbn13()
+    if isbn10 is None and isbn13 is not None:
+        isbn10 = isbn13.to_isbn10()
+    return isbn10, isbn13
+
+
+def map_external_book(
+    external_data: ExternalBookItemDTO, current_time: Optional[datetime] = None
+) -> DomainBook:
+    """
+    Map external book data to a domain book object for registration.
+
+    :param external_data: The external book data.
+    :param current_time: The creation time of the book, now by default.
+    :return: A DomainBook object.
+    :raises BookDomainException: If the data does not satisfy the book invariants.
+    """
+    if current_time is None:
+        current_time = datetime.now(timezone.utc)
+    volume_info = external_data.volumeInfo
+    image_links = volume_info.imageLinks
+    isbn10, isbn13 = parse_industry_identifiers(volume_info.industryIdentifiers)
+
+    return DomainBook(
+        id=uuid.uuid4(),
+        title=BookTitle(volume_info.title),
+        subtitle=BookSubtitle(volume_info.subtitle or '-'),
+        description=BookDescription(volume_info.description or '-'),
+        authors=volume_info.authors,
+        publisher=sys.intern(volume_info.publisher or 'N/A'),
+        published_date=(
+            parse_google_published_date(volume_info.publishedDate)
+            or UNKNOWN_PUBLISHED_DATE
+        ),
+        page_count=BookPageCount(volume_info.pageCount or 0),
+        language=sys.intern(volume_info.language or 'N/A'),
+        created_at=current_time,
+        updated_at=current_time,
+        cover_image_url=(
+            str(image_links.thumbnail)
+            if image_links and image_links.thumbnail
+            else DEFAULT_COVER_IMAGE_URL
+        ),
+        google_book_id=external_data.id,
+        isbn10=isbn10,
+        isbn13=isbn13,
+    )
+
+
+def map_external_books(
+    external_items: Iterable[ExternalBookItemDTO],
+) -> list[DomainBook]:
+    """
+    Map a whole page of external items to domain books.
+
+    Every book of the page shares one creation time, and publisher and language
+    strings are interned so that books of the same page share them. Items that
+    do not satisfy the domain invariants are skipped.
+
+    :param external_items: The external items, e.g. the items of a search page.
+    :return: The mapped books, in the order of the items.
+    """
+    current_time = datetime.now(timezone.utc)
+    books: list[DomainBook] = []
+    for external_item in external_items:
+        try:
+            books.append(map_external_book(external_item, current_time))
+        except BookDomainException:
+            continue
+    return books
@@ -0,0 +1,60 @@
+import re
+import unicodedata
+
+SEARCH_CACHE_KEY_VERSION = 'v1'
+
+# Google Books search operators, see
+# https://developers.google.com/books/docs/v1/using#PerformingSearch
+SEARCH_OPERATORS = frozenset(
+    {'intitle', 'inauthor', 'inpublisher', 'subject', 'isbn', 'lccn', 'oclc'}
+)
+
+_TOKEN_RE = re.compile(r'(?:[^\s":]+:)?"[^"]*"?|\S+')
+_OPERATOR_RE = re.compile(r'^([^\s":]+):(.+)$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_text(value: str) -> str:
+    value = unicodedata.normalize('NFKC', value).casefold()
+    return _WHITESPACE_RE.sub(' ', value).strip()
+
+
+def canonicalize_search_query(query: str) -> str:
+    """
+    Build the canonical form of a free-text search query.
+
+    Case, Unicode composition and whitespace are normalized. Free-text terms keep
+    their relative order, while operator terms (e.g. ``inauthor:herbert``) are
+    moved after them and sorted, since Google Books does not depend on their order.
+
+    :param query: The raw search query string.
+    :return: The canonical query string.
+    """
+    free_terms: list[str] = []
+    operator_terms: list[str] = []
+
+    for token in _TOKEN_RE.findall(_normalize_text(query)):
+        match = _OPERATOR_RE.match(token)
+        if match and match.group(1) in SEARCH_OPERATORS:
+            operator_terms.append(f'{match.group(1)}:{match.group(2)}')
+        else:
+            free_terms.append(token)
+
+    return ' '.join(free_terms + sorted(set(operator_terms)))
+
+
+def build_search_cache_key(
+    canonical_query: str, page_index: int, page_size: int
+) -> str:
+    """
+    Build the versioned cache key of a search page.
+
+    :param canonical_query: A query already passed through canonicalize_search_query.
+    :param page_index: The index of the page.
+    :param page_size: The number of items per page.
+    :return: The cache key.
+    """
+    return (
+        f'external_search:{SEARCH_CACHE_KEY_VERSION}:'
+        f'q={canonical_query}:idx={page_index}:size={page_size}'
+    )
@@ -0,0 +1,77 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+
+from src.application.ports.out.favorite_repository import FavoriteRepository
+from src.application.ports.out.review_repository import ReviewRepository
+
+
+def _to_bitset(book_ids: tuple[uuid.UUID, ...], flagged: set[uuid.UUID]) -> int:
+    bits = 0
+    for position, book_id in enumerate(book_ids):
+        if book_id in flagged:
+            bits |= 1 << position
+    return bits
+
+
+@dataclass(frozen=True)
+class ViewerState:
+    """
+    Per-viewer flags of one page of books.
+
+    Bit ``i`` of ``favorited`` and ``reviewed`` refers to ``book_ids[i]``.
+    """
+
+    book_ids: tuple[uuid.UUID, ...]
+    favorited: int = 0
+    reviewed: int = 0
+    _positions: dict[uuid.UUID, int] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self):
+        self._positions.update(
+            (book_id, position) for position, book_id in enumerate(self.book_ids)
+        )
+
+    def _is_set(self, bits: int, book_id: uuid.UUID) -> bool:
+        position = self._positions.get(book_id)
+        return position is not None and bool(bits >> position & 1)
+
+    def is_favorited(self, book_id: uuid.UUID) -> bool:
+        return self._is_set(self.favorited, book_id)
+
+    def is_reviewed(self, book_id: uuid.UUID) -> bool:
+        return self._is_set(self.reviewed, book_id)
+
+
+class ViewerStateResolver:
+    """
+    Resolves the viewer flags of a whole page of books with one favorites
+    lookup and one reviews lookup, whatever the page size.
+    """
+
+    def __init__(
+        self,
+        favorite_repository: FavoriteRepository,
+        review_repository: ReviewRepository,
+    ):
+        self._favorite_repository = favorite_repository
+        self._review_repository = review_repository
+
+    async def resolve(
+        self, user_id: uuid.UUID, book_ids: list[uuid.UUID]
+    ) -> ViewerState:
+        page = tuple(dict.fromkeys(book_ids))
+        if not page:
+            return ViewerState(book_ids=page)
+
+        favorited, reviewed = await asyncio.gather(
+            self._favorite_repository.get_favorited_book_ids(user_id, list(page)),
+            self._review_repository.get_reviewed_book_ids(user_id, list(page)),
+        )
+        return ViewerState(
+            book_ids=page,
+            favorited=_to_bitset(page, favorited),
+            reviewed=_to_bitset(page, reviewed),
+        )
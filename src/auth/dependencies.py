@@ -27,6 +27,7 @@ from src.errors import (
     InvalidToken,
     RefreshTokenRequired,
 )
+from src.monitoring.timing import allow_debug, span
 
 from .service import UserService
 from .utils import decode_token
@@ -71,21 +72,22 @@ class TokenBearer(HTTPBearer):
 
         TokenBearer subclasses must implement the verify_token_data method.
         """
-        creds = await super().__call__(request)
+        with span('auth'):
+            creds = await super().__call__(request)
 
-        if creds is None:
-            raise InvalidCredentials()
+            if creds is None:
+                raise InvalidCredentials()
 
-        token = creds.credentials
-        token_data = decode_token(token)
+            token = creds.credentials
+            token_data = decode_token(token)
 
-        if not token_data:
-            raise InvalidToken()
+            if not token_data:
+                raise InvalidToken()
 
-        if await token_in_blocklist(token_data['jti']):
-            raise InvalidToken()
+            if await token_in_blocklist(token_data['jti']):
+                raise InvalidToken()
 
-        self.verify_token_data(token_data)
+            self.verify_token_data(token_data)
 
         return token_data
 
@@ -154,7 +156,7 @@ async def get_current_userd(
     """Get current authenticated user from token.
 
     Dependency that extracts user details from the provided access token
-    and retrieves the full user object from database.
+    and retrieves the user from database, without its books and reviews.
 
     Args:
         token_details (dict): Decoded JWT token data
@@ -170,8 +172,10 @@ async def get_current_userd(
     """
     user_email = token_details['user']['email']
 
-    user = await user_service.get_user_by_email(user_email, session)
+    with span('user'):
+        user = await user_service.get_profile_by_email(user_email, session)
 
+    allow_debug(user is not None and user.role == 'admin')
     return user
 
 
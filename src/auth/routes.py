@@ -1,13 +1,17 @@
 from datetime import datetime, timedelta, timezone
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
 from fastapi.responses import JSONResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.books.schemas import Book
 from src.celery_tasks import send_email_tsk
 from src.config import Config
 from src.db.main import get_session
+from src.db.models import Book as BookRow
+from src.db.models import Review, User
 from src.db.redis import add_jti_to_blocklist
 from src.errors import (
     InvalidCredentials,
@@ -16,6 +20,10 @@ from src.errors import (
     UserAlreadyExists,
     UserNotFound,
 )
+from src.outbox import EMAIL_TOPIC, add_outbox_message
+from src.reviews.schemas import ReviewModel
+from src.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor
+from src.utils.serialization import ResponseSerializer, json_response
 from src.utils.template_manager import template_manager
 
 from .dependencies import (
@@ -28,9 +36,12 @@ from .schemas import (
     EmailModel,
     PasswordResetConfirmModel,
     PasswordResetRequestModel,
-    UserBooksModel,
+    UserBooksPageModel,
     UserCreateModel,
     UserLoginModel,
+    UserModel,
+    UserProfileModel,
+    UserReviewsPageModel,
 )
 from .service import UserService
 from .utils import (
@@ -43,6 +54,9 @@ from .utils import (
 
 auth_router = APIRouter()
 user_service = UserService()
+user_serializer = ResponseSerializer(UserModel, User)
+book_serializer = ResponseSerializer(Book, BookRow)
+review_serializer = ResponseSerializer(ReviewModel, Review)
 role_checker = RoleChecker(['admin', 'user'])
 
 
@@ -81,7 +95,7 @@ async def create_user_account(
         - Create a new user account
         - Send verification email to the user
             email with verification link to verify the account
-            based on jinja2 template
+            based on jinja2 template, through the transactional outbox
 
     """
     email = user_data.email
@@ -90,7 +104,6 @@ async def create_user_account(
     if user_exists:
         raise UserAlreadyExists()
     else:
-        new_user = await user_service.create_user(user_data, session)
         token = create_url_safe_token({'email': email})
         link = f'http://{Config.DOMAIN}/api/0.2.1/auth/verify/{token}'
 
@@ -103,7 +116,13 @@ async def create_user_account(
             'verify_account.html', verification_link=link, user_name=username
         )
 
-        send_email_tsk.delay(emails, subject, html)  # type: ignore
+        # Committed together with the new user, sent later by the outbox relay
+        add_outbox_message(
+            session,
+            EMAIL_TOPIC,
+            {'recipients': emails, 'subject': subject, 'body': html},
+        )
+        new_user = await user_service.create_user(user_data, session)
 
         return {
             'message': 'Account Created! Please check your email to verify your account',
@@ -190,14 +209,76 @@ async def get_new_access_token(
     raise InvalidToken()
 
 
-@auth_router.get('/me', response_model=UserBooksModel)
-async def get_current_user(user=Depends(get_current_userd)):
+@auth_router.get('/me', response_model=UserProfileModel)
+async def get_current_user(
+    user: Annotated[User, Depends(get_current_userd)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
     """Get current user
+    The books and reviews of the user are counted, not embedded, see
+    /me/books and /me/reviews.
+    Args:
+        user: User: Current user
+    Returns:
+        dict: Current user data with its book_count and review_count"""
+    counts = await user_service.get_content_counts(user.uid, session)
+    return json_response(orjson.dumps({**user_serializer.to_dict(user), **counts}))
+
+
+@auth_router.get('/me/books', response_model=UserBooksPageModel)
+async def get_current_user_books(
+    user: Annotated[User, Depends(get_current_userd)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+):
+    """Get the books of the current user, newest first
     Args:
-        user: dict: Current user data
+        limit: int: Size of the page
+        cursor: str: next_cursor of the previous page, None for the first page
     Returns:
-        dict: Current user data"""
-    return user
+        dict: The books of the page and the cursor of the next one, None on
+        the last page
+    Raises:
+        InvalidCursor: If the cursor is malformed"""
+    books = await user_service.get_books_page(user.uid, session, limit, cursor)
+    return json_response(
+        orjson.dumps(
+            {
+                'items': [book_serializer.to_dict(book) for book in books[:limit]],
+                'next_cursor': next_cursor(books, limit),
+            }
+        )
+    )
+
+
+@auth_router.get('/me/reviews', response_model=UserReviewsPageModel)
+async def get_current_user_reviews(
+    user: Annotated[User, Depends(get_current_userd)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+):
+    """Get the reviews of the current user, newest first
+    Args:
+        limit: int: Size of the page
+        cursor: str: next_cursor of the previous page, None for the first page
+    Returns:
+        dict: The reviews of the page and the cursor of the next one, None on
+        the last page
+    Raises:
+        InvalidCursor: If the cursor is malformed"""
+    reviews = await user_service.get_reviews_page(user.uid, session, limit, cursor)
+    return json_response(
+        orjson.dumps(
+            {
+                'items': [
+                    review_serializer.to_dict(review) for review in reviews[:limit]
+                ],
+                'next_cursor': next_cursor(reviews, limit),
+            }
+        )
+    )
 
 
 @auth_router.get('/logout')
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -38,9 +39,19 @@ class UserModel(BaseModel):
     updated_at: datetime
 
 
-class UserBooksModel(UserModel):
-    books: list[Book]
-    reviews: list[ReviewModel]
+class UserProfileModel(UserModel):
+    book_count: int
+    review_count: int
+
+
+class UserBooksPageModel(BaseModel):
+    items: list[Book]
+    next_cursor: Optional[str]
+
+
+class UserReviewsPageModel(BaseModel):
+    items: list[ReviewModel]
+    next_cursor: Optional[str]
 
 
 class UserLoginModel(BaseModel):
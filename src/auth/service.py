@@ -1,11 +1,20 @@
-from sqlmodel import select
+import uuid
+from typing import Optional
+
+from sqlalchemy.orm import raiseload
+from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db.models import User
+from src.db.models import Book, Review, User
+from src.db.redis import cache_client
+from src.utils.pagination import keyset_page
 
 from .schemas import UserCreateModel
 from .utils import generate_password_hash
 
+CONTENT_COUNTS_KEY = 'user:content_counts:{user_uid}'
+CONTENT_COUNTS_TTL_SECONDS = 10 * 60
+
 
 class UserService:
     async def get_user_by_email(self, email: str, session: AsyncSession):
@@ -23,6 +32,117 @@ class UserService:
 
         return user
 
+    async def get_profile_by_email(self, email: str, session: AsyncSession):
+        """get user by email from database, without its books and reviews
+        Args:
+            email (str): email of the user
+            session (AsyncSession): database session
+        Returns:
+            User: user object, its relationships raise if accessed
+        """
+        statement = select(User).where(User.email == email).options(raiseload('*'))
+
+        result = await session.exec(statement)
+        return result.first()
+
+    async def get_content_counts(
+        self, user_uid: uuid.UUID, session: AsyncSession
+    ) -> dict[str, int]:
+        """count the books and reviews of a user, cached in redis
+        Args:
+            user_uid (uuid.UUID): uid of the user
+            session (AsyncSession): database session
+        Returns:
+            dict: book_count and review_count
+        """
+        key = CONTENT_COUNTS_KEY.format(user_uid=user_uid)
+        cached = await cache_client.hgetall(key)
+        if cached:
+            return {name.decode(): int(count) for name, count in cached.items()}
+
+        statement = select(
+            select(func.count())
+            .select_from(Book)
+            .where(Book.user_uid == user_uid)
+            .scalar_subquery(),
+            select(func.count())
+            .select_from(Review)
+            .where(Review.user_uid == user_uid)
+            .scalar_subquery(),
+        )
+        book_count, review_count = (await session.exec(statement)).one()
+        counts = {'book_count': book_count, 'review_count': review_count}
+
+        async with cache_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=counts)
+            pipe.expire(key, CONTENT_COUNTS_TTL_SECONDS)
+            await pipe.execute()
+        return counts
+
+    async def forget_content_counts(self, user_uid: Optional[uuid.UUID]) -> None:
+        """drop the cached counts of a user after one of its books or reviews
+        is added or deleted
+        Args:
+            user_uid (uuid.UUID): uid of the user, ignored if None
+        """
+        if user_uid is not None:
+            await cache_client.delete(CONTENT_COUNTS_KEY.format(user_uid=user_uid))
+
+    async def get_books_page(
+        self,
+        user_uid: uuid.UUID,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+    ):
+        """get one page of the books of a user, newest first
+        Args:
+            user_uid (uuid.UUID): uid of the user
+            session (AsyncSession): database session
+            limit (int): size of the page
+            cursor (str): next_cursor of the previous page
+        Returns:
+            List[Book]: up to limit + 1 books, the extra one tells a page follows
+        """
+        statement = keyset_page(
+            select(Book).where(Book.user_uid == user_uid).options(raiseload('*')),
+            Book.created_at,
+            Book.uid,
+            limit,
+            cursor,
+        )
+
+        result = await session.exec(statement)
+        return result.all()
+
+    async def get_reviews_page(
+        self,
+        user_uid: uuid.UUID,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+    ):
+        """get one page of the reviews of a user, newest first
+        Args:
+            user_uid (uuid.UUID): uid of the user
+            session (AsyncSession): database session
+            limit (int): size of the page
+            cursor (str): next_cursor of the previous page
+        Returns:
+            List[Review]: up to limit + 1 reviews, the extra one tells a page
+            follows
+        """
+        statement = keyset_page(
+            select(Review).where(Review.user_uid == user_uid).options(raiseload('*')),
+            Review.created_at,
+            Review.uid,
+            limit,
+            cursor,
+        )
+
+        result = await session.exec(statement)
+        return result.all()
+
     async def user_exists(self, email: str, session: AsyncSession):
         """check if user exists in database
         Args:
@@ -7,12 +7,20 @@ from itsdangerous import URLSafeTimedSerializer
 from passlib.context import CryptContext
 
 from src.config import Config
+from src.utils.log_handlers import RateLimitFilter
 
 password_context = CryptContext(schemes=['bcrypt'])
 serializer = URLSafeTimedSerializer(secret_key=Config.JWT_SECRET, salt='email-config')
 
 ACCESS_TOKEN_EXPIRY = 2700
 
+# Bad tokens come in bursts (an expired token is retried by every open tab).
+TOKEN_LOG_RATE = 10
+TOKEN_LOG_PERIOD_SECONDS = 60
+
+logger = logging.getLogger(__name__)
+logger.addFilter(RateLimitFilter(TOKEN_LOG_RATE, TOKEN_LOG_PERIOD_SECONDS))
+
 
 def generate_password_hash(password: str) -> str:
     """generate password hash using bcrypt"""
@@ -62,13 +70,13 @@ def decode_token(token: str):
         return token_data
 
     except jwt.ExpiredSignatureError as e:
-        logging.exception(f'Token expired: {e}')
+        logger.warning('Token expired: %s', e)
         return None
     except jwt.InvalidTokenError as e:
-        logging.exception(f'Invalid token: {e}')
+        logger.warning('Invalid token: %s', e)
         return None
-    except jwt.PyJWTError as e:
-        logging.exception(f'Error decoding token: {e}')
+    except jwt.PyJWTError:
+        logger.exception('Error decoding token')
         return None
 
 
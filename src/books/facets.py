@@ -0,0 +1,247 @@
+import json
+import uuid
+from collections import Counter
+from typing import Iterable, Optional
+
+import redis.asyncio as redis
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.models import Book, BookTag
+from src.db.redis import cache_client
+from src.tags.registry import tag_registry
+
+from .schemas import BookFacetsModel, FacetCountModel, TagFacetModel
+
+FACET_KEYS = {
+    'tag': 'facets:tag',
+    'language': 'facets:language',
+    'publisher': 'facets:publisher',
+}
+# Set once the facet hashes hold the full counts of the book table. It expires
+# so that counts drifted by a lost delta are rebuilt periodically.
+FACETS_LOADED_KEY = 'facets:loaded'
+FACETS_LOADED_TTL_SECONDS = 60 * 60
+# Bumped on every change so that cached filtered responses become unreachable.
+FACETS_VERSION_KEY = 'facets:version'
+FACETS_RESPONSE_KEY = 'facets:response:{version}:{filters}'
+FACETS_RESPONSE_TTL_SECONDS = 10 * 60
+FACET_VALUES_LIMIT = 50
+
+# KEYS: loaded marker, version, then the facet hashes.
+# ARGV: (hash index, field, delta) triples. Counts that reach zero are removed.
+_APPLY_DELTAS = """
+redis.call('INCR', KEYS[2])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 3 do
+    local key = KEYS[2 + tonumber(ARGV[i])]
+    if redis.call('HINCRBY', key, ARGV[i + 1], ARGV[i + 2]) <= 0 then
+        redis.call('HDEL', key, ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+
+class BookFacets:
+    """Book counts per tag, language and publisher.
+
+    Unfiltered counts live in Redis hashes maintained incrementally by
+    BookService and TagService, and are rebuilt from the database with one
+    GROUP BY per facet when missing, which they are at least once an hour.
+    Filtered counts are computed on the books matching the filters and cached
+    per filter combination until the next change.
+    """
+
+    def __init__(self, client: redis.Redis):
+        self._client = client
+        self._facet_names = list(FACET_KEYS)
+        self._apply_deltas = client.register_script(_APPLY_DELTAS)
+
+    async def _apply(self, deltas: Counter) -> None:
+        args = []
+        for (facet, value), delta in deltas.items():
+            if delta:
+                args.extend((self._facet_names.index(facet) + 1, str(value), delta))
+        if not args:
+            return
+        await self._apply_deltas(
+            keys=[FACETS_LOADED_KEY, FACETS_VERSION_KEY, *FACET_KEYS.values()],
+            args=args,
+        )
+
+    async def book_added(self, book: Book) -> None:
+        await self._apply(
+            Counter({('language', book.language): 1, ('publisher', book.publisher): 1})
+        )
+
+    async def book_removed(self, book: Book, tag_uids: Iterable[uuid.UUID]) -> None:
+        deltas = Counter(
+            {('language', book.language): -1, ('publisher', book.publisher): -1}
+        )
+        for tag_uid in tag_uids:
+            deltas[('tag', tag_uid)] -= 1
+        await self._apply(deltas)
+
+    async def book_changed(
+        self, old_language: str, old_publisher: str, book: Book
+    ) -> None:
+        deltas = Counter()
+        deltas[('language', old_language)] -= 1
+        deltas[('publisher', old_publisher)] -= 1
+        deltas[('language', book.language)] += 1
+        deltas[('publisher', book.publisher)] += 1
+        await self._apply(deltas)
+
+    async def tags_linked(self, tag_uids: Iterable[uuid.UUID]) -> None:
+        await self._apply(Counter(('tag', tag_uid) for tag_uid in tag_uids))
+
+    async def tags_unlinked(self, tag_uids: Iterable[uuid.UUID]) -> None:
+        await self._apply(Counter({('tag', tag_uid): -1 for tag_uid in tag_uids}))
+
+    async def tag_deleted(self, tag_uid: uuid.UUID) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hdel(FACET_KEYS['tag'], str(tag_uid))
+            pipe.incr(FACETS_VERSION_KEY)
+            await pipe.execute()
+
+    async def get_facets(
+        self,
+        session: AsyncSession,
+        tag_uid: Optional[uuid.UUID] = None,
+        language: Optional[str] = None,
+        publisher: Optional[str] = None,
+    ) -> BookFacetsModel:
+        """Get the book counts per tag, language and publisher
+        Args:
+            session (AsyncSession): Database session
+            tag_uid, language, publisher: Only count books matching these filters
+        Returns:
+            BookFacetsModel: The counts, largest first"""
+        filters = {'tag': tag_uid, 'language': language, 'publisher': publisher}
+        if not any(value is not None for value in filters.values()):
+            return self._to_model(await self._get_global_counts(session))
+
+        version = await self._client.get(FACETS_VERSION_KEY)
+        response_key = FACETS_RESPONSE_KEY.format(
+            version=int(version or 0),
+            filters=json.dumps(
+                {k: str(v) for k, v in filters.items() if v is not None},
+                sort_keys=True,
+            ),
+        )
+        cached = await self._client.get(response_key)
+        if cached is not None:
+            return BookFacetsModel.model_validate_json(cached)
+
+        counts = await self._count_books(session, tag_uid, language, publisher)
+        facets = self._to_model(counts)
+        await self._client.set(
+            response_key, facets.model_dump_json(), ex=FACETS_RESPONSE_TTL_SECONDS
+        )
+        return facets
+
+    async def _get_global_counts(self, session: AsyncSession) -> dict[str, dict]:
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.exists(FACETS_LOADED_KEY)
+            for key in FACET_KEYS.values():
+                pipe.hgetall(key)
+            loaded, *hashes = await pipe.execute()
+
+        if not loaded:
+            return await self.rebuild(session)
+        return {
+            facet: {field.decode(): int(count) for field, count in counts.items()}
+            for facet, counts in zip(FACET_KEYS, hashes)
+        }
+
+    async def rebuild(self, session: AsyncSession) -> dict[str, dict]:
+        """Recount every facet from the database and store the counts in Redis
+        The counts are only stored if no delta was applied while counting, the
+        next request rebuilds them otherwise.
+        Args:
+            session (AsyncSession): Database session
+        Returns:
+            dict: The counts per facet"""
+        version = await self._client.get(FACETS_VERSION_KEY)
+        counts = await self._count_books(session)
+        async with self._client.pipeline(transaction=True) as pipe:
+            await pipe.watch(FACETS_VERSION_KEY)
+            if await pipe.get(FACETS_VERSION_KEY) != version:
+                return counts
+            pipe.multi()
+            for facet, key in FACET_KEYS.items():
+                pipe.delete(key)
+                if counts[facet]:
+                    pipe.hset(key, mapping=counts[facet])
+            pipe.set(FACETS_LOADED_KEY, 1, ex=FACETS_LOADED_TTL_SECONDS)
+            pipe.incr(FACETS_VERSION_KEY)
+            try:
+                await pipe.execute()
+            except redis.WatchError:
+                pass
+        return counts
+
+    async def _count_books(
+        self,
+        session: AsyncSession,
+        tag_uid: Optional[uuid.UUID] = None,
+        language: Optional[str] = None,
+        publisher: Optional[str] = None,
+    ) -> dict[str, dict]:
+        books = select(Book.uid)
+        if tag_uid is not None:
+            books = books.join(BookTag, BookTag.book_uid == Book.uid).where(
+                BookTag.tag_uid == tag_uid
+            )
+        if language is not None:
+            books = books.where(Book.language == language)
+        if publisher is not None:
+            books = books.where(Book.publisher == publisher)
+        book_uids = books.scalar_subquery()
+
+        statements = {
+            'tag': select(BookTag.tag_uid, func.count())
+            .where(BookTag.book_uid.in_(book_uids))
+            .group_by(BookTag.tag_uid),
+            'language': select(Book.language, func.count())
+            .where(Book.uid.in_(book_uids))
+            .group_by(Book.language),
+            'publisher': select(Book.publisher, func.count())
+            .where(Book.uid.in_(book_uids))
+            .group_by(Book.publisher),
+        }
+        counts = {}
+        for facet, statement in statements.items():
+            result = await session.exec(statement)
+            counts[facet] = {str(value): count for value, count in result}
+        return counts
+
+    def _to_model(self, counts: dict[str, dict]) -> BookFacetsModel:
+        def top(facet_counts: dict) -> list[tuple[str, int]]:
+            ordered = sorted(facet_counts.items(), key=lambda item: (-item[1], item[0]))
+            return ordered[:FACET_VALUES_LIMIT]
+
+        tags = []
+        for tag_uid, count in top(counts['tag']):
+            tag = tag_registry.get_by_uid(uuid.UUID(tag_uid))
+            if tag is not None:
+                tags.append(TagFacetModel(uid=tag.uid, name=tag.name, count=count))
+
+        return BookFacetsModel(
+            tags=tags,
+            languages=[
+                FacetCountModel(value=value, count=count)
+                for value, count in top(counts['language'])
+            ],
+            publishers=[
+                FacetCountModel(value=value, count=count)
+                for value, count in top(counts['publisher'])
+            ],
+        )
+
+
+book_facets = BookFacets(cache_client)
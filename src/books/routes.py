@@ -1,14 +1,42 @@
-from typing import Annotated
+import uuid
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, status
+import orjson
+from fastapi import APIRouter, Depends, Header, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.application.services.viewer_state_service import ViewerStateResolver
 from src.auth.dependencies import AccessTokenBearer, RoleChecker
+from src.books.facets import book_facets
 from src.books.service import BookService
+from src.db.models import Book as BookRow
+from src.db.redis import cache_client
 from src.errors import BookNotFound
+from src.etags import (
+    check_if_match,
+    etag_matches,
+    etag_store,
+    not_modified,
+    weak_etag,
+)
+from src.infrastructure.cache.redis_favorite_repository import RedisFavoriteRepository
+from src.infrastructure.persistence.sql_favorite_repository import (
+    SqlFavoriteRepository,
+)
+from src.infrastructure.persistence.sql_review_repository import SqlReviewRepository
+from src.utils.export import ExportFormat, export_response
+from src.utils.fieldsets import Fieldset, parse_fieldset
+from src.utils.serialization import ResponseSerializer, json_response
 
 from ..db.main import get_session
-from .schemas import Book, BookCreateModel, BookDetailModel, BookUpdateModel
+from .schemas import (
+    Book,
+    BookCreateModel,
+    BookDetailModel,
+    BookFacetsModel,
+    BookListItemModel,
+    BookUpdateModel,
+)
 
 role_checker = Depends(RoleChecker(['admin', 'user']))
 
@@ -16,18 +44,114 @@ role_checker = Depends(RoleChecker(['admin', 'user']))
 book_router = APIRouter()
 book_service = BookService()
 access_token_bearer = AccessTokenBearer()
+book_serializer = ResponseSerializer(Book, BookRow)
+book_detail_serializer = ResponseSerializer(BookDetailModel, BookRow)
+viewer_state_resolver = ViewerStateResolver(
+    favorite_repository=RedisFavoriteRepository(cache_client, SqlFavoriteRepository()),
+    review_repository=SqlReviewRepository(),
+)
+book_detail_fieldset = parse_fieldset(BookDetailModel)
 
 
-@book_router.get('/', response_model=list[Book], dependencies=[role_checker])
+def book_detail_etag(book: BookRow, fieldset: Fieldset = book_detail_fieldset) -> str:
+    """ETag of the book detail, it changes with the book and the included
+    reviews and tags"""
+    return weak_etag(
+        'book',
+        book.uid,
+        book.updated_at,
+        fieldset,
+        sorted(
+            (str(review.uid), review.updated_at)
+            for review in (book.reviews if 'reviews' in fieldset.include else ())
+        ),
+        sorted(
+            (str(tag.uid), tag.name)
+            for tag in (book.tags if 'tags' in fieldset.include else ())
+        ),
+    )
+
+
+@book_router.get(
+    '/',
+    response_model=list[BookListItemModel],
+    dependencies=[role_checker],
+)
 async def get_all_books(
     session: Annotated[AsyncSession, Depends(get_session)],
     token_detail=Depends(access_token_bearer),
+    viewer_state: bool = False,
+    tag: Optional[uuid.UUID] = None,
+    language: Optional[str] = None,
+    publisher: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """Get all books
-    Args: None
-    Returns: list[Book]: A list of all books"""
-    books = await book_service.get_all_books(session)
-    return books
+    Without viewer_state the response has an ETag derived from the version of
+    the books collection, a matching If-None-Match is answered with 304.
+    Args: viewer_state (bool): Add the is_favorited / is_reviewed flags of the
+        current user to every book
+        tag, language, publisher: Only return books matching these filters
+        fields (str): Comma separated fields to return, uid is always returned
+    Returns: list[BookListItemModel]: A list of all books"""
+    fieldset = parse_fieldset(Book, fields)
+    serializer = book_serializer.project(fieldset.fields)
+    if not viewer_state:
+        version = await etag_store.collection_version('books')
+        etag = weak_etag('books', version, tag, language, publisher, fieldset)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        books = await book_service.get_all_books(
+            session, tag, language, publisher, fieldset
+        )
+        return json_response(serializer.dump_many(books), headers={'ETag': etag})
+
+    books = await book_service.get_all_books(
+        session, tag, language, publisher, fieldset
+    )
+
+    state = await viewer_state_resolver.resolve(
+        uuid.UUID(token_detail['user']['user_uid']), [book.uid for book in books]
+    )
+    return json_response(
+        orjson.dumps(
+            [
+                {
+                    **serializer.to_dict(book),
+                    'is_favorited': state.is_favorited(book.uid),
+                    'is_reviewed': state.is_reviewed(book.uid),
+                }
+                for book in books
+            ]
+        )
+    )
+
+
+@book_router.get('/facets', response_model=BookFacetsModel, dependencies=[role_checker])
+async def get_book_facets(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    token_detail=Depends(access_token_bearer),
+    tag: Optional[uuid.UUID] = None,
+    language: Optional[str] = None,
+    publisher: Optional[str] = None,
+):
+    """Get the number of books per tag, language and publisher
+    Args: tag, language, publisher: Only count books matching these filters
+    Returns: BookFacetsModel: The counts of each facet"""
+    return await book_facets.get_facets(session, tag, language, publisher)
+
+
+@book_router.get('/export', dependencies=[role_checker])
+async def export_books(
+    token_detail=Depends(access_token_bearer),
+    format: ExportFormat = ExportFormat.ndjson,
+):
+    """Export every book, streamed from a server-side cursor
+    Args: format (ExportFormat): ndjson or csv
+    Returns: StreamingResponse: The books, one per line"""
+    return export_response(BookRow.__table__, Book, format, 'books')
 
 
 @book_router.get(
@@ -37,13 +161,37 @@ async def get_book(
     book_uid: str,
     session: Annotated[AsyncSession, Depends(get_session)],
     token_detail: dict = Depends(access_token_bearer),
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """Get a book by its uid
+    Only the requested columns and relations are loaded. For the full book a
+    matching If-None-Match is answered with 304 from the remembered ETag,
+    without loading the book.
     Args: book_uid (str): The book uid
+        fields (str): Comma separated fields to return, uid is always returned
+        include (str): Comma separated relations to embed (reviews, tags), all
+            of them by default
     Returns: BookDetailModel: The book details"""
-    book = await book_service.get_book(book_uid, session)
+    fieldset = parse_fieldset(BookDetailModel, fields, include)
+    full = fieldset == book_detail_fieldset
+    if full and if_none_match is not None:
+        etag = await etag_store.get_resource_etag('books', book_uid)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    book = await book_service.get_book(book_uid, session, fieldset)
     if book:
-        return book
+        etag = book_detail_etag(book, fieldset)
+        if full:
+            await etag_store.remember_resource_etag('books', book.uid, etag)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return json_response(
+            book_detail_serializer.project(fieldset.names).dump(book),
+            headers={'ETag': etag},
+        )
     else:
         raise BookNotFound()
 
@@ -61,7 +209,7 @@ async def get_user_book_submissions(
     Returns: list[Book]: A list of books submitted by the current user
     """
     books = await book_service.get_user_books(user_uid, session)
-    return books
+    return json_response(book_serializer.dump_many(books))
 
 
 @book_router.post(
@@ -91,11 +239,19 @@ async def update_book(
     book_update_data: BookUpdateModel,
     session: Annotated[AsyncSession, Depends(get_session)],
     token_detail: dict = Depends(access_token_bearer),
+    if_match: Annotated[Optional[str], Header()] = None,
 ):
     """Update a book
     Args: book_uid (str): The book uid to be updated
+        if_match (str): Only update the book if its ETag matches
     REturns: Book: The updated book
     """
+    if if_match is not None:
+        book = await book_service.get_book(book_uid, session)
+        if book is None:
+            raise BookNotFound()
+        check_if_match(if_match, book_detail_etag(book))
+
     updated_book = await book_service.update_book(book_uid, book_update_data, session)
     if updated_book is None:
         raise BookNotFound()
@@ -112,11 +268,19 @@ async def delete_book(
     book_uid: str,
     session: Annotated[AsyncSession, Depends(get_session)],
     token_detail: dict = Depends(access_token_bearer),
+    if_match: Annotated[Optional[str], Header()] = None,
 ):
     """Delete a book
     Args: book_uid (str): The book uid to be deleted
+        if_match (str): Only delete the book if its ETag matches
     Returns: dict: An empty dictionary
     """
+    if if_match is not None:
+        book = await book_service.get_book(book_uid, session)
+        if book is None:
+            raise BookNotFound()
+        check_if_match(if_match, book_detail_etag(book))
+
     book_to_delete = await book_service.delete_book(book_uid, session)
     if book_to_delete is None:
         raise BookNotFound()
@@ -1,5 +1,6 @@
 import uuid
 from datetime import date, datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -19,6 +20,11 @@ class Book(BaseModel):
     updated_at: datetime
 
 
+class BookListItemModel(Book):
+    is_favorited: Optional[bool] = None
+    is_reviewed: Optional[bool] = None
+
+
 class BookDetailModel(Book):
     reviews: list[ReviewModel]
     tags: list[TagModel]
@@ -39,3 +45,20 @@ class BookUpdateModel(BaseModel):
     publisher: str
     page_count: int
     language: str
+
+
+class FacetCountModel(BaseModel):
+    value: str
+    count: int
+
+
+class TagFacetModel(BaseModel):
+    uid: uuid.UUID
+    name: str
+    count: int
+
+
+class BookFacetsModel(BaseModel):
+    tags: list[TagFacetModel]
+    languages: list[FacetCountModel]
+    publishers: list[FacetCountModel]
@@ -1,23 +1,49 @@
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db.models import Book
+from src.auth.service import UserService
+from src.db.models import Book, BookTag
+from src.etags import etag_store
+from src.utils.fieldsets import Fieldset, fieldset_options
 
+from .facets import book_facets
 from .schemas import BookCreateModel, BookUpdateModel
 
+user_service = UserService()
+
 
 class BookService:
-    async def get_all_books(self, session: AsyncSession):
+    async def get_all_books(
+        self,
+        session: AsyncSession,
+        tag_uid: Optional[uuid.UUID] = None,
+        language: Optional[str] = None,
+        publisher: Optional[str] = None,
+        fieldset: Optional[Fieldset] = None,
+    ):
         """Get all books from database
         Args:
             session (AsyncSession): Database session
+            tag_uid, language, publisher: Only return books matching these filters
+            fieldset (Fieldset): Only load these columns and relations
         Returns:
             List[Book]: List of all books
         """
         statement = select(Book).order_by(desc(Book.created_at))
+        if fieldset is not None:
+            statement = statement.options(*fieldset_options(Book, fieldset))
+        if tag_uid is not None:
+            statement = statement.join(BookTag, BookTag.book_uid == Book.uid).where(
+                BookTag.tag_uid == tag_uid
+            )
+        if language is not None:
+            statement = statement.where(Book.language == language)
+        if publisher is not None:
+            statement = statement.where(Book.publisher == publisher)
 
         result = await session.exec(statement)
         return result.all()
@@ -38,14 +64,25 @@ class BookService:
         result = await session.exec(statement)
         return result.all()
 
-    async def get_book(self, book_uid: str, session: AsyncSession):
+    async def get_book(
+        self,
+        book_uid: str,
+        session: AsyncSession,
+        fieldset: Optional[Fieldset] = None,
+    ):
         """Get a book by uid
         Args:
             book_uid (str): Book uid
             session (AsyncSession): Database session
+            fieldset (Fieldset): Only load these columns and relations, and
+                updated_at
         Returns:
             Book: Book object if found, None otherwise"""
         statement = select(Book).where(Book.uid == book_uid)
+        if fieldset is not None:
+            statement = statement.options(
+                *fieldset_options(Book, fieldset, 'updated_at')
+            )
 
         result = await session.exec(statement)
         book = result.first()
@@ -74,6 +111,9 @@ class BookService:
 
         session.add(new_book)
         await session.commit()
+        await book_facets.book_added(new_book)
+        await etag_store.bump_collection('books')
+        await user_service.forget_content_counts(new_book.user_uid)
 
         return new_book
 
@@ -90,12 +130,18 @@ class BookService:
         book_to_update = await self.get_book(book_uid, session)
 
         if book_to_update is not None:
+            old_language = book_to_update.language
+            old_publisher = book_to_update.publisher
             update_data_dict = update_data.model_dump()
 
             for key, value in update_data_dict.items():
                 setattr(book_to_update, key, value)
+            book_to_update.updated_at = datetime.now()
 
             await session.commit()
+            await book_facets.book_changed(old_language, old_publisher, book_to_update)
+            await etag_store.bump_collection('books')
+            await etag_store.forget_resources('books', book_to_update.uid)
             return book_to_update
         else:
             return None
@@ -110,8 +156,13 @@ class BookService:
         book_to_delete = await self.get_book(book_uid, session)
 
         if book_to_delete is not None:
+            tag_uids = [tag.uid for tag in book_to_delete.tags]
             await session.delete(book_to_delete)
             await session.commit()
+            await book_facets.book_removed(book_to_delete, tag_uids)
+            await etag_store.bump_collection('books')
+            await etag_store.forget_resources('books', book_to_delete.uid)
+            await user_service.forget_content_counts(book_to_delete.user_uid)
 
             return {}
         else:
@@ -1,20 +1,115 @@
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis
 from asgiref.sync import async_to_sync
 from celery import Celery
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.application.services.book_mirror_service import BookMirrorRefreshService
+from src.config import Config
+from src.infrastructure.external.google_books_adapter import GoogleBooksHttpAdapter
+from src.infrastructure.persistence.sql_external_book_mirror_repository import (
+    SqlExternalBookMirrorRepository,
+)
 from src.mail import create_message, mail
+from src.outbox import EMAIL_TOPIC, OutboxHandler, relay_outbox_batch
+
+MIRROR_REFRESH_INTERVAL_SECONDS = 15 * 60
+OUTBOX_RELAY_INTERVAL_SECONDS = 5
+# Remembers delivered outbox messages so that redeliveries are dropped.
+DELIVERED_MESSAGE_KEY = 'outbox:delivered:{message_id}'
+DELIVERED_MESSAGE_TTL_SECONDS = 7 * 24 * 60 * 60
 
 celery_app = Celery('tasks')
 
 celery_app.config_from_object('src.config')
 
+celery_app.conf.beat_schedule = {
+    'refresh-stale-book-mirrors': {
+        'task': 'src.celery_tasks.refresh_stale_book_mirrors_tsk',
+        'schedule': MIRROR_REFRESH_INTERVAL_SECONDS,
+    },
+    'relay-outbox': {
+        'task': 'src.celery_tasks.relay_outbox_tsk',
+        'schedule': OUTBOX_RELAY_INTERVAL_SECONDS,
+    },
+}
+
+delivery_log = redis.Redis.from_url(Config.REDIS_URL)
+
 
 @celery_app.task
-def send_email_tsk(recipients: list[str], subject: str, body: str):
+def send_email_tsk(
+    recipients: list[str], subject: str, body: str, message_id: Optional[str] = None
+):
+    # Outbox messages may be delivered more than once, send each email once.
+    delivered_key = DELIVERED_MESSAGE_KEY.format(message_id=message_id)
+    if message_id is not None and delivery_log.exists(delivered_key):
+        return
     message = create_message(recipients=recipients, subject=subject, body=body)
     async_to_sync(mail.send_message)(message)
+    if message_id is not None:
+        delivery_log.set(delivered_key, 1, ex=DELIVERED_MESSAGE_TTL_SECONDS)
+
+
+@asynccontextmanager
+async def _task_session_maker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    # Each task run gets its own event loop, so pooled connections cannot be reused
+    engine = create_async_engine(url=Config.DATABASE_URL, poolclass=NullPool)
+    try:
+        yield async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+    finally:
+        await engine.dispose()
+
+
+async def _refresh_stale_book_mirrors() -> dict:
+    external_book_service = GoogleBooksHttpAdapter(
+        api_key=getattr(Config, 'GOOGLE_BOOKS_API_KEY', None)
+    )
+    try:
+        async with _task_session_maker() as session_maker:
+            refresh_service = BookMirrorRefreshService(
+                mirror_repository=SqlExternalBookMirrorRepository(session_maker),
+                external_book_service=external_book_service,
+            )
+            return await refresh_service.refresh_stale_books()
+    finally:
+        await external_book_service.aclose()
+
+
+@celery_app.task
+def refresh_stale_book_mirrors_tsk():
+    return async_to_sync(_refresh_stale_book_mirrors)()
+
+
+async def _publish_email(message_id: uuid.UUID, payload: dict) -> None:
+    send_email_tsk.apply_async(kwargs={**payload, 'message_id': str(message_id)})
+
+
+OUTBOX_HANDLERS: dict[str, OutboxHandler] = {
+    EMAIL_TOPIC: _publish_email,
+}
+
+
+async def _relay_outbox() -> dict:
+    async with _task_session_maker() as session_maker:
+        return await relay_outbox_batch(session_maker, OUTBOX_HANDLERS)
+
+
+@celery_app.task
+def relay_outbox_tsk():
+    return async_to_sync(_relay_outbox)()
 
 
 # * To run the Celery worker, execute the following command:
 # celery -A src.celery_tasks.celery_app worker
 # * To run Flower for monitoring, execute the following command:
 # celery -A src.celery_tasks.celery_app flower
+# * To schedule the periodic tasks (mirror refresh, outbox relay), execute the following command:
+# celery -A src.celery_tasks.celery_app beat
@@ -5,8 +5,18 @@ from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.config import Config
+from src.monitoring.metrics import TimedAsyncAdaptedQueuePool, observe_engine_pool
+from src.monitoring.timing import record_sql_spans
 
-async_engine: AsyncEngine = create_async_engine(url=Config.DATABASE_URL)
+async_engine: AsyncEngine = create_async_engine(
+    url=Config.DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool
+)
+observe_engine_pool(async_engine)
+record_sql_spans(async_engine)
+
+async_session_maker = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 
 async def init_db():
@@ -15,8 +25,5 @@ async def init_db():
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async_session = async_sessionmaker(
-        bind=async_engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with async_session() as session:
+    async with async_session_maker() as session:
         yield session
@@ -3,7 +3,7 @@ from datetime import date, datetime
 from typing import Optional
 
 import sqlalchemy.dialects.postgresql as pg
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 
@@ -19,8 +19,12 @@ class User(SQLModel, table=True):
     role: str = Field(sa_column=Column(pg.VARCHAR, nullable=False, default='user'))
     is_verified: bool = Field(default=False)
     password_hash: str = Field(exclude=True)
-    created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now()))
-    updated_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now()))
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now())
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now())
+    )
     reviews: list['Review'] = Relationship(
         back_populates='user', sa_relationship_kwargs={'lazy': 'selectin'}
     )
@@ -42,7 +46,22 @@ class BookTag(SQLModel, table=True):
     created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now()))
 
 
+class Favorite(SQLModel, table=True):
+    user_uid: uuid.UUID = Field(
+        sa_column=Column(pg.UUID, ForeignKey('user.uid'), primary_key=True)
+    )
+    book_uid: uuid.UUID = Field(
+        sa_column=Column(pg.UUID, ForeignKey('book.uid'), primary_key=True, index=True)
+    )
+    created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
+
+
 class Book(SQLModel, table=True):
+    __table_args__ = (
+        # Keyset pagination of the books of a user, newest first.
+        Index('ix_book_user_uid_created_at', 'user_uid', 'created_at', 'uid'),
+    )
+
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4)
     )
@@ -53,8 +72,24 @@ class Book(SQLModel, table=True):
     page_count: int
     user_uid: Optional[uuid.UUID] = Field(default=None, foreign_key='user.uid')
     language: str
-    created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now()))
-    updated_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now()))
+    google_book_id: Optional[str] = Field(
+        default=None, sa_column=Column(pg.VARCHAR, unique=True, index=True)
+    )
+    isbn10: Optional[str] = Field(
+        default=None, sa_column=Column(pg.VARCHAR(10), unique=True, index=True)
+    )
+    isbn13: Optional[str] = Field(
+        default=None, sa_column=Column(pg.VARCHAR(13), unique=True, index=True)
+    )
+    subtitle: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR))
+    description: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR))
+    cover_image_url: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR))
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now())
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now())
+    )
     user: Optional['User'] = Relationship(back_populates='books')
     reviews: list['Review'] = Relationship(
         back_populates='book', sa_relationship_kwargs={'lazy': 'selectin'}
@@ -73,8 +108,12 @@ class Tag(SQLModel, table=True):
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4)
     )
-    name: str = Field(sa_column=Column(pg.VARCHAR, nullable=False))
-    created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
+    name: str = Field(
+        sa_column=Column(pg.VARCHAR, nullable=False, unique=True, index=True)
+    )
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now)
+    )
     books: list['Book'] = Relationship(
         link_model=BookTag,
         back_populates='tags',
@@ -86,6 +125,11 @@ class Tag(SQLModel, table=True):
 
 
 class Review(SQLModel, table=True):
+    __table_args__ = (
+        # Keyset pagination of the reviews of a user, newest first.
+        Index('ix_review_user_uid_created_at', 'user_uid', 'created_at', 'uid'),
+    )
+
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4)
     )
@@ -93,10 +137,61 @@ class Review(SQLModel, table=True):
     review_text: str = Field(sa_column=Column(pg.VARCHAR, nullable=False))
     user_uid: Optional[uuid.UUID] = Field(default=None, foreign_key='user.uid')
     book_uid: Optional[uuid.UUID] = Field(default=None, foreign_key='book.uid')
-    created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
-    updated_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now)
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now)
+    )
     user: Optional[User] = Relationship(back_populates='reviews')
     book: Optional[Book] = Relationship(back_populates='reviews')
 
     def __repr__(self):
         return f'<Review for book {self.book_uid} by user {self.user_uid}>'
+
+
+class ExternalBookMirror(SQLModel, table=True):
+    google_book_id: str = Field(sa_column=Column(pg.VARCHAR, primary_key=True))
+    payload: dict = Field(sa_column=Column(pg.JSONB, nullable=False))
+    fetched_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, index=True)
+    )
+
+    def __repr__(self):
+        return f'<ExternalBookMirror {self.google_book_id}>'
+
+
+class OutboxMessage(SQLModel, table=True):
+    __table_args__ = (
+        # Only undelivered messages are scanned by the relay.
+        Index(
+            'ix_outboxmessage_pending',
+            'created_at',
+            postgresql_where=text('processed_at IS NULL'),
+        ),
+    )
+
+    uid: uuid.UUID = Field(
+        sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4)
+    )
+    topic: str = Field(sa_column=Column(pg.VARCHAR, nullable=False))
+    payload: dict = Field(sa_column=Column(pg.JSONB, nullable=False))
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR))
+    next_attempt_at: datetime = Field(
+        sa_column=Column(
+            pg.TIMESTAMP,
+            nullable=False,
+            default=datetime.now,
+            server_default=text('now()'),
+        )
+    )
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, nullable=False, default=datetime.now)
+    )
+    processed_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(pg.TIMESTAMP)
+    )
+
+    def __repr__(self):
+        return f'<OutboxMessage {self.topic} {self.uid}>'
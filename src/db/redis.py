@@ -1,16 +1,22 @@
 import redis.asyncio as redis
 
 from src.config import Config
+from src.monitoring.metrics import timed_redis_command
 
 JTI_EXPIRY = 2800
 
 token_blocklist = redis.from_url(Config.REDIS_URL)
+cache_client = redis.from_url(Config.REDIS_URL)
 
 
 async def add_jti_to_blocklist(jti: str) -> None:
-    await token_blocklist.set(name=jti, value='', ex=JTI_EXPIRY)
+    await timed_redis_command(
+        'token_blocklist', 'set', token_blocklist.set(name=jti, value='', ex=JTI_EXPIRY)
+    )
 
 
 async def token_in_blocklist(jti: str) -> bool:
-    result = await token_blocklist.get(jti)
+    result = await timed_redis_command(
+        'token_blocklist', 'get', token_blocklist.get(jti)
+    )
     return result is not None
@@ -14,6 +14,7 @@ from src.domain.exceptions.book_exceptions import (
     EmptyGoogleBookId,
     EmptyLanguage,
     EmptyPublisher,
+    InvalidIsbn,
     InvalidPublishedDate,
 )
 from src.domain.exceptions.time_exceptions import (
@@ -22,10 +23,11 @@ from src.domain.exceptions.time_exceptions import (
     UpdatedBeforeCreatedError,
 )
 from src.domain.review.review import DomainReview
+from src.domain.shared.trusted import trusted_factory
 from src.domain.tag.tags import DomainTag
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainBook:
     id: uuid.UUID
     title: BookTitle
@@ -70,6 +72,19 @@ class DomainBook:
             raise EmptyGoogleBookId('Book - Google Book ID cannot be empty')
         if not self.cover_image_url or not self.cover_image_url.strip():
             raise EmptyCoverImageUrl('Book - Cover image URL cannot be empty')
+        if self.isbn10 is not None and self.isbn10.is_isbn13:
+            raise InvalidIsbn('Book - ISBN-10 must have 10 characters')
+        if self.isbn13 is not None and not self.isbn13.is_isbn13:
+            raise InvalidIsbn('Book - ISBN-13 must have 13 digits')
+
+    @classmethod
+    def from_trusted_row(cls, **values) -> 'DomainBook':
+        """
+        Build a book from stored data without re-checking its invariants.
+
+        For repository adapters only; user input goes through the constructor.
+        """
+        return trusted_factory(cls)(**values)
 
     def add_review(self, review: DomainReview) -> None:
         """Add a review to the book"""
@@ -6,7 +6,7 @@ from src.domain.exceptions.book_exceptions import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookDescription:
     """
     BookDescription is a value object that represents the description of a book.
@@ -1,17 +1,83 @@
 from dataclasses import dataclass
+from typing import Optional
 
-from src.domain.exceptions.book_exceptions import EmptyIsbn
+from src.domain.exceptions.book_exceptions import EmptyIsbn, InvalidIsbn
 
+ISBN13_BOOKLAND_PREFIX = '978'
 
-@dataclass(frozen=True)
+
+def _isbn10_check_digit(first_nine: str) -> str:
+    total = sum((10 - i) * int(digit) for i, digit in enumerate(first_nine))
+    check = (11 - total % 11) % 11
+    return 'X' if check == 10 else str(check)
+
+
+def _isbn13_check_digit(first_twelve: str) -> str:
+    total = sum(
+        (3 if i % 2 else 1) * int(digit) for i, digit in enumerate(first_twelve)
+    )
+    return str((10 - total % 10) % 10)
+
+
+def normalize_isbn(raw: str) -> Optional[str]:
+    """
+    Strip separators from an ISBN and check its length, characters and check digit.
+
+    :return: The ISBN-10 or ISBN-13 digits (ISBN-10 may end with ``X``), or None
+        if the value is not a valid ISBN.
+    """
+    value = raw.replace('-', '').replace(' ', '').upper()
+    if not value.isascii():
+        return None
+    if (
+        len(value) == 10
+        and value[:9].isdigit()
+        and (value[9].isdigit() or value[9] == 'X')
+    ):
+        return value if _isbn10_check_digit(value[:9]) == value[9] else None
+    if len(value) == 13 and value.isdigit():
+        return value if _isbn13_check_digit(value[:12]) == value[12] else None
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class IsbnVO:
-    """Value Object for ISBN."""
+    """
+    Value Object for ISBN.
+
+    Accepts ISBN-10 and ISBN-13 with or without hyphens and spaces, validates the
+    check digit and keeps the normalized digits.
+    """
 
     value: str
 
     def __post_init__(self) -> None:
         if not self.value or not self.value.strip():
             raise EmptyIsbn('ISBN cannot be empty')
+        normalized = normalize_isbn(self.value)
+        if normalized is None:
+            raise InvalidIsbn(f'Invalid ISBN: {self.value}')
+        object.__setattr__(self, 'value', normalized)
+
+    @property
+    def is_isbn13(self) -> bool:
+        return len(self.value) == 13
+
+    def to_isbn13(self) -> 'IsbnVO':
+        """Return the ISBN-13 form, ISBN-10s are converted to the 978 prefix."""
+        if self.is_isbn13:
+            return self
+        first_twelve = ISBN13_BOOKLAND_PREFIX + self.value[:9]
+        return IsbnVO(first_twelve + _isbn13_check_digit(first_twelve))
+
+    def to_isbn10(self) -> Optional['IsbnVO']:
+        """Return the ISBN-10 form, or None for ISBN-13s outside the 978 prefix."""
+        if not self.is_isbn13:
+            return self
+        if not self.value.startswith(ISBN13_BOOKLAND_PREFIX):
+            return None
+        first_nine = self.value[3:12]
+        return IsbnVO(first_nine + _isbn10_check_digit(first_nine))
 
     def __str__(self) -> str:
         return self.value
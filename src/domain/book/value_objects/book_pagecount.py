@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.domain.exceptions.book_exceptions import InvalidPageCount
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookPageCount:
     """
     PageCount is a value object that represents the page count of a book.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.domain.exceptions.book_exceptions import EmptySubtitle
 
 
-@dataclass
+@dataclass(slots=True)
 class BookSubtitle:
     """
     BookSubtitle is a value object that represents the subtitle of a book.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.domain.exceptions.book_exceptions import EmptyTitle
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookTitle:
     """
     BookTitle is a value object that represents the title of a book.
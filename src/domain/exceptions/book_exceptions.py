@@ -70,6 +70,12 @@ class EmptyIsbn(BookDomainException):
     pass
 
 
+class InvalidIsbn(BookDomainException):
+    """ISBN must be a valid ISBN-10 or ISBN-13"""
+
+    pass
+
+
 class EmptyCoverImageUrl(BookDomainException):
     """Cover image URL cannot be empty"""
 
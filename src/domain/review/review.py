@@ -10,9 +10,10 @@ from src.domain.exceptions.time_exceptions import (
 )
 from src.domain.review.value_objects.rating_value import RatingVO
 from src.domain.review.value_objects.review_text import ReviewTextVO
+from src.domain.shared.trusted import trusted_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainReview:
     id: uuid.UUID
     rating: RatingVO
@@ -35,6 +36,15 @@ class DomainReview:
                 'Review - Updated at must be greater than or equal to created at'
             )
 
+    @classmethod
+    def from_trusted_row(cls, **values) -> 'DomainReview':
+        """
+        Build a review from stored data without re-checking its invariants.
+
+        For repository adapters only; user input goes through the constructor.
+        """
+        return trusted_factory(cls)(**values)
+
     def update_review(
         self, new_text: Optional[str] = None, new_rating: Optional[int] = None
     ) -> None:
@@ -5,7 +5,7 @@ from src.domain.exceptions.review_exception import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RatingVO:
     """
     Value Object representing the rating of a review.
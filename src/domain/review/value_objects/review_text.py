@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 from src.domain.exceptions.review_exception import (
     EmptyReview,
@@ -6,7 +7,7 @@ from src.domain.exceptions.review_exception import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewTextVO:
     """
     Value Object representing the text content of a review.
@@ -14,7 +15,7 @@ class ReviewTextVO:
     """
 
     value: str
-    MAX_LENGTH: int = 500
+    MAX_LENGTH: ClassVar[int] = 500
 
     def __post_init__(self) -> None:
         """Validate the review text."""
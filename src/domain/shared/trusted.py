@@ -0,0 +1,62 @@
+import dataclasses
+import functools
+from typing import Callable, TypeVar
+
+T = TypeVar('T')
+
+_MISSING = dataclasses.MISSING
+
+
+@functools.cache
+def trusted_factory(cls: type[T]) -> Callable[..., T]:
+    """
+    Build a keyword-only factory for a domain dataclass that sets the fields
+    without calling ``__post_init__``.
+
+    Only meant for data read back from our own storage, which was fully
+    validated when it was written. The fields and their setters are looked up
+    once per class: the slot descriptors of slotted classes, otherwise
+    ``object.__setattr__``, so frozen classes work as well.
+    """
+    slotted = '__slots__' in cls.__dict__
+    required, optional = [], []
+    for field in dataclasses.fields(cls):  # type: ignore[arg-type]
+        if not field.init:
+            continue
+        if slotted:
+            set_field = getattr(cls, field.name).__set__
+        else:
+            set_field = functools.partial(_set_attribute, name=field.name)
+        if field.default is _MISSING and field.default_factory is _MISSING:
+            required.append((field.name, set_field))
+        else:
+            optional.append(
+                (field.name, set_field, field.default, field.default_factory)
+            )
+    names = frozenset(field[0] for field in required + optional)
+
+    def build(**values):
+        self = object.__new__(cls)
+        try:
+            for name, set_field in required:
+                set_field(self, values[name])
+        except KeyError as e:
+            raise TypeError(f'{cls.__name__} missing field {e}') from None
+        for name, set_field, default, default_factory in optional:
+            if name in values:
+                set_field(self, values[name])
+            elif default_factory is _MISSING:
+                set_field(self, default)
+            else:
+                set_field(self, default_factory())
+        if len(values) > len(required) and not values.keys() <= names:
+            raise TypeError(
+                f'{cls.__name__} got unexpected fields {sorted(values.keys() - names)}'
+            )
+        return self
+
+    return build
+
+
+def _set_attribute(instance: object, value: object, name: str) -> None:
+    object.__setattr__(instance, name, value)
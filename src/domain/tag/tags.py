@@ -10,7 +10,7 @@ from src.domain.exceptions.time_exceptions import (
 from src.domain.tag.value_objects.tag_name import TagNameVO
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainTag:
     id: uuid.UUID
     name: TagNameVO
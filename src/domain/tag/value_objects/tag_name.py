@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 from src.domain.exceptions.tags_exception import EmptyName, NameTooLong
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagNameVO:
     """
     Value Object representing the name of a tag.
@@ -11,7 +12,7 @@ class TagNameVO:
     """
 
     value: str
-    MAX_LENGTH: int = 50
+    MAX_LENGTH: ClassVar[int] = 50
 
     def __post_init__(self) -> None:
         """Validate the tag name."""
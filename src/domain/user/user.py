@@ -15,7 +15,7 @@ from src.domain.user.value_objects.user_email import UserEmailVO
 from src.domain.user.value_objects.user_name_field import FieldName
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainUser:
     """
     Represents the domain entity for a User.
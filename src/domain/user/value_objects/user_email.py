@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from src.domain.exceptions.user_exceptions import InvalidEmail
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserEmailVO:
     """
     Represents a user's email address as a Value Object.
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from src.domain.exceptions.user_exceptions import EmptyFieldName, InvalidFieldName
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldName:
     """
     Represents a field name as a Value Object.
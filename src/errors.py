@@ -90,6 +90,24 @@ class UserNotFound(BooklyException):
     pass
 
 
+class PreconditionFailed(BooklyException):
+    """The If-Match header does not match the current version of the resource"""
+
+    pass
+
+
+class InvalidFieldset(BooklyException):
+    """User has requested fields or relations the resource does not have"""
+
+    pass
+
+
+class InvalidCursor(BooklyException):
+    """User has provided a pagination cursor that was not issued by us"""
+
+    pass
+
+
 class AccountNotVerified(Exception):
     """Account not yet verified"""
 
@@ -299,6 +317,42 @@ def register_all_errors(app: FastAPI):
         ),
     )
 
+    app.add_exception_handler(
+        PreconditionFailed,
+        create_exception_handler(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            initial_detail={
+                'message': 'The resource has been modified',
+                'error_code': 'precondition_failed',
+                'resolution': 'Fetch the resource again and retry with its new ETag',
+            },
+        ),
+    )
+
+    app.add_exception_handler(
+        InvalidFieldset,
+        create_exception_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            initial_detail={
+                'message': 'Unknown field or relation requested',
+                'error_code': 'invalid_fieldset',
+                'resolution': 'Only request fields and relations of the resource',
+            },
+        ),
+    )
+
+    app.add_exception_handler(
+        InvalidCursor,
+        create_exception_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            initial_detail={
+                'message': 'Invalid pagination cursor',
+                'error_code': 'invalid_cursor',
+                'resolution': 'Use the next_cursor of the previous page',
+            },
+        ),
+    )
+
     @app.exception_handler(500)
     async def internal_server_error(request, exc):
         return JSONResponse(
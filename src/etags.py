@@ -0,0 +1,106 @@
+import hashlib
+import uuid
+from typing import Any, Optional
+
+import redis.asyncio as redis
+from fastapi.responses import Response
+
+from src.db.redis import cache_client
+from src.errors import PreconditionFailed
+
+COLLECTION_VERSION_KEY = 'etag:version:{collection}'
+RESOURCE_ETAG_KEY = 'etag:{collection}:{uid}'
+# Bounds how long an ETag remembered by a read racing with a write can be served.
+RESOURCE_ETAG_TTL_SECONDS = 5 * 60
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values that identify a representation"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match or If-Match header against an ETag
+    Uses the weak comparison for both headers: our ETags are all weak.
+    Args:
+        header (str): The header value, a list of ETags or *
+        etag (str): The current ETag of the resource
+    Returns:
+        bool: True if the header matches the ETag"""
+    if header is None:
+        return False
+    if header.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(
+        candidate.strip().removeprefix('W/') == opaque_tag
+        for candidate in header.split(',')
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={'ETag': etag})
+
+
+def _resource_key(collection: str, uid: Any) -> str:
+    # Path parameters are plain strings, use the canonical form of the uuid so
+    # that a differently spelled uid cannot outlive an invalidation.
+    try:
+        uid = uuid.UUID(str(uid))
+    except ValueError:
+        pass
+    return RESOURCE_ETAG_KEY.format(collection=collection, uid=uid)
+
+
+def check_if_match(header: Optional[str], etag: str) -> None:
+    """Reject a write if the client's copy of the resource is stale
+    Args:
+        header (str): The If-Match header, the write is allowed if absent
+        etag (str): The current ETag of the resource
+    Raises:
+        errors.PreconditionFailed: If the header does not match the ETag"""
+    if header is not None and not etag_matches(header, etag):
+        raise PreconditionFailed()
+
+
+class ETagStore:
+    """Redis-backed validators for conditional GETs.
+
+    Each collection has a version counter, bumped on every write, from which
+    list ETags are derived. ETags of single resources are remembered when the
+    resource is served and forgotten when it changes, so a conditional GET can
+    be answered with 304 without loading the resource.
+    """
+
+    def __init__(self, client: redis.Redis):
+        self._client = client
+
+    async def collection_version(self, collection: str) -> int:
+        version = await self._client.get(
+            COLLECTION_VERSION_KEY.format(collection=collection)
+        )
+        return int(version or 0)
+
+    async def bump_collection(self, collection: str) -> None:
+        await self._client.incr(COLLECTION_VERSION_KEY.format(collection=collection))
+
+    async def get_resource_etag(self, collection: str, uid: Any) -> Optional[str]:
+        etag = await self._client.get(_resource_key(collection, uid))
+        return etag.decode() if etag is not None else None
+
+    async def remember_resource_etag(
+        self, collection: str, uid: Any, etag: str
+    ) -> None:
+        await self._client.set(
+            _resource_key(collection, uid),
+            etag,
+            ex=RESOURCE_ETAG_TTL_SECONDS,
+        )
+
+    async def forget_resources(self, collection: str, *uids: Any) -> None:
+        if uids:
+            await self._client.delete(*(_resource_key(collection, uid) for uid in uids))
+
+
+etag_store = ETagStore(cache_client)
@@ -0,0 +1,46 @@
+from typing import Any, Optional
+
+from src.application.ports.out.cache_port import CachePort
+from src.monitoring.metrics import CACHE_REQUESTS
+from src.monitoring.timing import span
+
+
+class InstrumentedCache(CachePort):
+    """
+    CachePort decorator counting the hits and misses of another cache.
+
+    Lookups are reported as ``cache_requests_total{cache=name, result=hit|miss}``,
+    the hit ratio is derived from it at query time. Every call is also timed
+    as a ``cache`` span of the current request.
+
+    Not wired yet: the app builds no CachePort (BookApplicationService is not
+    composed), so whoever builds one should wrap it here, e.g.
+    ``InstrumentedCache(cache, 'search')``.
+    """
+
+    def __init__(self, cache: CachePort, name: str):
+        self._cache = cache
+        self._hits = CACHE_REQUESTS.labels(name, 'hit')
+        self._misses = CACHE_REQUESTS.labels(name, 'miss')
+
+    async def get(self, key: str) -> Optional[Any]:
+        with span('cache'):
+            value = await self._cache.get(key)
+        (self._misses if value is None else self._hits).inc()
+        return value
+
+    async def set(
+        self, key: str, value: Any, expire_seconds: Optional[int] = None
+    ) -> None:
+        with span('cache'):
+            await self._cache.set(key, value, expire_seconds)
+
+    async def delete(self, key: str) -> bool:
+        with span('cache'):
+            return await self._cache.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        with span('cache'):
+            hit = await self._cache.exists(key)
+        (self._hits if hit else self._misses).inc()
+        return hit
@@ -0,0 +1,165 @@
+import uuid
+
+import redis.asyncio as redis
+
+from src.application.ports.out.favorite_repository import FavoriteRepository
+from src.domain.book.book import DomainBook
+from src.infrastructure.persistence.sql_favorite_repository import (
+    SqlFavoriteRepository,
+)
+
+USER_FAVORITES_KEY = 'favorites:user:{user_id}'
+BOOK_FAVORITE_COUNT_KEY = 'favorites:count:{book_id}'
+# Write counters of the keys above: a lazy fill read from Postgres is only
+# stored if no write happened since the fill started.
+GENERATION_KEY = '{key}:gen'
+# Member marking a user set as fully loaded from Postgres.
+LOADED_SENTINEL = '*'
+USER_FAVORITES_TTL_SECONDS = 24 * 60 * 60
+FAVORITE_COUNT_TTL_SECONDS = 24 * 60 * 60
+
+# Set members are idempotent, so a change is applied to the cached set as is.
+_APPLY_USER_CHANGE = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if ARGV[1] == '1' then
+    redis.call('SADD', KEYS[1], ARGV[2])
+else
+    redis.call('SREM', KEYS[1], ARGV[2])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+"""
+
+# A counter may already include the change when it was filled after the commit,
+# so it is dropped rather than adjusted and rebuilt on the next read.
+_FORGET_COUNT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+redis.call('DEL', KEYS[1])
+"""
+
+_FILL_USER_SET = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+for i = 3, #ARGV, 1000 do
+    redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+_FILL_COUNT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3], 'NX')
+return 1
+"""
+
+
+def _generation(value) -> str:
+    return value.decode() if value is not None else '0'
+
+
+class RedisFavoriteRepository(FavoriteRepository):
+    """
+    FavoriteRepository adapter serving membership checks and counts from Redis.
+
+    Postgres stays the durable store and is written through: every change is
+    committed there first, then applied to Redis. Each user's favorites are kept
+    in a Redis set and each book's count in a counter, both rebuilt lazily from
+    Postgres when missing, so reads never touch the database once warm. A
+    rebuild is discarded when a write bumped the key's generation meanwhile.
+    """
+
+    def __init__(self, client: redis.Redis, durable: SqlFavoriteRepository):
+        self._client = client
+        self._durable = durable
+        self._apply_user_change = client.register_script(_APPLY_USER_CHANGE)
+        self._forget_count = client.register_script(_FORGET_COUNT)
+        self._fill_user_set = client.register_script(_FILL_USER_SET)
+        self._fill_count = client.register_script(_FILL_COUNT)
+
+    async def add_favorite(self, user_id: uuid.UUID, book_id: uuid.UUID) -> bool:
+        added = await self._durable.add_favorite(user_id, book_id)
+        if added:
+            await self._apply_change(user_id, book_id, 1)
+        return added
+
+    async def remove_favorite(self, user_id: uuid.UUID, book_id: uuid.UUID) -> bool:
+        removed = await self._durable.remove_favorite(user_id, book_id)
+        if removed:
+            await self._apply_change(user_id, book_id, -1)
+        return removed
+
+    async def _apply_change(
+        self, user_id: uuid.UUID, book_id: uuid.UUID, delta: int
+    ) -> None:
+        user_key = USER_FAVORITES_KEY.format(user_id=user_id)
+        count_key = BOOK_FAVORITE_COUNT_KEY.format(book_id=book_id)
+        await self._apply_user_change(
+            keys=[user_key, GENERATION_KEY.format(key=user_key)],
+            args=[delta, str(book_id), USER_FAVORITES_TTL_SECONDS],
+        )
+        await self._forget_count(
+            keys=[count_key, GENERATION_KEY.format(key=count_key)],
+            args=[FAVORITE_COUNT_TTL_SECONDS],
+        )
+
+    async def is_book_favorited_by_user(
+        self, user_id: uuid.UUID, book_id: uuid.UUID
+    ) -> bool:
+        return book_id in await self.get_favorited_book_ids(user_id, [book_id])
+
+    async def get_favorited_book_ids(
+        self, user_id: uuid.UUID, book_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        if not book_ids:
+            return set()
+
+        user_key = USER_FAVORITES_KEY.format(user_id=user_id)
+        generation_key = GENERATION_KEY.format(key=user_key)
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.smismember(
+                user_key, [LOADED_SENTINEL, *(str(book_id) for book_id in book_ids)]
+            )
+            pipe.get(generation_key)
+            (loaded, *memberships), generation = await pipe.execute()
+        if loaded:
+            return {
+                book_id
+                for book_id, is_member in zip(book_ids, memberships)
+                if is_member
+            }
+
+        favorited_ids = await self._durable.get_all_favorited_book_ids(user_id)
+        await self._fill_user_set(
+            keys=[user_key, generation_key],
+            args=[
+                _generation(generation),
+                USER_FAVORITES_TTL_SECONDS,
+                LOADED_SENTINEL,
+                *(str(book_id) for book_id in favorited_ids),
+            ],
+        )
+        return favorited_ids.intersection(book_ids)
+
+    async def list_favorite_books_by_user(
+        self, user_id: uuid.UUID, limit: int = 10, offset: int = 0
+    ) -> list[DomainBook]:
+        return await self._durable.list_favorite_books_by_user(user_id, limit, offset)
+
+    async def count_favorites_for_book(self, book_id: uuid.UUID) -> int:
+        count_key = BOOK_FAVORITE_COUNT_KEY.format(book_id=book_id)
+        generation_key = GENERATION_KEY.format(key=count_key)
+        cached_count, generation = await self._client.mget(count_key, generation_key)
+        if cached_count is not None:
+            return int(cached_count)
+
+        count = await self._durable.count_favorites_for_book(book_id)
+        await self._fill_count(
+            keys=[count_key, generation_key],
+            args=[_generation(generation), count, FAVORITE_COUNT_TTL_SECONDS],
+        )
+        return count
@@ -0,0 +1,47 @@
+import random
+
+import redis.asyncio as redis
+
+from src.application.ports.out.popularity_tracker import PopularityTracker
+
+SEARCHES_KEY = 'popular:searches'
+BOOK_DETAILS_KEY = 'popular:book_details'
+MAX_TRACKED_MEMBERS = 5000
+# Trimming is amortised: roughly one write in TRIM_EVERY also trims the set.
+TRIM_EVERY = 100
+
+
+class RedisPopularityTracker(PopularityTracker):
+    """PopularityTracker adapter keeping request counters in Redis sorted sets."""
+
+    def __init__(self, client: redis.Redis):
+        self._client = client
+
+    async def _increment(self, key: str, member: str) -> None:
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.zincrby(key, 1, member)
+            if random.randrange(TRIM_EVERY) == 0:
+                pipe.zremrangebyrank(key, 0, -(MAX_TRACKED_MEMBERS + 1))
+            await pipe.execute()
+
+    async def record_search(
+        self, canonical_query: str, page_index: int, page_size: int
+    ) -> None:
+        await self._increment(
+            SEARCHES_KEY, f'{page_index}:{page_size}:{canonical_query}'
+        )
+
+    async def record_book_detail(self, google_book_id: str) -> None:
+        await self._increment(BOOK_DETAILS_KEY, google_book_id)
+
+    async def top_searches(self, limit: int) -> list[tuple[str, int, int]]:
+        members = await self._client.zrevrange(SEARCHES_KEY, 0, limit - 1)
+        searches = []
+        for member in members:
+            page_index, page_size, canonical_query = member.decode().split(':', 2)
+            searches.append((canonical_query, int(page_index), int(page_size)))
+        return searches
+
+    async def top_book_details(self, limit: int) -> list[str]:
+        members = await self._client.zrevrange(BOOK_DETAILS_KEY, 0, limit - 1)
+        return [member.decode() for member in members]
@@ -0,0 +1,66 @@
+import time
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failed calls in a row the circuit opens and every
+    call is rejected for ``reset_timeout`` seconds. The circuit then lets a single
+    trial call through (half-open): success closes it, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """Give back the half-open trial slot of a call that ended without a
+        verdict (e.g. cancelled), so that the next call can be the trial."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
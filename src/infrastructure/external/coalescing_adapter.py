@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Optional
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    ExternalBookSearchResponseDTO,
+)
+from src.application.ports.out.external_book_service_port import ExternalBookServicePort
+from src.utils.ttl_cache import TTLCache
+
+DETAIL_CACHE_TTL_SECONDS = 60
+DETAIL_CACHE_MAX_ENTRIES = 5000
+
+
+class CoalescingExternalBookService(ExternalBookServicePort):
+    """
+    Decorator around an ExternalBookServicePort that fetches each book detail
+    at most once per TTL window in this process.
+
+    Concurrent calls for the same external ID share a single in-flight request,
+    and successful results are kept in a short TTL cache. Failures are not
+    cached, every waiter of a failed request receives its exception.
+    """
+
+    def __init__(
+        self,
+        inner: ExternalBookServicePort,
+        ttl_seconds: float = DETAIL_CACHE_TTL_SECONDS,
+        max_entries: int = DETAIL_CACHE_MAX_ENTRIES,
+    ):
+        self._inner = inner
+        self._details: TTLCache[str, ExternalBookItemDTO] = TTLCache(
+            max_entries, ttl_seconds
+        )
+        self._in_flight: dict[str, asyncio.Task[Optional[ExternalBookItemDTO]]] = {}
+
+    async def search_books(
+        self,
+        query: str,
+        filters: Optional[dict[str, Any]] = None,
+        page_index: int = 0,
+        page_size: int = 10,
+    ) -> ExternalBookSearchResponseDTO:
+        return await self._inner.search_books(query, filters, page_index, page_size)
+
+    async def get_book_details_by_external_id(
+        self, external_id: str
+    ) -> Optional[ExternalBookItemDTO]:
+        cached = self._details.get(external_id)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(external_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch(external_id))
+            self._in_flight[external_id] = task
+            task.add_done_callback(lambda done: self._forget(external_id, done))
+
+        # Shielded so that a cancelled caller does not cancel the shared fetch.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, external_id: str) -> Optional[ExternalBookItemDTO]:
+        details = await self._inner.get_book_details_by_external_id(external_id)
+        if details is not None:
+            self._details.set(external_id, details)
+        return details
+
+    def _forget(
+        self, external_id: str, task: asyncio.Task[Optional[ExternalBookItemDTO]]
+    ) -> None:
+        self._in_flight.pop(external_id, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            task.exception()
+
+    def invalidate(self, external_id: str) -> None:
+        """Drop the cached details of an external ID."""
+        self._details.pop(external_id)
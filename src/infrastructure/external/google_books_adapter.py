@@ -0,0 +1,216 @@
+import asyncio
+import random
+from typing import Any, Optional
+
+import httpx
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    ExternalBookSearchResponseDTO,
+)
+from src.application.ports.out.external_book_service_port import (
+    ExternalBookServiceError,
+    ExternalBookServicePort,
+    ExternalBookServiceUnavailable,
+)
+from src.infrastructure.external.circuit_breaker import CircuitBreaker
+
+GOOGLE_BOOKS_API_URL = 'https://www.googleapis.com/books/v1'
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class _RetryableResponse(Exception):
+    def __init__(self, response: httpx.Response):
+        super().__init__(f'Retryable status {response.status_code}')
+        self.response = response
+
+
+class GoogleBooksHttpAdapter(ExternalBookServicePort):
+    """
+    httpx based adapter for the Google Books API.
+
+    One adapter instance owns one pooled ``httpx.AsyncClient`` with keep-alive
+    connections and must be shared by the whole process; call ``aclose`` on
+    shutdown. Every call is bounded by a concurrency semaphore and a per-attempt
+    timeout, retried with jittered exponential backoff, optionally hedged, and
+    guarded by a circuit breaker.
+    """
+
+    def __init__(
+        self,
+        base_url: str = GOOGLE_BOOKS_API_URL,
+        api_key: Optional[str] = None,
+        *,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        connect_timeout: float = 1.0,
+        read_timeout: float = 3.0,
+        attempt_timeout: float = 4.0,
+        max_concurrency: int = 32,
+        max_retries: int = 2,
+        backoff_base: float = 0.1,
+        backoff_max: float = 2.0,
+        hedge_after: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        :param hedge_after: Seconds after which a second, identical request is
+            sent if the first has not answered yet. None disables hedging.
+        :param transport: Optional httpx transport, used to plug in test doubles.
+        """
+        self._api_key = api_key
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(
+                read_timeout, connect=connect_timeout, pool=connect_timeout
+            ),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+        self._attempt_timeout = attempt_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._hedge_after = hedge_after
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+
+    async def search_books(
+        self,
+        query: str,
+        filters: Optional[dict[str, Any]] = None,
+        page_index: int = 0,
+        page_size: int = 10,
+    ) -> ExternalBookSearchResponseDTO:
+        params: dict[str, Any] = {
+            **(filters or {}),
+            'q': query,
+            'startIndex': page_index * page_size,
+            'maxResults': page_size,
+        }
+        response = await self._get('/volumes', params)
+        return ExternalBookSearchResponseDTO.model_validate_json(response.content)
+
+    async def get_book_details_by_external_id(
+        self, external_id: str
+    ) -> Optional[ExternalBookItemDTO]:
+        response = await self._get(f'/volumes/{external_id}', {})
+        if response.status_code == 404:
+            return None
+        return ExternalBookItemDTO.model_validate_json(response.content)
+
+    async def _get(self, path: str, params: dict[str, Any]) -> httpx.Response:
+        """
+        Perform an idempotent GET with retries, hedging and the circuit breaker.
+
+        :return: A response with a 2xx or 404 status.
+        :raises ExternalBookServiceUnavailable: If the circuit is open or every
+            attempt failed.
+        :raises ExternalBookServiceError: If the service rejected the request.
+        """
+        if not self._circuit_breaker.allow_request():
+            raise ExternalBookServiceUnavailable('Google Books circuit is open')
+
+        if self._api_key:
+            params = {**params, 'key': self._api_key}
+
+        try:
+            return await self._attempt(path, params)
+        except asyncio.CancelledError:
+            # No verdict on the service, but a half-open trial must not stay
+            # in flight forever.
+            self._circuit_breaker.release_trial()
+            raise
+        except ExternalBookServiceError:
+            raise
+        except Exception:
+            self._circuit_breaker.record_failure()
+            raise
+
+    async def _attempt(self, path: str, params: dict[str, Any]) -> httpx.Response:
+        """The retry loop of _get, it records the outcome of every attempt it
+        can classify on the circuit breaker."""
+        last_error: Optional[Exception] = None
+        for attempt in range(self._max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self._backoff_delay(attempt, last_error))
+            try:
+                response = await self._send_hedged(path, params)
+            except (httpx.TransportError, TimeoutError, _RetryableResponse) as e:
+                last_error = e
+                continue
+            except httpx.HTTPStatusError as e:
+                # The service answered, the request itself is wrong: not an outage.
+                self._circuit_breaker.record_success()
+                raise ExternalBookServiceError(
+                    f'Google Books rejected request to {path}: {e}'
+                ) from e
+
+            self._circuit_breaker.record_success()
+            return response
+
+        self._circuit_breaker.record_failure()
+        raise ExternalBookServiceUnavailable(
+            f'Google Books request to {path} failed: {last_error}'
+        ) from last_error
+
+    def _backoff_delay(self, attempt: int, last_error: Optional[Exception]) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After."""
+        delay = random.uniform(
+            0, min(self._backoff_max, self._backoff_base * 2**attempt)
+        )
+        if isinstance(last_error, _RetryableResponse):
+            retry_after = last_error.response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self._backoff_max))
+        return delay
+
+    async def _send_hedged(self, path: str, params: dict[str, Any]) -> httpx.Response:
+        if self._hedge_after is None:
+            return await self._send(path, params)
+
+        tasks = {asyncio.create_task(self._send(path, params))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_after)
+            if not done:
+                tasks.add(asyncio.create_task(self._send(path, params)))
+
+            pending = set(tasks)
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+            assert last_error is not None
+            raise last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(self, path: str, params: dict[str, Any]) -> httpx.Response:
+        async with self._semaphore:
+            async with asyncio.timeout(self._attempt_timeout):
+                response = await self._client.get(path, params=params)
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise _RetryableResponse(response)
+        if response.status_code != 404:
+            response.raise_for_status()
+        return response
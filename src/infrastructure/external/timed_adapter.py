@@ -0,0 +1,34 @@
+from typing import Any, Optional
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    ExternalBookSearchResponseDTO,
+)
+from src.application.ports.out.external_book_service_port import ExternalBookServicePort
+from src.monitoring.timing import span
+
+
+class TimedExternalBookService(ExternalBookServicePort):
+    """
+    Decorator around an ExternalBookServicePort recording every call as an
+    ``external`` span of the current request (see the Server-Timing header).
+    """
+
+    def __init__(self, inner: ExternalBookServicePort):
+        self._inner = inner
+
+    async def search_books(
+        self,
+        query: str,
+        filters: Optional[dict[str, Any]] = None,
+        page_index: int = 0,
+        page_size: int = 10,
+    ) -> ExternalBookSearchResponseDTO:
+        with span('external'):
+            return await self._inner.search_books(query, filters, page_index, page_size)
+
+    async def get_book_details_by_external_id(
+        self, external_id: str
+    ) -> Optional[ExternalBookItemDTO]:
+        with span('external'):
+            return await self._inner.get_book_details_by_external_id(external_id)
@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime for a TIMESTAMP WITHOUT TIME ZONE column."""
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def to_aware_utc(value: datetime) -> datetime:
+    """Read back a TIMESTAMP WITHOUT TIME ZONE value as an aware UTC datetime."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
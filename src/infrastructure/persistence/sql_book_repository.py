@@ -0,0 +1,228 @@
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.application.ports.out.book_repository import BookRepository
+from src.db.main import async_session_maker
+from src.db.models import Book
+from src.domain.book.book import DomainBook
+from src.domain.book.value_objects.book_description import BookDescription
+from src.domain.book.value_objects.book_isbn import IsbnVO
+from src.domain.book.value_objects.book_pagecount import BookPageCount
+from src.domain.book.value_objects.book_subtitle import BookSubtitle
+from src.domain.book.value_objects.book_title import BookTitle
+from src.domain.shared.trusted import trusted_factory
+from src.infrastructure.persistence.datetimes import to_aware_utc, to_naive_utc
+
+book_table = Book.__table__  # type: ignore[attr-defined]
+
+AUTHORS_SEPARATOR = ', '
+
+_trusted_title = trusted_factory(BookTitle)
+_trusted_subtitle = trusted_factory(BookSubtitle)
+_trusted_description = trusted_factory(BookDescription)
+_trusted_page_count = trusted_factory(BookPageCount)
+_trusted_isbn = trusted_factory(IsbnVO)
+
+
+def _to_row_values(book: DomainBook) -> dict[str, Any]:
+    return {
+        'uid': book.id,
+        'title': book.title.title,
+        'author': AUTHORS_SEPARATOR.join(book.authors),
+        'publisher': book.publisher,
+        'published_date': book.published_date,
+        'page_count': book.page_count.page_count,
+        'language': book.language,
+        'google_book_id': book.google_book_id,
+        'isbn10': book.isbn10.value if book.isbn10 else None,
+        'isbn13': book.isbn13.value if book.isbn13 else None,
+        'subtitle': book.subtitle.subtitle if book.subtitle else None,
+        'description': book.description.value,
+        'cover_image_url': book.cover_image_url,
+        'created_at': to_naive_utc(book.created_at),
+        'updated_at': to_naive_utc(book.updated_at),
+    }
+
+
+def row_to_domain_book(row: Row) -> DomainBook:
+    # Rows were validated when written, so invariants are not checked again.
+    return DomainBook.from_trusted_row(
+        id=row.uid,
+        title=_trusted_title(title=row.title),
+        subtitle=_trusted_subtitle(subtitle=row.subtitle) if row.subtitle else None,
+        description=_trusted_description(value=row.description or '-'),
+        authors=row.author.split(AUTHORS_SEPARATOR),
+        publisher=row.publisher,
+        published_date=row.published_date,
+        page_count=_trusted_page_count(page_count=row.page_count),
+        language=row.language,
+        created_at=to_aware_utc(row.created_at),
+        updated_at=to_aware_utc(row.updated_at),
+        cover_image_url=row.cover_image_url or 'default_cover_image_url',
+        google_book_id=row.google_book_id,
+        isbn10=_trusted_isbn(value=row.isbn10) if row.isbn10 else None,
+        isbn13=_trusted_isbn(value=row.isbn13) if row.isbn13 else None,
+    )
+
+
+class SqlBookRepository(BookRepository):
+    """
+    Postgres adapter of the BookRepository port.
+
+    Only books registered from Google Books (rows with a ``google_book_id``) are
+    visible through this adapter. Each call opens its own session, so calls can
+    run concurrently.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] = async_session_maker
+    ):
+        self._session_factory = session_factory
+
+    async def _fetch_all(self, statement) -> list[DomainBook]:
+        async with self._session_factory() as session:
+            result = await session.exec(statement)
+            return [row_to_domain_book(row) for row in result]
+
+    async def _fetch_one(self, statement) -> Optional[DomainBook]:
+        books = await self._fetch_all(statement.limit(1))
+        return books[0] if books else None
+
+    async def get_book_by_id(self, book_id: uuid.UUID) -> Optional[DomainBook]:
+        return await self._fetch_one(
+            select(book_table).where(
+                book_table.c.uid == book_id, book_table.c.google_book_id.is_not(None)
+            )
+        )
+
+    async def get_book_by_google_id(self, google_book_id: str) -> Optional[DomainBook]:
+        return await self._fetch_one(
+            select(book_table).where(book_table.c.google_book_id == google_book_id)
+        )
+
+    async def get_books_by_google_ids(
+        self, google_book_ids: list[str]
+    ) -> list[DomainBook]:
+        if not google_book_ids:
+            return []
+        return await self._fetch_all(
+            select(book_table).where(book_table.c.google_book_id.in_(google_book_ids))
+        )
+
+    async def _get_stored_books(self, books: list[DomainBook]) -> dict[str, DomainBook]:
+        """
+        The stored books that keep the given ones from being inserted, i.e. those
+        holding their Google ID or one of their ISBNs, keyed by the Google ID of
+        the given book.
+        """
+        google_book_ids = [book.google_book_id for book in books]
+        isbns = [
+            isbn.value for book in books for isbn in (book.isbn10, book.isbn13) if isbn
+        ]
+        stored_books = await self._fetch_all(
+            select(book_table).where(
+                or_(
+                    book_table.c.google_book_id.in_(google_book_ids),
+                    book_table.c.isbn10.in_(isbns),
+                    book_table.c.isbn13.in_(isbns),
+                )
+            )
+        )
+        by_key: dict[Any, DomainBook] = {}
+        for stored_book in stored_books:
+            by_key[stored_book.google_book_id] = stored_book
+            for isbn in (stored_book.isbn10, stored_book.isbn13):
+                if isbn is not None:
+                    by_key[isbn] = stored_book
+
+        found: dict[str, DomainBook] = {}
+        for book in books:
+            for key in (book.google_book_id, book.isbn13, book.isbn10):
+                if key is not None and key in by_key:
+                    found[book.google_book_id] = by_key[key]
+                    break
+        return found
+
+    async def save_book(self, book: DomainBook) -> DomainBook:
+        if book.isbn13 is not None:
+            # Google Books has several volumes per edition: the first one
+            # registered stands for the ISBN.
+            stored_book = await self.get_book_by_isbn(book.isbn13)
+            if stored_book is not None and stored_book.id != book.id:
+                return stored_book
+
+        values = _to_row_values(book)
+        statement = insert(book_table).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[book_table.c.uid],
+            set_={k: v for k, v in values.items() if k not in ('uid', 'created_at')},
+        )
+        try:
+            async with self._session_factory() as session:
+                await session.exec(statement)
+                await session.commit()
+        except IntegrityError:
+            # Google ID or ISBN registered concurrently by another request.
+            stored_book = (await self._get_stored_books([book])).get(
+                book.google_book_id
+            )
+            if stored_book is None:
+                raise
+            return stored_book
+        return book
+
+    async def save_books(self, books: list[DomainBook]) -> dict[str, DomainBook]:
+        if not books:
+            return {}
+
+        statement = (
+            insert(book_table)
+            .values([_to_row_values(book) for book in books])
+            .on_conflict_do_nothing()
+            .returning(book_table.c.google_book_id)
+        )
+        async with self._session_factory() as session:
+            result = await session.exec(statement)
+            inserted_ids = set(result.scalars())
+            await session.commit()
+
+        saved_books = {
+            book.google_book_id: book
+            for book in books
+            if book.google_book_id in inserted_ids
+        }
+        # Google ID or ISBN already registered, possibly by another book of
+        # this batch: return the stored rows in their place.
+        saved_books.update(
+            await self._get_stored_books(
+                [book for book in books if book.google_book_id not in inserted_ids]
+            )
+        )
+        return saved_books
+
+    async def delete_book(self, book_id: uuid.UUID) -> None:
+        async with self._session_factory() as session:
+            await session.exec(delete(book_table).where(book_table.c.uid == book_id))
+            await session.commit()
+
+    async def get_all_books(self, limit: int = 10, offset: int = 0) -> list[DomainBook]:
+        return await self._fetch_all(
+            select(book_table)
+            .where(book_table.c.google_book_id.is_not(None))
+            .order_by(book_table.c.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+    async def get_book_by_isbn(self, isbn: IsbnVO) -> Optional[DomainBook]:
+        # Every stored ISBN-10 has its ISBN-13 stored too: one index probe.
+        return await self._fetch_one(
+            select(book_table).where(book_table.c.isbn13 == isbn.to_isbn13().value)
+        )
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.application.dtos.external_book_dtos import (
+    ExternalBookItemDTO,
+    MirroredExternalBookDTO,
+)
+from src.application.ports.out.external_book_mirror_repository import (
+    ExternalBookMirrorRepository,
+)
+from src.db.main import async_session_maker
+from src.db.models import ExternalBookMirror
+from src.infrastructure.persistence.datetimes import to_aware_utc, to_naive_utc
+
+mirror_table = ExternalBookMirror.__table__  # type: ignore[attr-defined]
+
+
+class SqlExternalBookMirrorRepository(ExternalBookMirrorRepository):
+    """Postgres adapter of the ExternalBookMirrorRepository port (JSONB payloads)."""
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] = async_session_maker
+    ):
+        self._session_factory = session_factory
+
+    async def get_mirrored_book(
+        self, google_book_id: str
+    ) -> Optional[MirroredExternalBookDTO]:
+        statement = select(mirror_table.c.payload, mirror_table.c.fetched_at).where(
+            mirror_table.c.google_book_id == google_book_id
+        )
+        async with self._session_factory() as session:
+            row = (await session.exec(statement)).first()
+        if row is None:
+            return None
+        return MirroredExternalBookDTO(
+            item=ExternalBookItemDTO.model_validate(row.payload),
+            fetched_at=to_aware_utc(row.fetched_at),
+        )
+
+    async def save_mirrored_books(
+        self, items: list[ExternalBookItemDTO], fetched_at: datetime
+    ) -> None:
+        if not items:
+            return
+        rows = {
+            item.id: {
+                'google_book_id': item.id,
+                'payload': item.model_dump(mode='json'),
+                'fetched_at': to_naive_utc(fetched_at),
+            }
+            for item in items
+        }
+        statement = insert(mirror_table).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=[mirror_table.c.google_book_id],
+            set_={
+                'payload': statement.excluded.payload,
+                'fetched_at': statement.excluded.fetched_at,
+            },
+        )
+        async with self._session_factory() as session:
+            await session.exec(statement)
+            await session.commit()
+
+    async def delete_mirrored_books(self, google_book_ids: list[str]) -> None:
+        if not google_book_ids:
+            return
+        async with self._session_factory() as session:
+            await session.exec(
+                delete(mirror_table).where(
+                    mirror_table.c.google_book_id.in_(google_book_ids)
+                )
+            )
+            await session.commit()
+
+    async def list_stale_google_ids(
+        self, fetched_before: datetime, limit: int = 100
+    ) -> list[str]:
+        statement = (
+            select(mirror_table.c.google_book_id)
+            .where(mirror_table.c.fetched_at < to_naive_utc(fetched_before))
+            .order_by(mirror_table.c.fetched_at)
+            .limit(limit)
+        )
+        async with self._session_factory() as session:
+            return list((await session.exec(statement)).scalars())
@@ -0,0 +1,106 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.application.ports.out.favorite_repository import FavoriteRepository
+from src.db.main import async_session_maker
+from src.db.models import Favorite
+from src.domain.book.book import DomainBook
+from src.infrastructure.persistence.datetimes import to_naive_utc
+from src.infrastructure.persistence.sql_book_repository import (
+    book_table,
+    row_to_domain_book,
+)
+
+favorite_table = Favorite.__table__  # type: ignore[attr-defined]
+
+
+class SqlFavoriteRepository(FavoriteRepository):
+    """Postgres adapter of the FavoriteRepository port, the durable store."""
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] = async_session_maker
+    ):
+        self._session_factory = session_factory
+
+    async def add_favorite(self, user_id: uuid.UUID, book_id: uuid.UUID) -> bool:
+        statement = (
+            insert(favorite_table)
+            .values(
+                user_uid=user_id,
+                book_uid=book_id,
+                created_at=to_naive_utc(datetime.now(timezone.utc)),
+            )
+            .on_conflict_do_nothing()
+            .returning(favorite_table.c.book_uid)
+        )
+        async with self._session_factory() as session:
+            inserted = (await session.exec(statement)).first() is not None
+            await session.commit()
+        return inserted
+
+    async def remove_favorite(self, user_id: uuid.UUID, book_id: uuid.UUID) -> bool:
+        statement = (
+            delete(favorite_table)
+            .where(
+                favorite_table.c.user_uid == user_id,
+                favorite_table.c.book_uid == book_id,
+            )
+            .returning(favorite_table.c.book_uid)
+        )
+        async with self._session_factory() as session:
+            removed = (await session.exec(statement)).first() is not None
+            await session.commit()
+        return removed
+
+    async def is_book_favorited_by_user(
+        self, user_id: uuid.UUID, book_id: uuid.UUID
+    ) -> bool:
+        return book_id in await self.get_favorited_book_ids(user_id, [book_id])
+
+    async def get_favorited_book_ids(
+        self, user_id: uuid.UUID, book_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        if not book_ids:
+            return set()
+        statement = select(favorite_table.c.book_uid).where(
+            favorite_table.c.user_uid == user_id,
+            favorite_table.c.book_uid.in_(book_ids),
+        )
+        async with self._session_factory() as session:
+            return set((await session.exec(statement)).scalars())
+
+    async def get_all_favorited_book_ids(self, user_id: uuid.UUID) -> set[uuid.UUID]:
+        """Every book the user has favorited, used to rebuild the Redis set."""
+        statement = select(favorite_table.c.book_uid).where(
+            favorite_table.c.user_uid == user_id
+        )
+        async with self._session_factory() as session:
+            return set((await session.exec(statement)).scalars())
+
+    async def list_favorite_books_by_user(
+        self, user_id: uuid.UUID, limit: int = 10, offset: int = 0
+    ) -> list[DomainBook]:
+        statement = (
+            select(book_table)
+            .join(favorite_table, favorite_table.c.book_uid == book_table.c.uid)
+            .where(
+                favorite_table.c.user_uid == user_id,
+                # Trusted hydration only holds for books registered from Google.
+                book_table.c.google_book_id.is_not(None),
+            )
+            .order_by(favorite_table.c.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        async with self._session_factory() as session:
+            return [row_to_domain_book(row) for row in await session.exec(statement)]
+
+    async def count_favorites_for_book(self, book_id: uuid.UUID) -> int:
+        statement = select(func.count()).where(favorite_table.c.book_uid == book_id)
+        async with self._session_factory() as session:
+            return (await session.exec(statement)).scalar_one()
@@ -0,0 +1,149 @@
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.application.ports.out.review_repository import ReviewRepository
+from src.db.main import async_session_maker
+from src.db.models import Review
+from src.domain.review.review import DomainReview
+from src.domain.review.value_objects.rating_value import RatingVO
+from src.domain.review.value_objects.review_text import ReviewTextVO
+from src.domain.shared.trusted import trusted_factory
+from src.infrastructure.persistence.datetimes import to_aware_utc, to_naive_utc
+from src.infrastructure.persistence.sql_book_repository import book_table
+
+review_table = Review.__table__  # type: ignore[attr-defined]
+
+_trusted_rating = trusted_factory(RatingVO)
+_trusted_review_text = trusted_factory(ReviewTextVO)
+
+
+def _to_row_values(review: DomainReview) -> dict[str, Any]:
+    return {
+        'uid': review.id,
+        'rating': review.rating.value,
+        'review_text': review.review_text.value,
+        'user_uid': review.user_id,
+        'book_uid': review.book_id,
+        'created_at': to_naive_utc(review.created_at),
+        'updated_at': to_naive_utc(review.updated_at),
+    }
+
+
+def row_to_domain_review(row: Row) -> DomainReview:
+    # Rows were validated when written, so invariants are not checked again.
+    return DomainReview.from_trusted_row(
+        id=row.uid,
+        rating=_trusted_rating(value=row.rating),
+        review_text=_trusted_review_text(value=row.review_text),
+        book_id=row.book_uid,
+        user_id=row.user_uid,
+        created_at=to_aware_utc(row.created_at),
+        updated_at=to_aware_utc(row.updated_at),
+    )
+
+
+class SqlReviewRepository(ReviewRepository):
+    """Postgres adapter of the ReviewRepository port, one session per call."""
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] = async_session_maker
+    ):
+        self._session_factory = session_factory
+
+    async def _fetch_all(self, statement) -> list[DomainReview]:
+        async with self._session_factory() as session:
+            result = await session.exec(statement)
+            return [row_to_domain_review(row) for row in result]
+
+    async def save_review(self, review: DomainReview) -> DomainReview:
+        values = _to_row_values(review)
+        statement = insert(review_table).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[review_table.c.uid],
+            set_={k: v for k, v in values.items() if k not in ('uid', 'created_at')},
+        )
+        async with self._session_factory() as session:
+            await session.exec(statement)
+            await session.commit()
+        return review
+
+    async def delete_review(self, review_id: uuid.UUID):
+        async with self._session_factory() as session:
+            await session.exec(
+                delete(review_table).where(review_table.c.uid == review_id)
+            )
+            await session.commit()
+
+    async def get_review_by_id(self, review_id: uuid.UUID) -> Optional[DomainReview]:
+        reviews = await self._fetch_all(
+            select(review_table).where(review_table.c.uid == review_id)
+        )
+        return reviews[0] if reviews else None
+
+    async def get_reviews_by_book_google_id(
+        self, book_google_id: str, limit: int = 10, offset: int = 0
+    ) -> list[DomainReview]:
+        return await self._fetch_all(
+            select(review_table)
+            .join(book_table, book_table.c.uid == review_table.c.book_uid)
+            .where(book_table.c.google_book_id == book_google_id)
+            .order_by(review_table.c.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+    async def get_reviews_by_user_id(
+        self, user_id: uuid.UUID, limit: int = 10, offset: int = 0
+    ) -> list[DomainReview]:
+        return await self._fetch_all(
+            select(review_table)
+            .where(review_table.c.user_uid == user_id)
+            .order_by(review_table.c.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+    async def get_reviews_by_book_id(
+        self, book_id: uuid.UUID, limit: int = 10, offset: int = 0
+    ) -> list[DomainReview]:
+        return await self._fetch_all(
+            select(review_table)
+            .where(review_table.c.book_uid == book_id)
+            .order_by(review_table.c.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+    async def get_review_by_user_and_book_id(
+        self, user_id: uuid.UUID, book_id: uuid.UUID
+    ) -> Optional[DomainReview]:
+        reviews = await self._fetch_all(
+            select(review_table)
+            .where(
+                review_table.c.user_uid == user_id, review_table.c.book_uid == book_id
+            )
+            .limit(1)
+        )
+        return reviews[0] if reviews else None
+
+    async def get_reviewed_book_ids(
+        self, user_id: uuid.UUID, book_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        if not book_ids:
+            return set()
+        statement = (
+            select(review_table.c.book_uid)
+            .where(
+                review_table.c.user_uid == user_id,
+                review_table.c.book_uid.in_(book_ids),
+            )
+            .distinct()
+        )
+        async with self._session_factory() as session:
+            return set((await session.exec(statement)).scalars())
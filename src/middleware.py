@@ -1,29 +1,84 @@
 import logging
+import random
 import time
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.requests import Request
 
+from src.monitoring.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT, route_label
+from src.monitoring.timing import start_recording
+from src.utils.log_handlers import json_stream_handler, queue_logging
+
+# Successful requests are sampled, slow and failed ones are always logged.
+ACCESS_LOG_SAMPLE_RATE = 0.1
+SLOW_REQUEST_SECONDS = 1.0
+FAILED_STATUS_CODE = 400
+# Admins sending this header get the spans of the request as JSON.
+DEBUG_TIMING_HEADER = 'X-Debug-Timing'
+
 logger = logging.getLogger('uvicorn.access')
 logger.disabled = True
 
+access_logger = logging.getLogger('bookly.access')
+access_logger.setLevel(logging.INFO)
+# Started and stopped by the app lifespan.
+access_log_listener = queue_logging(access_logger, json_stream_handler())
 
-def register_middleware(app: FastAPI):
-    @app.middleware('http')
-    async def custom_logging(request: Request, call_next):
-        start_time = time.time()
 
-        response = await call_next(request)
-        processing_time = time.time() - start_time
+def log_request(
+    request: Request, status_code: int, duration: float, exc_info=None
+) -> None:
+    failed = status_code >= FAILED_STATUS_CODE
+    slow = duration >= SLOW_REQUEST_SECONDS
+    if not (failed or slow) and random.random() >= ACCESS_LOG_SAMPLE_RATE:
+        return
+
+    access_logger.log(
+        logging.WARNING if failed or slow else logging.INFO,
+        'request',
+        exc_info=exc_info,
+        extra={
+            'client': getattr(request.client, 'host', 'unknown'),
+            'method': request.method,
+            'path': request.url.path,
+            'status': status_code,
+            'duration_ms': round(duration * 1000, 3),
+            'sample_rate': 1.0 if failed or slow else ACCESS_LOG_SAMPLE_RATE,
+        },
+    )
 
-        client_host = getattr(request.client, 'host', 'unknown')
-        client_port = getattr(request.client, 'port', 'unknown')
-        message = f'{client_host}:{client_port} - {request.method} - {request.url.path} - {response.status_code} \ncompleted after {processing_time}s'
 
-        print(f'{message}')
+def register_middleware(app: FastAPI):
+    @app.middleware('http')
+    async def custom_logging(request: Request, call_next):
+        start_time = time.perf_counter()
+        recorder = start_recording()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            duration = time.perf_counter() - start_time
+            REQUEST_LATENCY.labels(request.method, route_label(request), '500').observe(
+                duration
+            )
+            log_request(request, 500, duration, exc)
+            raise
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
 
+        duration = time.perf_counter() - start_time
+        REQUEST_LATENCY.labels(
+            request.method, route_label(request), str(response.status_code)
+        ).observe(duration)
+        log_request(request, response.status_code, duration)
+        response.headers['Server-Timing'] = recorder.server_timing(duration)
+        if recorder.debug_allowed and DEBUG_TIMING_HEADER in request.headers:
+            response.headers[DEBUG_TIMING_HEADER] = orjson.dumps(
+                recorder.debug()
+            ).decode()
         return response
 
     app.add_middleware(
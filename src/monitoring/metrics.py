@@ -0,0 +1,92 @@
+import time
+from typing import Awaitable, TypeVar
+
+import redis.asyncio as redis
+from fastapi.requests import Request
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+T = TypeVar('T')
+
+# Unmatched paths are reported under one label, so that scanners cannot blow
+# up the number of series.
+UNMATCHED_ROUTE = '<unmatched>'
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Latency of HTTP requests',
+    ['method', 'route', 'status'],
+)
+REQUESTS_IN_FLIGHT = Gauge('http_requests_in_flight', 'HTTP requests being processed')
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a connection from the SQLAlchemy pool',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections', 'Connections of the SQLAlchemy pool', ['state']
+)
+REDIS_COMMAND_LATENCY = Histogram(
+    'redis_command_duration_seconds',
+    'Latency of Redis commands',
+    ['client', 'command'],
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+)
+CACHE_REQUESTS = Counter(
+    'cache_requests_total', 'Cache lookups by outcome', ['cache', 'result']
+)
+CELERY_QUEUE_DEPTH = Gauge(
+    'celery_queue_depth', 'Tasks waiting in a Celery queue', ['queue']
+)
+
+
+def route_label(request: Request) -> str:
+    route = request.scope.get('route')
+    return getattr(route, 'path', UNMATCHED_ROUTE)
+
+
+async def timed_redis_command(client: str, command: str, call: Awaitable[T]) -> T:
+    """Await a Redis command and record its latency"""
+    start = time.perf_counter()
+    try:
+        return await call
+    finally:
+        REDIS_COMMAND_LATENCY.labels(client, command).observe(
+            time.perf_counter() - start
+        )
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """The default pool of async engines, timing how long checkouts wait."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def observe_engine_pool(engine: AsyncEngine) -> None:
+    """Report the usage of the engine pool, read when metrics are scraped"""
+    pool = engine.sync_engine.pool
+    DB_POOL_CONNECTIONS.labels('checked_out').set_function(pool.checkedout)
+    DB_POOL_CONNECTIONS.labels('checked_in').set_function(pool.checkedin)
+    DB_POOL_CONNECTIONS.labels('overflow').set_function(lambda: max(pool.overflow(), 0))
+
+
+class CeleryQueueDepth:
+    """Length of the Celery queues in a Redis broker, updated on scrape"""
+
+    def __init__(self, broker: redis.Redis, queues: list[str]):
+        self._broker = broker
+        self._queues = queues
+
+    async def update(self) -> None:
+        async with self._broker.pipeline(transaction=False) as pipe:
+            for queue in self._queues:
+                pipe.llen(queue)
+            lengths = await pipe.execute()
+        for queue, length in zip(self._queues, lengths):
+            CELERY_QUEUE_DEPTH.labels(queue).set(length)
@@ -0,0 +1,35 @@
+from typing import Optional
+
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from src.auth.dependencies import RoleChecker
+from src.celery_tasks import celery_app
+
+from .metrics import CeleryQueueDepth
+
+metrics_router = APIRouter()
+admin_role_checker = Depends(RoleChecker(['admin']))
+
+
+def _celery_queue_depth() -> Optional[CeleryQueueDepth]:
+    broker_url = celery_app.conf.broker_url or ''
+    if not broker_url.startswith(('redis://', 'rediss://')):
+        return None
+    return CeleryQueueDepth(
+        redis.from_url(broker_url), [celery_app.conf.task_default_queue]
+    )
+
+
+celery_queue_depth = _celery_queue_depth()
+
+
+@metrics_router.get('/', dependencies=[admin_role_checker])
+async def get_metrics():
+    """Get the metrics of this process in the Prometheus text format
+    Returns: Response: The metrics"""
+    if celery_queue_depth is not None:
+        await celery_queue_depth.update()
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
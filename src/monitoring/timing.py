@@ -0,0 +1,94 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class SpanRecorder:
+    """
+    Durations of the work done for one request, summed per span name.
+
+    Spans of the same name add up (e.g. every SQL statement of the request
+    goes to ``db``), spans of different names may overlap.
+    """
+
+    __slots__ = ('totals', 'counts', 'debug_allowed')
+
+    def __init__(self):
+        self.totals: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.debug_allowed = False
+
+    def add(self, name: str, seconds: float) -> None:
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def server_timing(self, total_seconds: float) -> str:
+        """The Server-Timing header value, durations in milliseconds"""
+        entries = [
+            f'{name};dur={seconds * 1000:.2f};desc="{self.counts[name]}x"'
+            for name, seconds in self.totals.items()
+        ]
+        entries.append(f'total;dur={total_seconds * 1000:.2f}')
+        return ', '.join(entries)
+
+    def debug(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {'ms': round(seconds * 1000, 3), 'count': self.counts[name]}
+            for name, seconds in self.totals.items()
+        }
+
+
+_recorder: ContextVar[Optional[SpanRecorder]] = ContextVar(
+    'span_recorder', default=None
+)
+
+
+def start_recording() -> SpanRecorder:
+    """Record the spans of the current request, called by the middleware"""
+    recorder = SpanRecorder()
+    _recorder.set(recorder)
+    return recorder
+
+
+def current_recorder() -> Optional[SpanRecorder]:
+    return _recorder.get()
+
+
+def allow_debug(allowed: bool) -> None:
+    """Let the current request see the JSON timing debug block"""
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.debug_allowed = allowed
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a block as a span of the current request, a no-op outside of one"""
+    recorder = _recorder.get()
+    if recorder is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, time.perf_counter() - start)
+
+
+def record_sql_spans(engine: AsyncEngine) -> None:
+    """Time every statement executed by the engine as a ``db`` span"""
+
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        # A connection runs one statement at a time.
+        conn.info['span_started'] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        recorder = _recorder.get()
+        if recorder is not None:
+            recorder.add('db', time.perf_counter() - conn.info['span_started'])
@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.models import OutboxMessage
+
+# Only side effects leaving the system go through the outbox. Redis cache
+# invalidations (ETag versions, facet deltas, content counts) stay inline after
+# the commit: a relay run would delay them by seconds and facet deltas are not
+# idempotent under redelivery. A lost one is bounded by the cache's own expiry,
+# or for collection ETag versions by the next write to the collection.
+EMAIL_TOPIC = 'email.send'
+
+OUTBOX_BATCH_SIZE = 100
+# Failed messages are retried with an exponential backoff, starting at the
+# base delay and doubling up to the maximum one.
+OUTBOX_RETRY_BASE_SECONDS = 5
+OUTBOX_RETRY_MAX_SECONDS = 60 * 60
+# Messages failing this many times (about 10 hours of retries) are left in the
+# table for inspection; reset their attempts to replay them.
+OUTBOX_MAX_ATTEMPTS = 20
+
+OutboxHandler = Callable[[uuid.UUID, dict], Awaitable[None]]
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Delay before the next delivery of a message that failed ``attempts`` times"""
+    seconds = OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, OUTBOX_RETRY_MAX_SECONDS))
+
+
+def add_outbox_message(session: AsyncSession, topic: str, payload: dict) -> None:
+    """Stage a side effect in the caller's transaction
+    The message is only visible to the relay once the caller commits, so it is
+    recorded if and only if the state change is.
+    Args:
+        session (AsyncSession): The session of the state change
+        topic (str): Selects the handler that processes the message
+        payload (dict): JSON serializable handler arguments
+    """
+    session.add(OutboxMessage(topic=topic, payload=payload))
+
+
+async def relay_outbox_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    handlers: dict[str, OutboxHandler],
+    batch_size: int = OUTBOX_BATCH_SIZE,
+) -> dict:
+    """Process one batch of pending outbox messages, oldest first
+    Rows are locked with SKIP LOCKED so several relays can run at once. A message
+    is marked processed after its handler returns: delivery is at least once and
+    handlers must be idempotent, keyed by the message uid. Failed messages keep
+    their error and are retried once their backoff delay has passed.
+    Args:
+        session_factory: Opens the session of the batch
+        handlers (dict): Handler of each topic
+        batch_size (int): Maximum number of messages of the batch
+    Returns:
+        dict: Counts of processed and failed messages
+    """
+    processed = failed = 0
+    now = datetime.now()
+    async with session_factory() as session:
+        statement = (
+            select(OutboxMessage)
+            .where(
+                OutboxMessage.processed_at.is_(None),
+                OutboxMessage.next_attempt_at <= now,
+                OutboxMessage.attempts < OUTBOX_MAX_ATTEMPTS,
+            )
+            .order_by(OutboxMessage.created_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        messages = (await session.exec(statement)).all()
+
+        for message in messages:
+            handler = handlers.get(message.topic)
+            try:
+                if handler is None:
+                    raise LookupError(f'No outbox handler for topic {message.topic}')
+                await handler(message.uid, message.payload)
+            except Exception as exc:
+                message.attempts += 1
+                message.last_error = repr(exc)
+                message.next_attempt_at = now + retry_delay(message.attempts)
+                failed += 1
+            else:
+                message.processed_at = datetime.now()
+                processed += 1
+
+        await session.commit()
+    return {'processed': processed, 'failed': failed}
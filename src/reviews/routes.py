@@ -1,23 +1,31 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.auth.dependencies import RoleChecker, get_current_userd
 from src.db.main import get_session
-from src.db.models import User
-from src.errors import ReviewNotFound
+from src.db.models import Review, User
+from src.errors import ReviewNotFound, ReviewNotFoundOrUserIsNotOwner
+from src.etags import check_if_match, etag_matches, etag_store, not_modified, weak_etag
+from src.utils.export import ExportFormat, export_response
+from src.utils.serialization import ResponseSerializer, json_response
 
 from .schemas import ReviewCreateModel, ReviewModel
 from .service import ReviewService
 
 review_router = APIRouter()
 review_service = ReviewService()
+review_serializer = ResponseSerializer(ReviewModel, Review)
 
 admin_role_checker = Depends(RoleChecker(['admin']))
 user_role_checker = Depends(RoleChecker(['admin', 'user']))
 
 
+def review_etag(review: Review) -> str:
+    return weak_etag('review', review.uid, review.updated_at)
+
+
 @review_router.post('/books/{book_uid}', dependencies=[user_role_checker])
 async def add_review_to_book(
     book_uid: str,
@@ -43,7 +51,9 @@ async def add_review_to_book(
     return new_review
 
 
-@review_router.get('/', dependencies=[user_role_checker])
+@review_router.get(
+    '/', response_model=list[ReviewModel], dependencies=[user_role_checker]
+)
 async def get_all_reviews(session: Annotated[AsyncSession, Depends(get_session)]):
     """Get all reviews
     Args:
@@ -51,22 +61,41 @@ async def get_all_reviews(session: Annotated[AsyncSession, Depends(get_session)]
     Service: review_service.get_all_reviews
     Returns: All reviews"""
     reviews = await review_service.get_all_reviews(session)
-    return reviews
+    return json_response(review_serializer.dump_many(reviews))
+
+
+@review_router.get('/export', dependencies=[user_role_checker])
+async def export_reviews(format: ExportFormat = ExportFormat.ndjson):
+    """Export every review, streamed from a server-side cursor
+    Args: format (ExportFormat): ndjson or csv
+    Returns: StreamingResponse: The reviews, one per line"""
+    return export_response(Review.__table__, ReviewModel, format, 'reviews')
 
 
 @review_router.get('/{review_uid}', response_model=ReviewModel)
 async def get_review(
-    review_uid: str, session: Annotated[AsyncSession, Depends(get_session)]
+    review_uid: str,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """Get a review by its uid
+    A matching If-None-Match is answered with 304 from the remembered ETag,
+    without loading the review.
     Args: review_uid (str): The review uid
     Returns: The specific review
     Service: review_service.get_review
     Raises: ReviewNotFound: If the review is not found"""
+    if if_none_match is not None:
+        etag = await etag_store.get_resource_etag('reviews', review_uid)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     review = await review_service.get_review(review_uid, session)
 
     if review:
-        return review
+        etag = review_etag(review)
+        await etag_store.remember_resource_etag('reviews', review.uid, etag)
+        return json_response(review_serializer.dump(review), headers={'ETag': etag})
     else:
         raise ReviewNotFound()
 
@@ -76,12 +105,20 @@ async def delete_review(
     review_uid: str,
     current_user: Annotated[User, Depends(get_current_userd)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    if_match: Annotated[Optional[str], Header()] = None,
 ):
     """Delete a review by its uid
     Args: review_uid (str): The review uid, current_user (User): The current user
+        if_match (str): Only delete the review if its ETag matches
     Service: review_service.delete_review_from_book
     Returns: A message confirming the deletion
     """
+    if if_match is not None:
+        review = await review_service.get_review(review_uid, session)
+        if not review:
+            raise ReviewNotFoundOrUserIsNotOwner()
+        check_if_match(if_match, review_etag(review))
+
     await review_service.delete_review_from_book(
         review_uid, current_user.email, session
     )
@@ -7,6 +7,7 @@ from src.auth.service import UserService
 from src.books.service import BookService
 from src.db.models import Review
 from src.errors import BookNotFound, ReviewNotFoundOrUserIsNotOwner, UserNotFound
+from src.etags import etag_store
 
 from .schemas import ReviewCreateModel
 
@@ -48,6 +49,8 @@ class ReviewService:
 
             session.add(new_review)
             await session.commit()
+            await etag_store.forget_resources('books', book.uid)
+            await user_service.forget_content_counts(user.uid)
 
             return new_review
 
@@ -96,3 +99,6 @@ class ReviewService:
 
         await session.delete(review)
         await session.commit()
+        await etag_store.forget_resources('books', review.book_uid)
+        await etag_store.forget_resources('reviews', review.uid)
+        await user_service.forget_content_counts(review.user_uid)
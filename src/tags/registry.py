@@ -0,0 +1,111 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Optional
+
+import redis.asyncio as redis
+from sqlmodel import select
+
+from src.db.main import async_session_maker
+from src.db.models import Tag
+
+from .schemas import TagModel
+
+TAG_INVALIDATION_CHANNEL = 'tags:invalidation'
+RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+class TagRegistry:
+    """In-process copy of the tag table, indexed by name and by uid.
+
+    Loaded once at startup and kept up to date by TagService. Changes are
+    published on a Redis channel so that every worker applies them; each worker
+    reloads the whole table when it (re)subscribes, since messages sent while it
+    was disconnected are lost.
+    """
+
+    def __init__(self):
+        self._by_name: dict[str, TagModel] = {}
+        self._by_uid: dict[uuid.UUID, TagModel] = {}
+
+    async def load(self) -> None:
+        """Replace the registry content with the tags stored in the database"""
+        async with async_session_maker() as session:
+            tags = (await session.exec(select(Tag))).all()
+        by_uid = {tag.uid: _to_model(tag) for tag in tags}
+        self._by_uid = by_uid
+        self._by_name = {tag.name: tag for tag in by_uid.values()}
+
+    def get_by_name(self, name: str) -> Optional[TagModel]:
+        return self._by_name.get(name)
+
+    def get_by_uid(self, tag_uid: uuid.UUID) -> Optional[TagModel]:
+        return self._by_uid.get(tag_uid)
+
+    def put(self, tag: TagModel) -> None:
+        previous = self._by_uid.get(tag.uid)
+        if previous is not None and self._by_name.get(previous.name) is previous:
+            del self._by_name[previous.name]
+        self._by_uid[tag.uid] = tag
+        self._by_name[tag.name] = tag
+
+    def discard(self, tag_uid: uuid.UUID) -> None:
+        previous = self._by_uid.pop(tag_uid, None)
+        if previous is not None and self._by_name.get(previous.name) is previous:
+            del self._by_name[previous.name]
+
+    def __len__(self) -> int:
+        return len(self._by_uid)
+
+    async def publish_put(self, client: redis.Redis, tag: Tag) -> None:
+        """Apply a created or updated tag locally and announce it to other workers"""
+        model = _to_model(tag)
+        self.put(model)
+        message = {'op': 'put', 'tag': model.model_dump(mode='json')}
+        await client.publish(TAG_INVALIDATION_CHANNEL, json.dumps(message))
+
+    async def publish_discard(self, client: redis.Redis, tag_uid: uuid.UUID) -> None:
+        """Apply a deleted tag locally and announce it to other workers"""
+        self.discard(tag_uid)
+        message = {'op': 'discard', 'uid': str(tag_uid)}
+        await client.publish(TAG_INVALIDATION_CHANNEL, json.dumps(message))
+
+    def apply_message(self, data: bytes | str) -> None:
+        message = json.loads(data)
+        if message['op'] == 'put':
+            self.put(TagModel.model_validate(message['tag']))
+        elif message['op'] == 'discard':
+            self.discard(uuid.UUID(message['uid']))
+
+    async def listen(self, client: redis.Redis) -> None:
+        """Apply invalidation messages until cancelled, resubscribing on errors"""
+        while True:
+            try:
+                async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(TAG_INVALIDATION_CHANNEL)
+                    await self.load()
+                    async for message in pubsub.listen():
+                        if message['type'] != 'message':
+                            continue
+                        try:
+                            self.apply_message(message['data'])
+                        except (ValueError, KeyError, TypeError):
+                            # One bad message must not stop the invalidation.
+                            logger.exception('Invalid tag invalidation message')
+            except (redis.ConnectionError, redis.TimeoutError, OSError):
+                await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+            except Exception:
+                # E.g. the reload failing on the database: resubscribe as well,
+                # the listener only ends when cancelled.
+                logger.exception('Tag invalidation listener failed')
+                await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+
+
+def _to_model(tag: Tag) -> TagModel:
+    return TagModel(uid=tag.uid, name=tag.name, created_at=tag.created_at)
+
+
+tag_registry = TagRegistry()
@@ -1,31 +1,59 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.auth.dependencies import RoleChecker
 from src.books.schemas import Book
 from src.db.main import get_session
+from src.db.models import Tag
+from src.errors import TagNotFound
+from src.etags import check_if_match, etag_matches, etag_store, not_modified, weak_etag
+from src.utils.serialization import ResponseSerializer, json_response
 
 from .schemas import TagAddModel, TagCreateModel, TagModel
 from .service import TagService
 
 tags_router = APIRouter()
 tag_service = TagService()
+tag_serializer = ResponseSerializer(TagModel, Tag)
 user_role_checker = Depends(RoleChecker(['user', 'admin']))
 
 
+def tag_etag(tag: Tag) -> str:
+    return weak_etag('tag', tag.uid, tag.name)
+
+
+async def check_tag_if_match(
+    tag_uid: str, if_match: Optional[str], session: AsyncSession
+) -> None:
+    if if_match is None:
+        return
+    tag = await tag_service.get_tag_by_uid(tag_uid, session)
+    if not tag:
+        raise TagNotFound()
+    check_if_match(if_match, tag_etag(tag))
+
+
 @tags_router.get('/', response_model=list[TagModel], dependencies=[user_role_checker])
-async def get_all_tags(session: Annotated[AsyncSession, Depends(get_session)]):
+async def get_all_tags(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
     """Get all tags
+    A matching If-None-Match is answered with 304 without loading the tags.
     Args:
         None
     Returns:
         List of all tags
     """
+    etag = weak_etag('tags', await etag_store.collection_version('tags'))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     tags = await tag_service.get_all_tags(session)
 
-    return tags
+    return json_response(tag_serializer.dump_many(tags), headers={'ETag': etag})
 
 
 @tags_router.post(
@@ -55,14 +83,17 @@ async def update_tag(
     tag_uid: str,
     tag_update_data: TagCreateModel,
     session: Annotated[AsyncSession, Depends(get_session)],
+    if_match: Annotated[Optional[str], Header()] = None,
 ):
     """Updae a tag by tag_uid
     Args:
         tag_uid: str - tag uid to be updated
         tag_update_data: TagCreateModel - tag data to be updated
+        if_match: str - only update the tag if its ETag matches
     Returns:
         TagModel - updated tag
     """
+    await check_tag_if_match(tag_uid, if_match, session)
     updated_tag = await tag_service.update_tag(tag_uid, tag_update_data, session)
 
     return updated_tag
@@ -70,14 +101,18 @@ async def update_tag(
 
 @tags_router.delete('/{tag_uid}', dependencies=[user_role_checker])
 async def delete_tag(
-    tag_uid: str, session: Annotated[AsyncSession, Depends(get_session)]
+    tag_uid: str,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    if_match: Annotated[Optional[str], Header()] = None,
 ):
     """Delete a tag by tag_uid
     Args:
         tag_uid: str - tag uid to be deleted
+        if_match: str - only delete the tag if its ETag matches
     Returns:
         dict - message -> Tag deleted successfully
     """
+    await check_tag_if_match(tag_uid, if_match, session)
     await tag_service.delete_tag(tag_uid, session)
     return {'message': 'Tag deleted successfully'}
 
@@ -102,3 +137,25 @@ async def add_tags_to_book(
     )
 
     return book_with_tag
+
+
+@tags_router.delete(
+    '/book/{book_uid}/tags/{tag_uid}',
+    response_model=Book,
+    dependencies=[user_role_checker],
+)
+async def remove_tag_from_book(
+    book_uid: str,
+    tag_uid: str,
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Remove a tag from a book
+    Args:
+        book_uid: str - book uid from which the tag is removed
+        tag_uid: str - tag uid to be removed
+    Returns:
+        Book - book without the tag
+    """
+    return await tag_service.remove_tag_from_book(
+        book_uid=book_uid, tag_uid=tag_uid, session=session
+    )
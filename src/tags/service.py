@@ -1,13 +1,19 @@
 import uuid
 from datetime import datetime
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.books.facets import book_facets
 from src.books.service import BookService
 from src.db.models import Tag
+from src.db.redis import cache_client
 from src.errors import BookNotFound, TagAlreadyExists, TagNotFound
+from src.etags import etag_store
 
+from .registry import tag_registry
 from .schemas import TagAddModel, TagCreateModel
 
 book_service = BookService()
@@ -36,6 +42,7 @@ class TagService:
         self, book_uid: str, tag_data: TagAddModel, session: AsyncSession
     ):
         """Add tags to a book
+        Known tags are resolved from the tag registry, without a query.
         If tag not found, create a new tag
 
         Args:
@@ -46,23 +53,81 @@ class TagService:
             Book: The book with the tags added
         Raises:
             errors.BookNotFound: If the book is not found"""
+        try:
+            return await self._link_tags(book_uid, tag_data, session)
+        except IntegrityError:
+            # A tag of the same name was created by another worker and the
+            # registry has not heard of it yet: re-read the tags and retry.
+            await session.rollback()
+            await tag_registry.load()
+            return await self._link_tags(book_uid, tag_data, session)
+
+    async def _link_tags(
+        self, book_uid: str, tag_data: TagAddModel, session: AsyncSession
+    ):
         book = await book_service.get_book(book_uid=book_uid, session=session)
 
         if not book:
             raise BookNotFound()
 
-        for tag_item in tag_data.tags:
-            result = await session.exec(select(Tag).where(Tag.name == tag_item.name))
+        previously_linked_uids = {tag.uid for tag in book.tags}
+        linked_uids = set(previously_linked_uids)
+        new_tags = []
+        for name in dict.fromkeys(tag_item.name for tag_item in tag_data.tags):
+            known_tag = tag_registry.get_by_name(name)
+            if known_tag:
+                tag = Tag(**known_tag.model_dump())
+                make_transient_to_detached(tag)
+                tag = await session.merge(tag, load=False)
+            else:
+                tag = Tag(name=name, uid=uuid.uuid4(), created_at=datetime.now())
+                new_tags.append(tag)
+
+            if tag.uid not in linked_uids:
+                book.tags.append(tag)
+                linked_uids.add(tag.uid)
+        session.add(book)
+        await session.commit()
+        for tag in new_tags:
+            await tag_registry.publish_put(cache_client, tag)
+        if new_tags:
+            await etag_store.bump_collection('tags')
+        # The book list can be filtered by tag: a new link changes it too.
+        await etag_store.bump_collection('books')
+        await etag_store.forget_resources('books', book.uid)
+        await book_facets.tags_linked(
+            tag.uid for tag in book.tags if tag.uid not in previously_linked_uids
+        )
+        await session.refresh(book)
+        return book
 
-            tag = result.one_or_none()
-            if not tag:
-                tag = Tag(
-                    name=tag_item.name, uid=uuid.uuid4(), created_at=datetime.now()
-                )
+    async def remove_tag_from_book(
+        self, book_uid: str, tag_uid: str, session: AsyncSession
+    ):
+        """Remove a tag from a book
+        Args:
+            book_uid (str): The book uid
+            tag_uid (str): The tag uid
+            session (AsyncSession): The database session
+        Returns:
+            Book: The book without the tag
+        Raises:
+            errors.BookNotFound: If the book is not found
+            errors.TagNotFound: If the book does not have the tag"""
+        book = await book_service.get_book(book_uid=book_uid, session=session)
 
-            book.tags.append(tag)
-        session.add(book)
+        if not book:
+            raise BookNotFound()
+
+        tag = next((tag for tag in book.tags if str(tag.uid) == tag_uid), None)
+        if not tag:
+            raise TagNotFound()
+
+        book.tags.remove(tag)
         await session.commit()
+        await book_facets.tags_unlinked([tag.uid])
+        await etag_store.bump_collection('books')
+        await etag_store.forget_resources('books', book.uid)
         await session.refresh(book)
         return book
 
@@ -88,11 +153,7 @@ class TagService:
             Tag: The newly created tag
         Raises:
             errors.TagAlreadyExists: If the tag already exists"""
-        statement = select(Tag).where(Tag.name == tag_data.name)
-        result = await session.exec(statement)
-        tag = result.first()
-
-        if tag:
+        if tag_registry.get_by_name(tag_data.name):
             raise TagAlreadyExists()
 
         new_tag_dict = tag_data.model_dump()
@@ -100,7 +161,15 @@ class TagService:
         new_tag.name = tag_data.name
 
         session.add(new_tag)
-        await session.commit()
+        try:
+            await session.commit()
+        except IntegrityError:
+            # Created by another worker, the registry did not know it yet.
+            await session.rollback()
+            await tag_registry.load()
+            raise TagAlreadyExists()
+        await tag_registry.publish_put(cache_client, new_tag)
+        await etag_store.bump_collection('tags')
 
         return new_tag
 
@@ -115,19 +184,29 @@ class TagService:
         Returns:
             Tag: The updated tag
         Raises:
-            errors.TagNotFound: If the tag is not found"""
+            errors.TagNotFound: If the tag is not found
+            errors.TagAlreadyExists: If another tag has the new name"""
         tag = await self.get_tag_by_uid(tag_uid, session)
         if not tag:
             raise TagNotFound()
 
+        book_uids = [book.uid for book in tag.books]
         update_data_dict = tag_update_data.model_dump()
 
-        for k, v in update_data_dict.items():
-            setattr(tag, k, v)
+        try:
+            for k, v in update_data_dict.items():
+                setattr(tag, k, v)
 
-            await session.commit()
-            await session.refresh(tag)
+                await session.commit()
+                await session.refresh(tag)
+        except IntegrityError:
+            await session.rollback()
+            raise TagAlreadyExists()
 
+        await tag_registry.publish_put(cache_client, tag)
+        await etag_store.bump_collection('tags')
+        await etag_store.bump_collection('books')
+        await etag_store.forget_resources('books', *book_uids)
         return tag
 
     async def delete_tag(self, tag_uid: str, session: AsyncSession):
@@ -142,5 +221,11 @@ class TagService:
         if not tag:
             raise TagNotFound()
 
+        book_uids = [book.uid for book in tag.books]
         await session.delete(tag)
         await session.commit()
+        await tag_registry.publish_discard(cache_client, tag.uid)
+        await book_facets.tag_deleted(tag.uid)
+        await etag_store.bump_collection('tags')
+        await etag_store.bump_collection('books')
+        await etag_store.forget_resources('books', *book_uids)
@@ -0,0 +1,99 @@
+import csv
+import enum
+import io
+from typing import AsyncIterator, Sequence
+
+import orjson
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, Table, select
+
+from src.db.main import async_session_maker
+
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, enum.Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: 'application/x-ndjson',
+    ExportFormat.csv: 'text/csv; charset=utf-8',
+}
+
+
+async def stream_batches(
+    statement: Select, batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[Sequence[Row]]:
+    """Read the rows of a statement in batches through a server-side cursor
+    The generator opens its own session: it outlives the request dependencies,
+    and the next batch is only fetched once the previous one has been consumed.
+    Args:
+        statement (Select): The statement to stream
+        batch_size (int): The number of rows fetched per round trip
+    Returns:
+        AsyncIterator[Sequence[Row]]: The rows, one batch at a time"""
+    async with async_session_maker() as session:
+        result = await session.stream(statement.execution_options(yield_per=batch_size))
+        async for batch in result.partitions():
+            yield batch
+
+
+async def _ndjson_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Row]]
+) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b''.join(
+            orjson.dumps(dict(zip(columns, row)), option=orjson.OPT_APPEND_NEWLINE)
+            for row in batch
+        )
+
+
+async def _csv_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Row]]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    table: Table,
+    schema: type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Stream every row of a table as NDJSON or CSV
+    Only the columns of the response schema are read, oldest rows first. Each
+    batch of rows becomes one chunk of the response, so memory use does not
+    grow with the size of the table.
+    Args:
+        table (Table): The table to export
+        schema (BaseModel): The response schema, its fields are the exported columns
+        export_format (ExportFormat): ndjson or csv
+        filename (str): The file name suggested to the client, without extension
+    Returns:
+        StreamingResponse: The export"""
+    columns = tuple(schema.model_fields)
+    statement = select(*(table.c[name] for name in columns)).order_by(
+        table.c.created_at
+    )
+    encode = _ndjson_chunks if export_format is ExportFormat.ndjson else _csv_chunks
+    return StreamingResponse(
+        encode(columns, stream_batches(statement)),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+    )
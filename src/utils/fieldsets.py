@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only, raiseload, selectinload
+from sqlmodel import SQLModel
+
+from src.errors import InvalidFieldset
+
+from .serialization import nested_list_model
+
+
+@dataclass(frozen=True, slots=True)
+class Fieldset:
+    """The fields and relations of a schema requested with ?fields= and ?include=
+
+    Both tuples follow the order of the schema, so that equal requests give
+    equal fieldsets whatever the order of the query parameters.
+    """
+
+    fields: tuple[str, ...]
+    include: tuple[str, ...]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self.fields + self.include
+
+
+def _split(value: str) -> set[str]:
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def parse_fieldset(
+    schema: type[BaseModel],
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    required: tuple[str, ...] = ('uid',),
+) -> Fieldset:
+    """Parse the ?fields= and ?include= parameters against a response schema
+    Scalar fields of the schema are selected with fields, its list[Model]
+    fields (the relations) with include. Fields marked exclude are never
+    selectable.
+    Args:
+        schema (BaseModel): The full response schema
+        fields (str): Comma separated scalar fields, all of them if None
+        include (str): Comma separated relations, all of them if None
+        required (tuple): Fields always returned, e.g. the primary key
+    Returns:
+        Fieldset: The requested fieldset
+    Raises:
+        errors.InvalidFieldset: If a name is not a field of the schema"""
+    scalars, relations = [], []
+    for name, field in schema.model_fields.items():
+        if field.exclude:
+            continue
+        if nested_list_model(field.annotation) is not None:
+            relations.append(name)
+        else:
+            scalars.append(name)
+
+    requested_fields = set(scalars) if fields is None else _split(fields)
+    requested_include = set(relations) if include is None else _split(include)
+    if not requested_fields <= set(scalars) or not requested_include <= set(relations):
+        raise InvalidFieldset()
+
+    requested_fields.update(required)
+    return Fieldset(
+        fields=tuple(name for name in scalars if name in requested_fields),
+        include=tuple(name for name in relations if name in requested_include),
+    )
+
+
+def fieldset_options(model: type[SQLModel], fieldset: Fieldset, *columns: str) -> tuple:
+    """Loader options that only load the columns and relations of a fieldset
+    Relations that are not included raise instead of loading, and so do the
+    relations of the included rows: the embedded schemas only have scalars.
+    Args:
+        model (SQLModel): The table model of the statement
+        fieldset (Fieldset): The requested fields and relations
+        columns (str): Columns loaded in addition to the fieldset
+    Returns:
+        tuple: The options of the select statement"""
+    return (
+        load_only(*(getattr(model, name) for name in {*fieldset.fields, *columns})),
+        *(
+            selectinload(getattr(model, name)).raiseload('*')
+            for name in fieldset.include
+        ),
+        raiseload('*'),
+    )
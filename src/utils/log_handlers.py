@@ -0,0 +1,109 @@
+import logging
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+
+LOG_QUEUE_SIZE = 10_000
+
+# Attributes of every LogRecord, anything else was passed through ``extra``.
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord('', 0, '', 0, '', (), None).__dict__
+) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with the ``extra`` fields of the record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves the formatting to the listener thread.
+
+    The stock handler formats the record in the calling thread, i.e. on the
+    event loop. The queue is bounded: when the listener falls behind, records
+    are dropped and counted instead of blocking the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def queue_logging(logger: logging.Logger, handler: logging.Handler) -> QueueListener:
+    """Route the records of a logger through a queue to a handler
+    The returned listener must be started for the records to be written, its
+    thread does the formatting and the I/O.
+    Args:
+        logger (logging.Logger): The logger, it stops propagating to its parents
+        handler (logging.Handler): The handler writing the records
+    Returns:
+        QueueListener: The listener, not started"""
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    logger.propagate = False
+    return QueueListener(log_queue, handler, respect_handler_level=True)
+
+
+def json_stream_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter())
+    return handler
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most ``rate`` records per ``per`` seconds from each call site.
+
+    The number of records dropped in a window is added to the first record let
+    through in the next window, as ``suppressed``.
+    """
+
+    def __init__(self, rate: int, per: float):
+        super().__init__()
+        self.rate = rate
+        self.per = per
+        # call site -> [window start, records let through, records suppressed]
+        self._windows: dict[tuple[str, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.per:
+            if window is not None and window[2]:
+                record.suppressed = window[2]
+            window = self._windows[key] = [now, 0, 0]
+
+        if window[1] >= self.rate:
+            window[2] += 1
+            return False
+        window[1] += 1
+        return True
@@ -0,0 +1,64 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+import orjson
+from sqlalchemy import Select, tuple_
+
+from src.errors import InvalidCursor
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(created_at: datetime, uid: uuid.UUID) -> str:
+    """Opaque cursor pointing right after a row, in (created_at, uid) order"""
+    payload = orjson.dumps([created_at.isoformat(), str(uid)])
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor made by encode_cursor
+    Args:
+        cursor (str): The cursor sent by the client
+    Returns:
+        tuple: The created_at and uid of the last row of the previous page
+    Raises:
+        errors.InvalidCursor: If the cursor is malformed"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, uid = orjson.loads(payload)
+        return datetime.fromisoformat(created_at), uuid.UUID(uid)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise InvalidCursor()
+
+
+def keyset_page(
+    statement: Select, created_at: Any, uid: Any, limit: int, cursor: Optional[str]
+) -> Select:
+    """Restrict a statement to one page, newest rows first
+    The page is selected with a (created_at, uid) comparison instead of an
+    offset, so every page costs the same with an index on those columns.
+    One row more than the limit is fetched to know whether a page follows.
+    Args:
+        statement (Select): The statement over every row
+        created_at, uid: The columns of the sort key
+        limit (int): The size of the page
+        cursor (str): The next_cursor of the previous page, None for the first
+    Returns:
+        Select: The statement of the page"""
+    if cursor is not None:
+        statement = statement.where(
+            tuple_(created_at, uid) < tuple_(*decode_cursor(cursor))
+        )
+    return statement.order_by(created_at.desc(), uid.desc()).limit(limit + 1)
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> Optional[str]:
+    """The cursor of the page after rows, fetched by keyset_page"""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last.created_at, last.uid)
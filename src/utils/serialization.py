@@ -0,0 +1,135 @@
+import typing
+from typing import Any, Generic, Iterable, Optional, TypeVar
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter, create_model
+from sqlalchemy import inspect
+
+M = TypeVar('M', bound=BaseModel)
+
+
+def nested_list_model(annotation: Any) -> type[BaseModel] | None:
+    if typing.get_origin(annotation) is not list:
+        return None
+    (item_type,) = typing.get_args(annotation)
+    if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+        return item_type
+    return None
+
+
+def admits_none(annotation: Any) -> bool:
+    if annotation is Any or annotation is None or annotation is type(None):
+        return True
+    return type(None) in typing.get_args(annotation)
+
+
+class ResponseSerializer(Generic[M]):
+    """
+    Precompiled JSON serializer of ORM rows for a response schema.
+
+    The validated path runs the rows through a TypeAdapter built once for the
+    schema, like FastAPI does for ``response_model`` but without rebuilding the
+    python objects before encoding. The trusted path skips validation for rows
+    loaded from our own database: it copies the schema fields (and nested
+    ``list[Model]`` fields) into dicts and encodes them with orjson, which
+    renders UUIDs, dates and datetimes the same way pydantic does.
+
+    The trusted path is only taken when the table the rows come from cannot
+    hold a value the schema rejects: every field must be a column (or a
+    relationship, for nested lists), and a nullable column needs an optional
+    field. Other schemas are always validated.
+    """
+
+    def __init__(self, schema: type[M], table_model: type):
+        self.schema = schema
+        self.table_model = table_model
+        self._adapter = TypeAdapter(schema)
+        self._list_adapter = TypeAdapter(list[schema])
+        self._fields: tuple[str, ...] = tuple(
+            name for name, field in schema.model_fields.items() if not field.exclude
+        )
+        self._nested: dict[str, ResponseSerializer] = {}
+        self._projections: dict[tuple[str, ...], ResponseSerializer] = {}
+        mapper = inspect(table_model)
+        self.trusted = True
+        for name in self._fields:
+            field = schema.model_fields[name]
+            nested_model = nested_list_model(field.annotation)
+            if nested_model is not None and name in mapper.relationships:
+                serializer = ResponseSerializer(
+                    nested_model, mapper.relationships[name].mapper.class_
+                )
+                self._nested[name] = serializer
+                self.trusted = self.trusted and serializer.trusted
+            elif name in mapper.columns:
+                if mapper.columns[name].nullable and not admits_none(field.annotation):
+                    self.trusted = False
+            else:
+                self.trusted = False
+
+    def project(self, fields: Iterable[str]) -> 'ResponseSerializer':
+        """
+        Serializer of a subset of the schema fields, for sparse fieldsets.
+
+        The subset schema is built once per distinct set of fields, of which a
+        schema has a bounded number.
+        """
+        requested = set(fields)
+        fields = tuple(name for name in self._fields if name in requested)
+        if fields == self._fields:
+            return self
+        serializer = self._projections.get(fields)
+        if serializer is None:
+            subset = create_model(
+                f'{self.schema.__name__}Fields',
+                **{
+                    name: (field.annotation, field)
+                    for name, field in self.schema.model_fields.items()
+                    if name in fields
+                },
+            )
+            serializer = self._projections[fields] = ResponseSerializer(
+                subset, self.table_model
+            )
+        return serializer
+
+    def to_dict(self, row: Any) -> dict[str, Any]:
+        """The schema fields of a row in a dict, orjson ready."""
+        if self.trusted:
+            return self._to_dict(row)
+        return self._adapter.validate_python(row, from_attributes=True).model_dump(
+            mode='json'
+        )
+
+    def _to_dict(self, row: Any) -> dict[str, Any]:
+        values = {name: getattr(row, name) for name in self._fields}
+        for name, serializer in self._nested.items():
+            values[name] = [serializer._to_dict(item) for item in values[name]]
+        return values
+
+    def dump(self, row: Any, *, trusted: bool = True) -> bytes:
+        if trusted and self.trusted:
+            return orjson.dumps(self._to_dict(row))
+        return self._adapter.dump_json(
+            self._adapter.validate_python(row, from_attributes=True)
+        )
+
+    def dump_many(self, rows: Iterable[Any], *, trusted: bool = True) -> bytes:
+        if trusted and self.trusted:
+            return orjson.dumps([self._to_dict(row) for row in rows])
+        return self._list_adapter.dump_json(
+            self._list_adapter.validate_python(list(rows), from_attributes=True)
+        )
+
+
+def json_response(
+    body: bytes, status_code: int = 200, headers: Optional[dict[str, str]] = None
+) -> Response:
+    """Wrap an already encoded JSON body, FastAPI does not encode it again."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type='application/json',
+    )